@@ -1,11 +1,16 @@
+import os
 from base64 import b64encode
 
 # This module is the initialization for the API package of the cs-cart API wrapper.
 # It sets up basic configurations and utilities needed by the API modules.
 
-# BASE_URL is the root URL for all CS-Cart API requests. This should be set to the
-# URL of the CS-Cart store that the API will interact with.
-BASE_URL = "https://shop.migoiq.app"
+# DEFAULT_BASE_URL is the URL of the CS-Cart store that the API interacts with.
+DEFAULT_BASE_URL = "https://shop.migoiq.app"
+
+# BASE_URL is the root URL for all CS-Cart API requests. Set CSCART_BASE_URL to
+# point the services somewhere else, e.g. at a local gateway
+# (python -m api.gateway) shared by every Streamlit session.
+BASE_URL = os.environ.get("CSCART_BASE_URL", DEFAULT_BASE_URL)
 
 
 def encode_credentials(email: str, api_key: str) -> str:
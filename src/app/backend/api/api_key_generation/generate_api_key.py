@@ -1,17 +1,35 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from urllib.parse import urljoin
 import requests
 import json
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - only needed by the async variants
+    httpx = None
+
 from api import BASE_URL, encode_credentials
+from api.codec import decode_response, dumps
+from api.transport import (
+    AsyncHTTPTransport,
+    HTTPTransport,
+    get_default_async_transport,
+    get_default_transport,
+)
 
 
 class APIKeyGeneratorService:
-    def __init__(self, admin_email: str, admin_api_key: str):
+    def __init__(
+        self,
+        admin_email: str,
+        admin_api_key: str,
+        transport: Optional[HTTPTransport] = None,
+    ):
         if not admin_email or not admin_api_key:
             raise ValueError("Admin email and API key must be set")
 
         self.credentials = encode_credentials(admin_email, admin_api_key)
+        self.transport = transport or get_default_transport()
         self.url = urljoin(BASE_URL, "/api/generateAPIKey")
 
     def generate_api_key(self, vendor_email: str) -> Dict:
@@ -19,10 +37,10 @@ class APIKeyGeneratorService:
             "Content-Type": "application/json",
             "Authorization": f"Basic {self.credentials}",
         }
-        data = json.dumps({"vendor_email": vendor_email})
+        data = dumps({"vendor_email": vendor_email})
 
         try:
-            response = requests.post(url=self.url, headers=headers, data=data)
+            response = self.transport.post(url=self.url, headers=headers, data=data)
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
             return {"Error": str(e)}
@@ -30,8 +48,48 @@ class APIKeyGeneratorService:
     def _handle_response(self, response: Any) -> Dict:
         try:
             response.raise_for_status()
-            json_response = response.json()
+            json_response = decode_response(response)
             return json_response
         except (requests.exceptions.HTTPError, json.JSONDecodeError) as e:
             print(f"Error: {e}")
             return {"Error": str(e)}
+
+
+class AsyncAPIKeyGeneratorService(APIKeyGeneratorService):
+    """
+    The asyncio variant of APIKeyGeneratorService, sending requests through a
+    shared AsyncHTTPTransport pool.
+    """
+
+    def __init__(
+        self,
+        admin_email: str,
+        admin_api_key: str,
+        transport: Optional[AsyncHTTPTransport] = None,
+    ):
+        super().__init__(admin_email, admin_api_key)
+        self.transport = transport or get_default_async_transport()
+
+    async def generate_api_key(self, vendor_email: str) -> Dict:
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Basic {self.credentials}",
+        }
+        data = dumps({"vendor_email": vendor_email})
+
+        try:
+            response = await self.transport.post(
+                url=self.url, headers=headers, data=data
+            )
+            return self._handle_response(response)
+        except httpx.HTTPError as e:
+            return {"Error": str(e)}
+
+    def _handle_response(self, response: Any) -> Dict:
+        try:
+            response.raise_for_status()
+            json_response = decode_response(response)
+            return json_response
+        except (httpx.HTTPStatusError, json.JSONDecodeError) as e:
+            print(f"Error: {e}")
+            return {"Error": str(e)}
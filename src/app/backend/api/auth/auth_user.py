@@ -1,9 +1,21 @@
 import json
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from urllib.parse import urljoin
 import requests
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - only needed by the async variants
+    httpx = None
+
 from api import BASE_URL, encode_credentials
+from api.codec import decode_response, dumps
+from api.transport import (
+    AsyncHTTPTransport,
+    HTTPTransport,
+    get_default_async_transport,
+    get_default_transport,
+)
 
 
 class AuthService:
@@ -11,11 +23,13 @@ class AuthService:
         self,
         admin_email: str,
         admin_api_key: str,
+        transport: Optional[HTTPTransport] = None,
     ):
         if not admin_email or not admin_api_key:
             raise ValueError("Admin email, API key and Session store must be set")
 
         self.credentials = encode_credentials(admin_email, admin_api_key)
+        self.transport = transport or get_default_transport()
         self.url = urljoin(BASE_URL, "/api/auth")
 
 
@@ -27,7 +41,7 @@ class AuthService:
         data = {"email": user_email}
 
         try:
-            response = requests.post(self.url, headers=headers, data=json.dumps(data))
+            response = self.transport.post(self.url, headers=headers, data=dumps(data))
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
             return {"Error": str(e)}
@@ -35,7 +49,7 @@ class AuthService:
     def _handle_response(self, response) -> Dict[str, Any]:
         if response.status_code in [200, 201]:
             try:
-                json_response = response.json()
+                json_response = decode_response(response)
                 # self.session_store.store_session_key(user_email, json_response["key"])
                 return {
                     "Session Key": json_response["key"],
@@ -47,3 +61,34 @@ class AuthService:
             raise ConnectionError(
                 f"Request failed with status code {response.status_code}"
             )
+
+
+class AsyncAuthService(AuthService):
+    """
+    The asyncio variant of AuthService, sending requests through a shared
+    AsyncHTTPTransport pool.
+    """
+
+    def __init__(
+        self,
+        admin_email: str,
+        admin_api_key: str,
+        transport: Optional[AsyncHTTPTransport] = None,
+    ):
+        super().__init__(admin_email, admin_api_key)
+        self.transport = transport or get_default_async_transport()
+
+    async def send_auth_request(self, user_email) -> Dict[str, Any]:
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Basic {self.credentials}",
+        }
+        data = {"email": user_email}
+
+        try:
+            response = await self.transport.post(
+                self.url, headers=headers, data=dumps(data)
+            )
+            return self._handle_response(response)
+        except httpx.HTTPError as e:
+            return {"Error": str(e)}
@@ -0,0 +1,3 @@
+from .response_cache import *
+from .conditional import *
+from .disk_cache import *
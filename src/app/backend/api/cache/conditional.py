@@ -0,0 +1,127 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from api.cache.response_cache import DEFAULT_MAX_ENTRIES, CachedResponse, endpoint_of
+
+
+class ValidatorCache:
+    """
+    Remembers the ETag/Last-Modified validators of GET responses so repeat
+    requests can be revalidated instead of re-downloaded.
+
+    Attach it to a transport (``HTTPTransport(validators=ValidatorCache())``).
+    Repeat GETs are then sent with ``If-None-Match``/``If-Modified-Since``; when
+    the store answers ``304 Not Modified`` the stored body is served instead.
+    Only the raw body is kept, as a CachedResponse; the services decode it
+    again on every 304, so each caller gets its own copy of the data and only
+    the download is saved.
+
+    Attributes:
+        max_entries (int): Maximum number of responses kept for revalidation.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initializes an empty validator store.
+
+        Args:
+            max_entries (int): Maximum number of responses kept for revalidation.
+
+        Raises:
+            ValueError: If max_entries is smaller than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, CachedResponse]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def prepare(
+        self, key: Tuple, headers: Optional[Dict]
+    ) -> Tuple[Optional[CachedResponse], Optional[Dict]]:
+        """
+        Adds conditional headers to a GET request whose response is stored.
+
+        Args:
+            key (Tuple): The cache key of the request.
+            headers (Optional[Dict]): The request headers.
+
+        Returns:
+            Tuple[Optional[CachedResponse], Optional[Dict]]: The stored response
+            (None if there is none) and the headers to send.
+        """
+        with self._lock:
+            stored = self._entries.get(key)
+        if stored is None:
+            return None, headers
+
+        conditional = dict(headers or {})
+        if "ETag" in stored.headers:
+            conditional["If-None-Match"] = stored.headers["ETag"]
+        if "Last-Modified" in stored.headers:
+            conditional["If-Modified-Since"] = stored.headers["Last-Modified"]
+        return stored, conditional
+
+    def resolve(
+        self, key: Tuple, stored: Optional[CachedResponse], response: Any
+    ) -> Any:
+        """
+        Serves the stored body on a 304, or stores a fresh response carrying
+        validators.
+
+        Args:
+            key (Tuple): The cache key of the request.
+            stored (Optional[CachedResponse]): The response returned by prepare.
+            response (Any): The response received from the store.
+
+        Returns:
+            Any: The response to hand to the caller.
+        """
+        endpoint = endpoint_of(key[0])
+        if response.status_code == 304 and stored is not None:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                self._count(endpoint, "revalidated")
+                self._stats[endpoint]["bytes_saved"] += len(stored.content)
+            return stored
+
+        if not 200 <= response.status_code < 300:
+            return response
+        if "ETag" not in response.headers and "Last-Modified" not in response.headers:
+            return response
+
+        cached = CachedResponse.from_response(response)
+        with self._lock:
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._count(endpoint, "stored")
+        return cached
+
+    def _count(self, endpoint: str, counter: str) -> None:
+        stats = self._stats.setdefault(
+            endpoint, {"stored": 0, "revalidated": 0, "bytes_saved": 0}
+        )
+        stats[counter] += 1
+
+    def clear(self) -> None:
+        """
+        Forgets every stored response; the counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns stored, revalidated (304) and bytes-saved counters per endpoint.
+        """
+        with self._lock:
+            return {endpoint: dict(stats) for endpoint, stats in self._stats.items()}
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,283 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from api.cache.response_cache import (
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_RELATED,
+    DEFAULT_TTLS,
+    CachedResponse,
+    endpoint_of,
+    invalidated_by,
+)
+from api.codec import dumps, loads
+
+# Upper bound on the compressed payload bytes kept on disk.
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    size INTEGER NOT NULL,
+    status_code INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    headers BLOB NOT NULL,
+    content BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_endpoint ON responses (endpoint);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+"""
+
+
+def _digest(key: Tuple) -> str:
+    # Keys hold the Authorization header; only a hash of them is written
+    return hashlib.sha256("\n".join(key).encode()).hexdigest()
+
+
+class DiskResponseCache:
+    """
+    A persistent GET response cache in a SQLite file, with the same interface
+    as ResponseCache.
+
+    Entries survive process restarts and can be shared by every replica that
+    mounts the same file, so a restarted Streamlit container serves warm data
+    right away. Payloads are stored zlib-compressed, expiry uses wall-clock
+    time, and the least recently used entries are evicted once either
+    ``max_entries`` or ``max_bytes`` is exceeded. Hit/miss counters are kept
+    per process.
+
+    Attach it like ResponseCache
+    (``HTTPTransport(cache=DiskResponseCache("cache.db"))``), or set the
+    CSCART_CACHE_PATH environment variable to give it to the shared transport.
+
+    Attributes:
+        path (str): The SQLite database file.
+        max_entries (int): Maximum number of responses kept.
+        max_bytes (int): Maximum compressed payload bytes kept.
+        default_ttl (float): TTL in seconds for endpoints without their own TTL.
+            0 means such endpoints are not cached.
+        ttls (Dict[str, float]): TTLs keyed by collection path.
+        compress_level (int): zlib level used for payloads; 0 stores them as is.
+        related (Dict[str, Sequence[str]]): Collections also invalidated by a
+            write, keyed by the collection written to.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        default_ttl: float = 0,
+        ttls: Optional[Dict[str, float]] = None,
+        compress_level: int = 1,
+        related: Optional[Dict[str, Sequence[str]]] = None,
+    ):
+        """
+        Opens (and if needed creates) the cache file.
+
+        Args:
+            path (str): The SQLite database file.
+            max_entries (int): Maximum number of responses kept.
+            max_bytes (int): Maximum compressed payload bytes kept.
+            default_ttl (float): TTL in seconds for endpoints not listed in ttls.
+            ttls (Optional[Dict[str, float]]): TTLs keyed by collection path.
+                Defaults to DEFAULT_TTLS.
+            compress_level (int): zlib level used for payloads, 0 to 9.
+            related (Optional[Dict[str, Sequence[str]]]): Collections also
+                invalidated by a write, keyed by the collection written to.
+                Defaults to DEFAULT_RELATED.
+
+        Raises:
+            ValueError: If max_entries or max_bytes is smaller than 1.
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be at least 1")
+
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.related = dict(DEFAULT_RELATED if related is None else related)
+        self.compress_level = compress_level
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock:
+            # WAL lets replicas sharing the file read while one of them writes
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            with self._connection:
+                self._connection.executescript(_SCHEMA)
+
+    def ttl_for(self, url: str) -> float:
+        """
+        Returns the TTL in seconds that applies to a URL.
+        """
+        return self.ttls.get(endpoint_of(url), self.default_ttl)
+
+    def _count(self, endpoint: str, counter: str, amount: int = 1) -> None:
+        stats = self._stats.setdefault(
+            endpoint, {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        )
+        stats[counter] += amount
+
+    def get(self, key: Tuple) -> Optional[CachedResponse]:
+        """
+        Returns the cached response for a key, or None on a miss or expiry.
+        """
+        endpoint = endpoint_of(key[0])
+        digest = _digest(key)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires_at, status_code, url, headers, content "
+                "FROM responses WHERE key = ?",
+                (digest,),
+            ).fetchone()
+            if row is None or row[0] < now:
+                if row is not None:
+                    with self._connection:
+                        self._connection.execute(
+                            "DELETE FROM responses WHERE key = ?", (digest,)
+                        )
+                self._count(endpoint, "misses")
+                return None
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE responses SET last_used = ? WHERE key = ?", (now, digest)
+                )
+            self._count(endpoint, "hits")
+        _, status_code, url, headers, content = row
+        if self.compress_level:
+            content = zlib.decompress(content)
+        return CachedResponse(status_code, loads(headers), content, url)
+
+    def set(self, key: Tuple, response: Any) -> None:
+        """
+        Stores a successful response if its endpoint has a positive TTL,
+        evicting the least recently used entries beyond the size caps.
+        """
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0 or not 200 <= response.status_code < 300:
+            return
+        cached = CachedResponse.from_response(response)
+        content = cached.content
+        if self.compress_level:
+            content = zlib.compress(content, self.compress_level)
+        headers = dumps(dict(cached.headers))
+        now = time.time()
+        with self._lock:
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, endpoint, expires_at, "
+                    "last_used, size, status_code, url, headers, content) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        _digest(key),
+                        endpoint_of(key[0]),
+                        now + ttl,
+                        now,
+                        len(content) + len(headers),
+                        cached.status_code,
+                        cached.url,
+                        headers,
+                        content,
+                    ),
+                )
+                self._evict()
+
+    def _evict(self) -> None:
+        # Drops the least recently used entries until both caps are met;
+        # called with the lock held and inside a transaction
+        entries, size = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if entries <= self.max_entries and size <= self.max_bytes:
+            return
+        evicted = []
+        for key, endpoint, entry_size in self._connection.execute(
+            "SELECT key, endpoint, size FROM responses ORDER BY last_used"
+        ):
+            if entries <= self.max_entries and size <= self.max_bytes:
+                break
+            evicted.append((key,))
+            entries -= 1
+            size -= entry_size
+            self._count(endpoint, "evictions")
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def invalidate(self, url: str) -> None:
+        """
+        Evicts every entry belonging to the collection a URL was written to,
+        or to a collection related to it.
+        """
+        with self._lock:
+            for endpoint in invalidated_by(url, self.related):
+                with self._connection:
+                    deleted = self._connection.execute(
+                        "DELETE FROM responses WHERE endpoint = ?", (endpoint,)
+                    ).rowcount
+                if deleted:
+                    self._count(endpoint, "invalidations", deleted)
+
+    def clear(self) -> None:
+        """
+        Evicts every entry; the counters are kept.
+        """
+        with self._lock:
+            with self._connection:
+                self._connection.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns hit, miss, eviction and invalidation counters per endpoint.
+        """
+        with self._lock:
+            return {endpoint: dict(stats) for endpoint, stats in self._stats.items()}
+
+    def size(self) -> int:
+        """
+        Returns the compressed payload bytes currently stored.
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return row[0]
+
+
+def disk_cache_from_env() -> Optional[DiskResponseCache]:
+    """
+    Builds the DiskResponseCache configured by the environment, if any.
+
+    CSCART_CACHE_PATH names the cache file; CSCART_CACHE_TTL optionally sets
+    the TTL in seconds for endpoints without their own (default 0).
+
+    Returns:
+        Optional[DiskResponseCache]: The cache, or None if
+        CSCART_CACHE_PATH is not set.
+    """
+    path = os.environ.get("CSCART_CACHE_PATH")
+    if not path:
+        return None
+    return DiskResponseCache(
+        path, default_ttl=float(os.environ.get("CSCART_CACHE_TTL", "0"))
+    )
@@ -0,0 +1,358 @@
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from requests.structures import CaseInsensitiveDict
+
+from api.codec import loads
+
+# Suggested TTLs (in seconds) for CS-Cart reference data that rarely changes.
+DEFAULT_TTLS: Dict[str, float] = {
+    "/api/features/": 300,
+    "/api/product_variations_groups/": 300,
+    "/api/usergroups/": 300,
+    "/api/shippings/": 300,
+}
+
+# Collections whose cached reads go stale when another collection is written
+# to, e.g. generating variations under /api/products/ changes the groups.
+DEFAULT_RELATED: Dict[str, Tuple[str, ...]] = {
+    "/api/products/": ("/api/product_variations_groups/",),
+    "/api/product_variations_groups/": ("/api/products/",),
+}
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# Payloads smaller than this are stored as is even when compression is on;
+# compressing them saves little and still costs CPU on every hit.
+DEFAULT_MIN_COMPRESS_SIZE = 1024
+
+# lz4 is optional: it compresses a little worse than zlib but several times
+# faster.
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - depends on the installed extras
+    lz4_frame = None
+
+# Payload codecs by name: (compress, decompress).
+COMPRESSORS: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "zlib": (lambda data: zlib.compress(data, 1), zlib.decompress),
+}
+if lz4_frame is not None:
+    COMPRESSORS["lz4"] = (lz4_frame.compress, lz4_frame.decompress)
+
+
+class CachedResponse:
+    """
+    A lightweight, immutable stand-in for an HTTP response served from a cache.
+
+    It exposes the parts of the response interface used by the services'
+    ``_handle_response`` methods, so a cache hit is handled exactly like a
+    fresh response. The services decode ``content`` through api.codec, so
+    every hit returns a fresh copy of the data; ``json()`` memoizes its result
+    and callers using it must treat the data as read-only.
+    """
+
+    __slots__ = ("status_code", "headers", "content", "url", "_json")
+
+    def __init__(self, status_code: int, headers: Dict, content: bytes, url: str):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.url = url
+        self._json: Any = None
+
+    @classmethod
+    def from_response(cls, response: Any) -> "CachedResponse":
+        if isinstance(response, cls):
+            return response
+        return cls(
+            response.status_code,
+            dict(response.headers),
+            response.content,
+            str(response.url),
+        )
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def json(self) -> Any:
+        if self._json is None:
+            self._json = loads(self.content)
+        return self._json
+
+    def raise_for_status(self) -> None:
+        # Only successful responses are ever cached
+        return None
+
+
+def endpoint_of(url: str) -> str:
+    """
+    Returns the collection path a URL belongs to, e.g. '/api/products/' for
+    'https://shop/api/products/12/options'.
+
+    Args:
+        url (str): A request URL.
+
+    Returns:
+        str: The collection path, used for TTLs, stats and invalidation.
+    """
+    segments = [s for s in urlsplit(url).path.split("/") if s]
+    return "/" + "/".join(segments[:2]) + "/"
+
+
+def invalidated_by(url: str, related: Dict[str, Sequence[str]]) -> Tuple[str, ...]:
+    """
+    Returns the collection paths whose cached entries a write to a URL makes
+    stale: its own collection and the ones related to it.
+
+    Args:
+        url (str): The URL written to.
+        related (Dict[str, Sequence[str]]): Related collection paths keyed by
+            collection path, e.g. DEFAULT_RELATED.
+
+    Returns:
+        Tuple[str, ...]: The collection paths to invalidate.
+    """
+    endpoint = endpoint_of(url)
+    return (endpoint,) + tuple(related.get(endpoint, ()))
+
+
+def cache_key(url: str, params: Optional[Dict], headers: Optional[Dict]) -> Tuple:
+    """
+    Builds the cache key of a GET request from its URL, query parameters and
+    credentials, so two users never share an entry.
+
+    Args:
+        url (str): The request URL.
+        params (Optional[Dict]): Query parameters of the request.
+        headers (Optional[Dict]): Request headers; only Authorization is used.
+
+    Returns:
+        Tuple: A hashable cache key.
+    """
+    query = urlencode(sorted((params or {}).items()), doseq=True)
+    authorization = (headers or {}).get("Authorization", "")
+    return (url, query, authorization)
+
+
+class ResponseCache:
+    """
+    An in-process, size-bounded LRU cache for GET responses with per-endpoint
+    TTLs and hit/miss counters.
+
+    Attach it to a transport (``HTTPTransport(cache=ResponseCache(...))``) to
+    serve repeated GETs from memory. Any POST, PUT or DELETE sent through the
+    same transport evicts the cached entries of the affected collection, and
+    of the collections ``related`` declares it changes too.
+
+    With ``compression`` set, payloads are stored compressed and only
+    decompressed when they are hit, trading some CPU per hit for holding
+    several times more pages in the same memory; ``compression_stats`` reports
+    both sides per endpoint.
+
+    Attributes:
+        max_entries (int): Maximum number of responses kept.
+        default_ttl (float): TTL in seconds for endpoints without their own TTL.
+            0 means such endpoints are not cached.
+        ttls (Dict[str, float]): TTLs keyed by collection path.
+        compression (Optional[str]): Payload codec, 'zlib' or 'lz4', or None.
+        min_compress_size (int): Payloads smaller than this are not compressed.
+        related (Dict[str, Sequence[str]]): Collections also invalidated by a
+            write, keyed by the collection written to.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        default_ttl: float = 0,
+        ttls: Optional[Dict[str, float]] = None,
+        compression: Optional[str] = None,
+        min_compress_size: int = DEFAULT_MIN_COMPRESS_SIZE,
+        related: Optional[Dict[str, Sequence[str]]] = None,
+    ):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of responses kept.
+            default_ttl (float): TTL in seconds for endpoints not listed in ttls.
+            ttls (Optional[Dict[str, float]]): TTLs keyed by collection path,
+                e.g. {'/api/features/': 3600}. Defaults to DEFAULT_TTLS.
+            compression (Optional[str]): Store payloads compressed with this
+                codec, 'zlib' or 'lz4' (if installed).
+            min_compress_size (int): Payloads smaller than this are not
+                compressed.
+            related (Optional[Dict[str, Sequence[str]]]): Collections also
+                invalidated by a write, keyed by the collection written to.
+                Defaults to DEFAULT_RELATED.
+
+        Raises:
+            ValueError: If max_entries is smaller than 1 or the compression
+                codec is not available.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if compression is not None and compression not in COMPRESSORS:
+            raise ValueError(f"Unsupported compression codec: {compression}")
+
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.related = dict(DEFAULT_RELATED if related is None else related)
+        self.compression = compression
+        self.min_compress_size = min_compress_size
+        # key -> (expires_at, endpoint, response, raw_size, codec); with a
+        # codec, the response holds the compressed payload as its content
+        self._entries: "OrderedDict[Tuple, Tuple]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._cpu: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def ttl_for(self, url: str) -> float:
+        """
+        Returns the TTL in seconds that applies to a URL.
+        """
+        return self.ttls.get(endpoint_of(url), self.default_ttl)
+
+    def _count(self, endpoint: str, counter: str) -> None:
+        stats = self._stats.setdefault(
+            endpoint, {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        )
+        stats[counter] += 1
+
+    def get(self, key: Tuple) -> Optional[CachedResponse]:
+        """
+        Returns the cached response for a key, or None on a miss or expiry.
+        """
+        endpoint = endpoint_of(key[0])
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._count(endpoint, "misses")
+                return None
+            self._entries.move_to_end(key)
+            self._count(endpoint, "hits")
+        _, _, cached, _, codec = entry
+        return cached if codec is None else self._decompress(endpoint, cached, codec)
+
+    def set(self, key: Tuple, response: Any) -> None:
+        """
+        Stores a successful response if its endpoint has a positive TTL,
+        evicting the least recently used entries beyond max_entries.
+        """
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0 or not 200 <= response.status_code < 300:
+            return
+        cached = CachedResponse.from_response(response)
+        endpoint = endpoint_of(key[0])
+        raw_size = len(cached.content)
+        codec = self.compression if raw_size >= self.min_compress_size else None
+        if codec is not None:
+            cached = self._compress(endpoint, cached, codec)
+        entry = (time.monotonic() + ttl, endpoint, cached, raw_size, codec)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._count(evicted[1], "evictions")
+
+    def _compress(
+        self, endpoint: str, cached: CachedResponse, codec: str
+    ) -> CachedResponse:
+        compress, _ = COMPRESSORS[codec]
+        start = time.perf_counter()
+        payload = compress(cached.content)
+        self._time(endpoint, "compress_seconds", time.perf_counter() - start)
+        return CachedResponse(cached.status_code, cached.headers, payload, cached.url)
+
+    def _decompress(
+        self, endpoint: str, cached: CachedResponse, codec: str
+    ) -> CachedResponse:
+        # Every hit gets its own decompressed copy; the stored entry stays small
+        _, decompress = COMPRESSORS[codec]
+        start = time.perf_counter()
+        payload = decompress(cached.content)
+        self._time(endpoint, "decompress_seconds", time.perf_counter() - start)
+        return CachedResponse(cached.status_code, cached.headers, payload, cached.url)
+
+    def _time(self, endpoint: str, counter: str, seconds: float) -> None:
+        with self._lock:
+            cpu = self._cpu.setdefault(
+                endpoint, {"compress_seconds": 0.0, "decompress_seconds": 0.0}
+            )
+            cpu[counter] += seconds
+
+    def invalidate(self, url: str) -> None:
+        """
+        Evicts every entry belonging to the collection a URL was written to,
+        or to a collection related to it.
+        """
+        endpoints = invalidated_by(url, self.related)
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry[1] in endpoints:
+                    del self._entries[key]
+                    self._count(entry[1], "invalidations")
+
+    def clear(self) -> None:
+        """
+        Evicts every entry; the counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns hit, miss, eviction and invalidation counters per endpoint.
+        """
+        with self._lock:
+            return {endpoint: dict(stats) for endpoint, stats in self._stats.items()}
+
+    def compression_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the memory footprint and compression CPU cost per endpoint.
+
+        Returns:
+            Dict[str, Dict[str, float]]: For every endpoint, the entries held,
+            their 'raw_bytes' and 'stored_bytes', the 'ratio' between the two,
+            and the total 'compress_seconds' and 'decompress_seconds' spent.
+        """
+        with self._lock:
+            report: Dict[str, Dict[str, float]] = {}
+            for _, endpoint, cached, raw_size, _ in self._entries.values():
+                stats = report.setdefault(
+                    endpoint, {"entries": 0, "raw_bytes": 0, "stored_bytes": 0}
+                )
+                stats["entries"] += 1
+                stats["raw_bytes"] += raw_size
+                stats["stored_bytes"] += len(cached.content)
+            for endpoint in set(report) | set(self._cpu):
+                stats = report.setdefault(
+                    endpoint, {"entries": 0, "raw_bytes": 0, "stored_bytes": 0}
+                )
+                stats["ratio"] = (
+                    stats["raw_bytes"] / stats["stored_bytes"]
+                    if stats["stored_bytes"]
+                    else 1.0
+                )
+                stats.update(
+                    self._cpu.get(
+                        endpoint, {"compress_seconds": 0.0, "decompress_seconds": 0.0}
+                    )
+                )
+            return report
+
+    def __len__(self) -> int:
+        return len(self._entries)
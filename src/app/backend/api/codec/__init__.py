@@ -0,0 +1,2 @@
+from .json_codec import *
+from .stream import *
@@ -0,0 +1,99 @@
+import json
+from typing import Any
+
+# The fastest JSON library available is picked once, at import time:
+# orjson, then ujson, then the standard library.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    ujson = None
+
+# Errors raised by loads() are always json.JSONDecodeError (orjson's error is a
+# subclass of it), so the services' existing except clauses keep working.
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+    JSON_BACKEND = "orjson"
+elif ujson is not None:
+    JSON_BACKEND = "ujson"
+else:
+    JSON_BACKEND = "json"
+
+
+def loads(data: Any) -> Any:
+    """
+    Decodes a JSON document straight from the raw response bytes, without
+    decoding them to an intermediate str first.
+
+    Args:
+        data (Any): The JSON document as bytes, bytearray or str.
+
+    Returns:
+        Any: The decoded document.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        try:
+            return ujson.loads(data)
+        except ValueError as e:
+            raise JSONDecodeError(str(e), "", 0) from e
+    return json.loads(data)
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Encodes obj as a compact UTF-8 JSON document, ready to be sent as a
+    request body.
+
+    Args:
+        obj (Any): The payload to encode.
+        sort_keys (bool): Sort object keys, so equal dicts encode to the same
+            bytes whatever their insertion order.
+
+    Returns:
+        bytes: The encoded document.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    if ujson is not None:
+        return ujson.dumps(obj, ensure_ascii=False, sort_keys=sort_keys).encode(
+            "utf-8"
+        )
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys
+    ).encode("utf-8")
+
+
+def decode_response(response: Any) -> Any:
+    """
+    Decodes the JSON body of a requests/httpx response or a CachedResponse
+    with the selected backend.
+
+    Args:
+        response (Any): The response to decode.
+
+    Returns:
+        Any: The decoded body, or None for a 204 No Content response.
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON.
+    """
+    if getattr(response, "status_code", None) == 204:
+        return None
+    content = getattr(response, "content", None)
+    if not isinstance(content, (bytes, bytearray)):
+        # Stand-ins without a raw body decode themselves
+        return response.json()
+    return loads(content)
@@ -0,0 +1,278 @@
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List
+
+from api.codec.json_codec import JSONDecodeError, dumps, loads
+
+# Bytes that change the parser's state; everything in between is skipped in
+# one regex search instead of byte by byte.
+_STRUCTURAL = re.compile(rb'[\[\]{}",:]')
+_WHITESPACE = b" \t\r\n"
+
+# Everything up to the next bracket outside a string: runs of other bytes and
+# complete strings (written unrolled so an unterminated string fails in
+# linear time).
+_RECORD_BODY = re.compile(rb'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+
+# Consumed input is dropped from the buffer once it grows past this size.
+_COMPACT_THRESHOLD = 64 * 1024
+
+# Body read size used by the stream_* methods.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_SEEK, _VALUE, _ITEMS, _DONE = range(4)
+
+
+class ArrayItemParser:
+    """
+    An incremental parser that extracts the records of one top-level key of a
+    JSON response, e.g. the 'products' of a CS-Cart list page, as the body
+    arrives.
+
+    Bytes are fed in arbitrary chunks; every record that is complete is
+    decoded on its own with api.codec and returned, so only the record being
+    received is held in memory rather than the whole page. Records given as an
+    object keyed by ID (``{"12": {...}}``) are returned like array items.
+
+    Example::
+
+        parser = ArrayItemParser("products")
+        for chunk in response.iter_content(65536):
+            for product in parser.feed(chunk):
+                ...
+        parser.close()
+    """
+
+    def __init__(self, key: str):
+        """
+        Initializes the parser.
+
+        Args:
+            key (str): The top-level key holding the records, e.g. 'orders'.
+        """
+        self.key = key
+        self._target = dumps(key)
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._state = _SEEK
+        self._item_depth = 0
+        self._item_start = -1
+        self._in_record = False
+        self._awaiting_item = False
+        self._keyed = False
+        self._last_key = b""
+        self._after_key = False
+
+    @property
+    def done(self) -> bool:
+        """
+        True once the records' array (or object) has been closed.
+        """
+        return self._state == _DONE
+
+    def feed(self, data: bytes) -> List[Any]:
+        """
+        Adds a chunk of the response body.
+
+        Args:
+            data (bytes): The next bytes of the body.
+
+        Returns:
+            List[Any]: The records completed by this chunk, in order.
+
+        Raises:
+            json.JSONDecodeError: If a record is not valid JSON.
+        """
+        if self._state == _DONE:
+            return []
+        self._buffer += data
+        items: List[Any] = []
+        self._scan(items)
+        self._compact()
+        return items
+
+    def close(self) -> None:
+        """
+        Signals the end of the body.
+
+        Raises:
+            json.JSONDecodeError: If the body ended inside the records.
+        """
+        if self._state in (_VALUE, _ITEMS):
+            raise JSONDecodeError(
+                f"Response ended before the '{self.key}' records were closed",
+                "",
+                len(self._buffer),
+            )
+
+    def _scan(self, items: List[Any]) -> None:
+        buffer = self._buffer
+        while self._state != _DONE:
+            if self._in_record:
+                if not self._skip_record(items):
+                    return
+                continue
+
+            match = _STRUCTURAL.search(buffer, self._pos)
+            if match is None:
+                return
+            index = match.start()
+            char = buffer[index]
+
+            if char == 0x22:  # '"'
+                end = self._string_end(index)
+                if end < 0:
+                    # Incomplete string: rescan it once more bytes arrive
+                    self._pos = index
+                    return
+                if self._state == _SEEK and self._depth == 1:
+                    self._last_key = bytes(buffer[index : end + 1])
+                    self._after_key = True
+                elif self._awaiting_item and self._depth == self._item_depth:
+                    self._begin_item(index)
+                self._pos = end + 1
+                continue
+
+            after_key, self._after_key = self._after_key, False
+            if self._state == _VALUE:
+                if char in (0x5B, 0x7B) and not buffer[self._pos : index].strip(
+                    _WHITESPACE
+                ):
+                    # '[' or '{' opening the records
+                    self._depth += 1
+                    self._item_depth = self._depth
+                    self._keyed = char == 0x7B
+                    self._awaiting_item = not self._keyed
+                    self._state = _ITEMS
+                    self._pos = index + 1
+                else:
+                    # null or a scalar: there are no records
+                    self._state = _DONE
+                continue
+
+            if self._state == _ITEMS and self._depth == self._item_depth:
+                if self._awaiting_item:
+                    if char in (0x5B, 0x7B):
+                        # An object or array record: skip to its end in one go
+                        self._begin_item(index)
+                        self._in_record = True
+                        self._depth += 1
+                        self._pos = index + 1
+                        continue
+                    self._begin_item(self._first_non_space(self._pos, index))
+                if char in (0x2C, 0x5D, 0x7D):  # ',', ']', '}'
+                    if self._item_start >= 0:
+                        item = bytes(buffer[self._item_start : index]).strip(
+                            _WHITESPACE
+                        )
+                        if item:
+                            items.append(loads(item))
+                        self._item_start = -1
+                    self._awaiting_item = char == 0x2C and not self._keyed
+                elif char == 0x3A and self._keyed:  # ':' before a keyed record
+                    self._awaiting_item = True
+                    self._pos = index + 1
+                    continue
+
+            if char in (0x5B, 0x7B):
+                self._depth += 1
+            elif char in (0x5D, 0x7D):
+                self._depth -= 1
+                if self._state == _ITEMS and self._depth < self._item_depth:
+                    self._state = _DONE
+            elif char == 0x3A and self._state == _SEEK and after_key:
+                if self._last_key == self._target:
+                    self._state = _VALUE
+            self._pos = index + 1
+
+    def _skip_record(self, items: List[Any]) -> bool:
+        # Jumps from bracket to bracket of an object/array record, letting the
+        # regex engine skip strings and scalars; returns False if the record
+        # has not been received completely yet
+        buffer = self._buffer
+        while True:
+            end = _RECORD_BODY.match(buffer, self._pos).end()
+            if end >= len(buffer) or buffer[end] == 0x22:
+                # Out of data, or inside a string that is still arriving
+                self._pos = end
+                return False
+            self._depth += 1 if buffer[end] in (0x5B, 0x7B) else -1
+            self._pos = end + 1
+            if self._depth == self._item_depth:
+                items.append(loads(bytes(buffer[self._item_start : self._pos])))
+                self._item_start = -1
+                self._in_record = False
+                return True
+
+    def _begin_item(self, index: int) -> None:
+        self._item_start = index
+        self._awaiting_item = False
+
+    def _first_non_space(self, start: int, end: int) -> int:
+        for index in range(start, end):
+            if self._buffer[index] not in _WHITESPACE:
+                return index
+        return end
+
+    def _string_end(self, start: int) -> int:
+        # Returns the index of the quote closing the string opened at start,
+        # skipping escaped quotes, or -1 if it has not arrived yet
+        buffer = self._buffer
+        index = start
+        while True:
+            index = buffer.find(b'"', index + 1)
+            if index < 0:
+                return -1
+            backslashes = 0
+            while buffer[index - 1 - backslashes] == 0x5C:
+                backslashes += 1
+            if backslashes % 2 == 0:
+                return index
+
+    def _compact(self) -> None:
+        # Drops consumed bytes, keeping any record still being received
+        keep = self._item_start if self._item_start >= 0 else self._pos
+        if keep > _COMPACT_THRESHOLD or self._state == _DONE:
+            del self._buffer[:keep]
+            self._pos -= keep
+            if self._item_start >= 0:
+                self._item_start -= keep
+
+
+def iter_array_items(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Yields the records under ``key`` of a JSON body received in chunks.
+
+    Reading stops as soon as the records have been closed, so trailing data
+    such as ``params`` is never buffered.
+
+    Args:
+        chunks (Iterable[bytes]): The body, e.g. ``response.iter_content(65536)``.
+        key (str): The top-level key holding the records, e.g. 'products'.
+
+    Yields:
+        Any: One decoded record at a time.
+
+    Raises:
+        json.JSONDecodeError: If the body is malformed or truncated.
+    """
+    parser = ArrayItemParser(key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            return
+    parser.close()
+
+
+async def aiter_array_items(chunks: AsyncIterable[bytes], key: str) -> AsyncIterator[Any]:
+    """
+    The asyncio counterpart of iter_array_items, e.g. for
+    ``response.aiter_bytes()`` of a streamed httpx response.
+    """
+    parser = ArrayItemParser(key)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+        if parser.done:
+            return
+    parser.close()
@@ -0,0 +1,336 @@
+import math
+from array import array
+from typing import Any, AsyncIterable, Dict, Iterable, Optional
+
+# numpy, pandas and pyarrow are optional: they are only needed to materialize
+# the columns, not to build them.
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the installed extras
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - depends on the installed extras
+    pd = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - depends on the installed extras
+    pa = None
+
+# Column kinds: 'int' and 'float' become numeric arrays, 'datetime' turns Unix
+# timestamps into datetime64, 'category' stores low-cardinality strings as
+# integer codes and 'str' keeps plain Python strings.
+ORDER_COLUMNS: Dict[str, str] = {
+    "order_id": "int",
+    "parent_order_id": "int",
+    "user_id": "int",
+    "company_id": "int",
+    "company": "category",
+    "status": "category",
+    "timestamp": "datetime",
+    "total": "float",
+    "subtotal": "float",
+    "firstname": "str",
+    "lastname": "str",
+    "email": "str",
+    "phone": "str",
+}
+
+PRODUCT_COLUMNS: Dict[str, str] = {
+    "product_id": "int",
+    "product": "str",
+    "product_code": "str",
+    "company_id": "int",
+    "company_name": "category",
+    "status": "category",
+    "price": "float",
+    "list_price": "float",
+    "amount": "int",
+    "main_category": "int",
+    "timestamp": "datetime",
+    "updated_timestamp": "datetime",
+}
+
+USER_COLUMNS: Dict[str, str] = {
+    "user_id": "int",
+    "user_type": "category",
+    "status": "category",
+    "firstname": "str",
+    "lastname": "str",
+    "email": "str",
+    "phone": "str",
+    "company_id": "int",
+    "company": "category",
+    "lang_code": "category",
+    "timestamp": "datetime",
+}
+
+STORE_COLUMNS: Dict[str, str] = {
+    "company_id": "int",
+    "company": "str",
+    "storefront": "str",
+    "secure_storefront": "str",
+    "status": "category",
+    "email": "str",
+}
+
+VENDOR_COLUMNS: Dict[str, str] = {
+    "company_id": "int",
+    "company": "str",
+    "status": "category",
+    "email": "str",
+    "phone": "str",
+    "lang_code": "category",
+    "timestamp": "datetime",
+}
+
+
+class _Column:
+    # Accumulates the values of one column in a compact typed buffer
+
+    __slots__ = ("kind", "values", "mask", "categories")
+
+    def __init__(self, kind: str, backfill: int = 0):
+        self.kind = kind
+        self.mask = bytearray()
+        self.categories: Optional[Dict[str, int]] = None
+        if kind == "float":
+            self.values: Any = array("d")
+        elif kind in ("int", "datetime"):
+            self.values = array("q")
+        elif kind == "category":
+            self.values = array("i")
+            self.categories = {}
+        else:
+            self.values = []
+        for _ in range(backfill):
+            self.append(None)
+
+    def append(self, value: Any) -> None:
+        kind = self.kind
+        if kind == "float":
+            try:
+                self.values.append(float(value))
+            except (TypeError, ValueError):
+                self.values.append(math.nan)
+        elif kind in ("int", "datetime"):
+            try:
+                number = int(value)
+            except (TypeError, ValueError):
+                try:
+                    number = int(float(value))
+                except (TypeError, ValueError, OverflowError):
+                    number = None
+            if number is None:
+                self.values.append(0)
+                self.mask.append(1)
+            else:
+                self.values.append(number)
+                self.mask.append(0)
+        elif kind == "category":
+            if value is None or value == "":
+                self.values.append(-1)
+            else:
+                categories = self.categories
+                code = categories.get(value)
+                if code is None:
+                    code = categories[value] = len(categories)
+                self.values.append(code)
+        else:
+            self.values.append(value)
+
+    def has_missing(self) -> bool:
+        return 1 in self.mask
+
+
+class ColumnarBuilder:
+    """
+    Builds typed columns from CS-Cart records one record at a time, without
+    ever holding the records themselves.
+
+    Feed it any iterable of record dicts, typically a service's ``iter_*``
+    generator, which keeps only one page of dicts alive. Numeric fields land in
+    ``array`` buffers that numpy wraps without copying, low-cardinality strings
+    are dictionary-encoded as they arrive, and Unix timestamps become
+    datetime64 when the columns are materialized with ``to_frame`` (pandas) or
+    ``to_arrow`` (pyarrow).
+
+    Attributes:
+        schema (Dict[str, str]): Column kinds keyed by field name.
+        include_extra (bool): Whether fields outside the schema are kept as
+            object columns.
+    """
+
+    def __init__(self, schema: Dict[str, str], include_extra: bool = True):
+        """
+        Initializes an empty builder.
+
+        Args:
+            schema (Dict[str, str]): Column kinds keyed by field name, e.g.
+                ORDER_COLUMNS.
+            include_extra (bool): Keep scalar fields outside the schema as
+                object columns; nested objects and lists are always dropped.
+        """
+        self.schema = dict(schema)
+        self.include_extra = include_extra
+        self._columns: Dict[str, _Column] = {
+            name: _Column(kind) for name, kind in self.schema.items()
+        }
+        self._rows = 0
+
+    def append(self, record: Dict) -> None:
+        """
+        Adds one record.
+        """
+        columns = self._columns
+        for name, column in columns.items():
+            column.append(record.get(name))
+        if self.include_extra:
+            for name, value in record.items():
+                if name not in columns and not isinstance(value, (dict, list)):
+                    column = columns[name] = _Column("object", backfill=self._rows)
+                    column.append(value)
+        self._rows += 1
+
+    def extend(self, records: Iterable[Dict]) -> "ColumnarBuilder":
+        """
+        Adds every record of an iterable, consuming it lazily.
+
+        Returns:
+            ColumnarBuilder: The builder itself, for chaining.
+        """
+        for record in records:
+            self.append(record)
+        return self
+
+    async def aextend(self, records: AsyncIterable[Dict]) -> "ColumnarBuilder":
+        """
+        The asyncio counterpart of extend, e.g. for an async ``iter_*`` method.
+
+        Returns:
+            ColumnarBuilder: The builder itself, for chaining.
+        """
+        async for record in records:
+            self.append(record)
+        return self
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def to_frame(self) -> "pd.DataFrame":
+        """
+        Materializes the columns as a pandas DataFrame.
+
+        Returns:
+            pd.DataFrame: One typed column per field.
+
+        Raises:
+            ImportError: If numpy or pandas is not installed.
+        """
+        if np is None or pd is None:
+            raise ImportError("numpy and pandas must be installed to build DataFrames")
+        return pd.DataFrame(
+            {name: self._to_pandas(column) for name, column in self._columns.items()}
+        )
+
+    def to_arrow(self) -> "pa.Table":
+        """
+        Materializes the columns as a pyarrow Table.
+
+        Returns:
+            pa.Table: One typed column per field.
+
+        Raises:
+            ImportError: If numpy or pyarrow is not installed.
+        """
+        if np is None or pa is None:
+            raise ImportError(
+                "numpy and pyarrow must be installed to build Arrow tables"
+            )
+        return pa.table(
+            {name: self._to_arrow(column) for name, column in self._columns.items()}
+        )
+
+    def _to_pandas(self, column: _Column) -> Any:
+        kind = column.kind
+        if kind == "float":
+            return np.frombuffer(column.values, dtype=np.float64)
+        if kind == "int":
+            values = np.frombuffer(column.values, dtype=np.int64)
+            if not column.has_missing():
+                return values
+            mask = np.frombuffer(bytes(column.mask), dtype=np.bool_)
+            return pd.arrays.IntegerArray(values.copy(), mask.copy())
+        if kind == "datetime":
+            values = np.frombuffer(column.values, dtype=np.int64)
+            values = values.astype("datetime64[s]")
+            if column.has_missing():
+                mask = np.frombuffer(bytes(column.mask), dtype=np.bool_)
+                values[mask] = np.datetime64("NaT")
+            return values
+        if kind == "category":
+            return pd.Categorical.from_codes(
+                np.frombuffer(column.values, dtype=np.int32),
+                categories=list(column.categories),
+            )
+        # An explicit object dtype keeps None as is; pandas 3 would otherwise
+        # infer its string dtype and turn missing values into NaN
+        return pd.Series(column.values, dtype=object)
+
+    def _to_arrow(self, column: _Column) -> Any:
+        kind = column.kind
+        if kind == "float":
+            values = np.frombuffer(column.values, dtype=np.float64)
+            return pa.array(values, from_pandas=True)
+        if kind in ("int", "datetime"):
+            values = np.frombuffer(column.values, dtype=np.int64)
+            mask = np.frombuffer(bytes(column.mask), dtype=np.bool_)
+            arrow_type = pa.int64() if kind == "int" else pa.timestamp("s")
+            return pa.array(values, type=arrow_type, mask=mask)
+        if kind == "category":
+            codes = np.frombuffer(column.values, dtype=np.int32)
+            return pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0),
+                pa.array(list(column.categories), type=pa.string()),
+            )
+        # Extra fields may mix types; Arrow columns need one
+        return pa.array(
+            [None if value is None else str(value) for value in column.values],
+            type=pa.string(),
+        )
+
+
+def to_frame(
+    records: Iterable[Dict], schema: Dict[str, str], include_extra: bool = True
+) -> "pd.DataFrame":
+    """
+    Builds a typed pandas DataFrame from an iterable of records.
+
+    Args:
+        records (Iterable[Dict]): The records, e.g. ``orders_service.iter_orders()``.
+        schema (Dict[str, str]): Column kinds keyed by field name.
+        include_extra (bool): Keep scalar fields outside the schema.
+
+    Returns:
+        pd.DataFrame: One typed column per field.
+    """
+    return ColumnarBuilder(schema, include_extra).extend(records).to_frame()
+
+
+def to_arrow(
+    records: Iterable[Dict], schema: Dict[str, str], include_extra: bool = True
+) -> "pa.Table":
+    """
+    Builds a typed pyarrow Table from an iterable of records.
+
+    Args:
+        records (Iterable[Dict]): The records, e.g. ``orders_service.iter_orders()``.
+        schema (Dict[str, str]): Column kinds keyed by field name.
+        include_extra (bool): Keep scalar fields outside the schema.
+
+    Returns:
+        pa.Table: One typed column per field.
+    """
+    return ColumnarBuilder(schema, include_extra).extend(records).to_arrow()
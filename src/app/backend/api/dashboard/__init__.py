@@ -0,0 +1,2 @@
+from .loader import *
+from .refresh import *
@@ -0,0 +1,165 @@
+import asyncio
+import time
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeout,
+    as_completed,
+)
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    NamedTuple,
+    Optional,
+)
+
+from api.transport.deadline import propagate_context
+
+
+class DashboardSection(NamedTuple):
+    """
+    The outcome of loading one dashboard section.
+
+    Attributes:
+        name (str): The section's name, as given to the loader.
+        data (Any): What the section's call returned; None if it failed.
+        error (Optional[str]): Why the call failed, or None.
+        seconds (float): How long the call took.
+    """
+
+    name: str
+    data: Any
+    error: Optional[str]
+    seconds: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _section(name: str, data: Any, started: float) -> DashboardSection:
+    # The services report failures as {"Error": ...} rather than raising
+    if isinstance(data, dict) and "Error" in data:
+        error, data = str(data["Error"]), None
+    else:
+        error = None
+    return DashboardSection(name, data, error, time.monotonic() - started)
+
+
+def _load(name: str, fn: Callable[[], Any]) -> DashboardSection:
+    started = time.monotonic()
+    try:
+        return _section(name, fn(), started)
+    except Exception as e:
+        print(f"Dashboard section {name} failed: {e}")
+        return DashboardSection(name, None, str(e), time.monotonic() - started)
+
+
+def load_concurrently(
+    tasks: Dict[str, Callable[[], Any]],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> Iterator[DashboardSection]:
+    """
+    Runs every section's service call at once and yields each section as soon
+    as it completes, so a page can render it while the others still load.
+    The whole load takes as long as the slowest call rather than their sum.
+
+    A failing call never stops the others: its section is yielded with the
+    error instead of data.
+
+    Example::
+
+        sections = {
+            "orders": orders_service.get_orders,
+            "products": products_service.get_products,
+        }
+        for section in load_concurrently(sections):
+            render(section.name, section.data)
+
+    Args:
+        tasks (Dict[str, Callable[[], Any]]): Zero-argument service calls
+            keyed by section name.
+        max_workers (Optional[int]): Calls run at once. Defaults to one
+            thread per section.
+        timeout (Optional[float]): Seconds to wait for all sections; the ones
+            still loading are then yielded with a timeout error.
+
+    Yields:
+        DashboardSection: One section at a time, in completion order.
+    """
+    if not tasks:
+        return
+    pool = ThreadPoolExecutor(max_workers=max_workers or len(tasks))
+    # Every call runs in the caller's context, so a call_deadline() applies
+    futures = {
+        pool.submit(propagate_context(_load), name, fn): name
+        for name, fn in tasks.items()
+    }
+    pending = set(futures)
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            pending.discard(future)
+            yield future.result()
+    except FutureTimeout:
+        for future in pending:
+            future.cancel()
+            yield DashboardSection(
+                futures[future], None, f"Timed out after {timeout}s", timeout
+            )
+    finally:
+        # Do not wait for calls still running after a timeout or an early exit
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def aload_concurrently(
+    tasks: Dict[str, Callable[[], Awaitable[Any]]],
+    timeout: Optional[float] = None,
+) -> AsyncIterator[DashboardSection]:
+    """
+    The asyncio counterpart of load_concurrently, for the async services.
+
+    Args:
+        tasks (Dict[str, Callable[[], Awaitable[Any]]]): Coroutine functions
+            keyed by section name, e.g. ``orders_service.get_orders``.
+        timeout (Optional[float]): Seconds to wait for all sections.
+
+    Yields:
+        DashboardSection: One section at a time, in completion order.
+    """
+
+    async def load(name: str, fn: Callable[[], Awaitable[Any]]) -> DashboardSection:
+        started = time.monotonic()
+        try:
+            return _section(name, await fn(), started)
+        except Exception as e:
+            print(f"Dashboard section {name} failed: {e}")
+            return DashboardSection(name, None, str(e), time.monotonic() - started)
+
+    running = {
+        asyncio.ensure_future(load(name, fn)): name for name, fn in tasks.items()
+    }
+    pending = set(running)
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    try:
+        while pending:
+            remaining = None if deadline is None else max(deadline - loop.time(), 0)
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                break
+            for task in done:
+                yield task.result()
+        for task in pending:
+            task.cancel()
+            yield DashboardSection(
+                running[task], None, f"Timed out after {timeout}s", timeout
+            )
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,277 @@
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from api.transport.rate_limit import TokenBucket
+
+# Refreshes taking longer than this many seconds count as the store being
+# slow, and the dataset is refreshed less often until it speeds up again.
+DEFAULT_SLOW_THRESHOLD = 10.0
+
+# Upper bound, in seconds, on how far a failing or slow dataset is pushed out.
+DEFAULT_MAX_BACKOFF = 900.0
+
+_MAX_DOUBLINGS = 16
+
+
+class Snapshot(NamedTuple):
+    """
+    The latest refreshed copy of one dataset.
+
+    Attributes:
+        name (str): The dataset's name, e.g. 'orders'.
+        data (Any): What the dataset's loader last returned successfully, or
+            None if it has never succeeded.
+        refreshed_at (Optional[float]): Unix time of that successful load.
+        error (Optional[str]): Why the most recent refresh failed, or None if
+            it succeeded.
+        seconds (float): How long the most recent refresh took.
+    """
+
+    name: str
+    data: Any
+    refreshed_at: Optional[float]
+    error: Optional[str]
+    seconds: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def age(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Returns how many seconds old the data is, or None if there is none.
+        """
+        if self.refreshed_at is None:
+            return None
+        return (time.time() if now is None else now) - self.refreshed_at
+
+
+class SnapshotStore:
+    """
+    A thread-safe store of the latest snapshot of every dataset, written by a
+    RefreshWorker and read by any number of pages.
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[str, Snapshot] = {}
+        self._changed = threading.Condition()
+
+    def get(self, name: str) -> Optional[Snapshot]:
+        """
+        Returns the latest snapshot of a dataset, or None before its first
+        refresh has finished.
+        """
+        with self._changed:
+            return self._snapshots.get(name)
+
+    def wait(self, name: str, timeout: Optional[float] = None) -> Optional[Snapshot]:
+        """
+        Blocks until a dataset has a snapshot, e.g. on a page opened before
+        the first refresh finished.
+
+        Args:
+            name (str): The dataset's name.
+            timeout (Optional[float]): Maximum number of seconds to wait.
+
+        Returns:
+            Optional[Snapshot]: The snapshot, or None if the wait timed out.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: name in self._snapshots, timeout)
+            return self._snapshots.get(name)
+
+    def record(self, name: str, data: Any, error: Optional[str], seconds: float):
+        """
+        Records the outcome of a refresh. A failed refresh keeps the data of
+        the last successful one, so pages can go on showing it as stale.
+        """
+        with self._changed:
+            previous = self._snapshots.get(name)
+            if error is None:
+                snapshot = Snapshot(name, data, time.time(), None, seconds)
+            elif previous is not None:
+                snapshot = previous._replace(error=error, seconds=seconds)
+            else:
+                snapshot = Snapshot(name, None, None, error, seconds)
+            self._snapshots[name] = snapshot
+            self._changed.notify_all()
+
+    def snapshots(self) -> Dict[str, Snapshot]:
+        """
+        Returns the latest snapshot of every dataset.
+        """
+        with self._changed:
+            return dict(self._snapshots)
+
+
+class _Job:
+    __slots__ = ("name", "load", "interval", "due", "backoff")
+
+    def __init__(self, name: str, load: Callable[[], Any], interval: float):
+        self.name = name
+        self.load = load
+        self.interval = interval
+        self.due = 0.0
+        self.backoff = 0
+
+
+class RefreshWorker:
+    """
+    A daemon thread refreshing datasets on their own intervals into a
+    SnapshotStore, so pages read the latest snapshot instead of waiting on
+    the store.
+
+    Datasets are refreshed one at a time, so the worker never has more than
+    one request sequence in flight. With ``rate`` set, every refresh also
+    takes a token from that bucket, capping the share of the store's request
+    budget spent in the background. A refresh that fails or takes longer than
+    ``slow_threshold`` doubles the dataset's interval (up to ``max_backoff``)
+    until a quick, successful refresh resets it.
+
+    Example::
+
+        worker = RefreshWorker()
+        worker.add("orders", orders_service.fetch_all_orders, interval=60)
+        worker.start()
+        snapshot = worker.store.get("orders")
+    """
+
+    def __init__(
+        self,
+        store: Optional[SnapshotStore] = None,
+        rate: Optional[TokenBucket] = None,
+        slow_threshold: float = DEFAULT_SLOW_THRESHOLD,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+    ):
+        """
+        Initializes a worker without datasets.
+
+        Args:
+            store (Optional[SnapshotStore]): Where snapshots are written.
+                Defaults to a new store.
+            rate (Optional[TokenBucket]): Paces the refreshes, e.g.
+                ``TokenBucket(0.5)`` for at most one every two seconds.
+            slow_threshold (float): Seconds after which a refresh counts as
+                slow.
+            max_backoff (float): Longest interval, in seconds, a failing or
+                slow dataset is pushed out to.
+        """
+        self.store = store if store is not None else SnapshotStore()
+        self.rate = rate
+        self.slow_threshold = slow_threshold
+        self.max_backoff = max_backoff
+        self._jobs: Dict[str, _Job] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, name: str, load: Callable[[], Any], interval: float) -> None:
+        """
+        Schedules a dataset, refreshed as soon as the worker runs and then
+        every ``interval`` seconds.
+
+        Args:
+            name (str): The dataset's name, e.g. 'orders'.
+            load (Callable[[], Any]): Fetches the dataset. Returning a
+                ``{"Error": ...}`` response or raising counts as a failure.
+            interval (float): Seconds between refreshes.
+
+        Raises:
+            ValueError: If interval is not positive.
+        """
+        if interval <= 0:
+            raise ValueError("Interval must be positive")
+        with self._lock:
+            self._jobs[name] = _Job(name, load, interval)
+        self._wake.set()
+
+    def refresh_now(self, name: str) -> None:
+        """
+        Moves a dataset to the front of the queue, e.g. after a page wrote to
+        it.
+        """
+        with self._lock:
+            self._jobs[name].due = 0.0
+        self._wake.set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Starts the worker thread; does nothing if it is already running.
+        """
+        if self.running:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="cscart-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the worker after the refresh in progress, if any.
+        """
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_pending(self) -> float:
+        """
+        Refreshes every dataset that is due.
+
+        Returns:
+            float: Seconds until the next dataset is due.
+        """
+        while not self._stopped.is_set():
+            job = self._next_due()
+            if job is None:
+                break
+            if self.rate is not None:
+                self.rate.acquire()
+            self._refresh(job)
+        with self._lock:
+            if not self._jobs:
+                return self.max_backoff
+            next_due = min(job.due for job in self._jobs.values())
+        return max(0.0, next_due - time.monotonic())
+
+    def _next_due(self) -> Optional[_Job]:
+        now = time.monotonic()
+        with self._lock:
+            due = [job for job in self._jobs.values() if job.due <= now]
+            return min(due, key=lambda job: job.due) if due else None
+
+    def _refresh(self, job: _Job) -> None:
+        started = time.monotonic()
+        try:
+            data = job.load()
+            error = None
+            # The services report failures as {"Error": ...} rather than raising
+            if isinstance(data, dict) and "Error" in data:
+                error, data = str(data["Error"]), None
+        except Exception as e:
+            print(f"Refreshing {job.name} failed: {e}")
+            data, error = None, str(e)
+        seconds = time.monotonic() - started
+        self.store.record(job.name, data, error, seconds)
+
+        if error is not None or seconds > self.slow_threshold:
+            job.backoff = min(job.backoff + 1, _MAX_DOUBLINGS)
+        else:
+            job.backoff = 0
+        delay = min(job.interval * 2**job.backoff, max(job.interval, self.max_backoff))
+        with self._lock:
+            job.due = time.monotonic() + delay
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            delay = self.run_pending()
+            self._wake.wait(delay)
+            self._wake.clear()
@@ -0,0 +1,3 @@
+from api.gateway.server import main
+
+main()
@@ -0,0 +1,263 @@
+import argparse
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from api import DEFAULT_BASE_URL
+from api.cache import ResponseCache
+from api.codec import dumps
+from api.transport import HTTPTransport, RateLimiterRegistry, TokenBucket
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8600
+
+# Seconds GET responses are shared across sessions when no TTL is given.
+DEFAULT_GATEWAY_TTL = 30.0
+
+# Upstream connections kept open to the store.
+DEFAULT_GATEWAY_POOL_SIZE = 16
+
+# Request headers passed on to the store; everything else stays local.
+_FORWARDED_REQUEST_HEADERS = (
+    "Authorization",
+    "Content-Type",
+    "Accept",
+    "Accept-Language",
+)
+
+# Response headers that describe the upstream connection or encoding rather
+# than the body the gateway sends back.
+_HOP_BY_HOP = frozenset(
+    (
+        "connection",
+        "keep-alive",
+        "transfer-encoding",
+        "content-encoding",
+        "content-length",
+        "proxy-authenticate",
+        "trailer",
+        "upgrade",
+    )
+)
+
+STATS_PATH = "/_gateway/stats"
+
+
+class GlobalRateLimit(RateLimiterRegistry):
+    """
+    A rate limit registry whose every set of credentials draws from one
+    bucket, capping the gateway's total request rate to the store.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate (float): Requests per second sent to the store, in total.
+            capacity (Optional[float]): Maximum burst size.
+        """
+        super().__init__(default_rate=rate, default_capacity=capacity)
+        self._bucket = TokenBucket(rate, capacity)
+
+    def limiter_for(self, credentials: str) -> Optional[TokenBucket]:
+        return self._bucket
+
+
+class GatewayServer(ThreadingHTTPServer):
+    """
+    A local HTTP proxy in front of the CS-Cart store, shared by every
+    Streamlit session on the host.
+
+    Services reach it by setting CSCART_BASE_URL to its address. It forwards
+    each request through one pooled HTTPTransport, so all sessions share the
+    upstream connections, a GET cache (keyed by credentials, so accounts never
+    see each other's data), single-flight coalescing of identical GETs and,
+    optionally, one global rate limit. Upstream load stays flat as sessions are
+    added. Writes pass straight through and invalidate the cached collection.
+
+    ``GET /_gateway/stats`` returns the transport and cache counters.
+
+    Attributes:
+        upstream (str): The store's base URL.
+        transport (HTTPTransport): The transport requests are forwarded with.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple = (DEFAULT_HOST, DEFAULT_PORT),
+        upstream: str = DEFAULT_BASE_URL,
+        transport: Optional[HTTPTransport] = None,
+    ):
+        """
+        Binds the gateway.
+
+        Args:
+            address (tuple): The (host, port) to listen on.
+            upstream (str): The store's base URL.
+            transport (Optional[HTTPTransport]): The transport to forward
+                with. Defaults to build_transport().
+        """
+        super().__init__(address, GatewayHandler)
+        self.upstream = upstream.rstrip("/")
+        self.transport = transport or build_transport()
+
+    def serve_in_thread(self) -> threading.Thread:
+        """
+        Starts serving on a daemon thread, e.g. next to Streamlit or in tests.
+
+        Returns:
+            threading.Thread: The serving thread.
+        """
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.transport.close()
+
+
+class GatewayHandler(BaseHTTPRequestHandler):
+    """
+    Forwards one request through the gateway's transport.
+    """
+
+    server: GatewayServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path == STATS_PATH:
+            self._reply(200, {"Content-Type": "application/json"}, dumps(self._stats()))
+            return
+        self._forward("GET")
+
+    def do_POST(self) -> None:
+        self._forward("POST")
+
+    def do_PUT(self) -> None:
+        self._forward("PUT")
+
+    def do_DELETE(self) -> None:
+        self._forward("DELETE")
+
+    def _forward(self, method: str) -> None:
+        parts = urlsplit(self.path)
+        url = self.server.upstream + parts.path
+        params = parse_qs(parts.query, keep_blank_values=True) or None
+        headers = {
+            name: self.headers[name]
+            for name in _FORWARDED_REQUEST_HEADERS
+            if self.headers.get(name) is not None
+        }
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+
+        try:
+            response = self.server.transport.request(
+                method, url, headers=headers, params=params, data=body
+            )
+        except requests.exceptions.RequestException as e:
+            print(f"Gateway RequestException ({method} {parts.path}): {e}")
+            self._reply(
+                502, {"Content-Type": "application/json"}, dumps({"Error": str(e)})
+            )
+            return
+
+        response_headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _HOP_BY_HOP
+        }
+        self._reply(response.status_code, response_headers, response.content)
+
+    def _reply(self, status_code: int, headers: Dict, body: bytes) -> None:
+        self.send_response(status_code)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stats(self) -> Dict:
+        transport = self.server.transport
+        stats = {"transport": transport.metrics.snapshot()}
+        if transport.cache is not None:
+            stats["cache"] = transport.cache.stats()
+        return stats
+
+    def log_message(self, format: str, *args) -> None:
+        # One line per request is too noisy next to Streamlit's own output
+        return None
+
+
+def build_transport(
+    ttl: float = DEFAULT_GATEWAY_TTL,
+    rate: Optional[float] = None,
+    pool_size: int = DEFAULT_GATEWAY_POOL_SIZE,
+    compression: Optional[str] = "zlib",
+) -> HTTPTransport:
+    """
+    Builds the transport a gateway forwards requests with.
+
+    Args:
+        ttl (float): Seconds GET responses are shared; 0 disables the cache.
+        rate (Optional[float]): Total requests per second sent to the store;
+            None leaves the rate unlimited.
+        pool_size (int): Upstream connections kept open.
+        compression (Optional[str]): Codec used for cached payloads.
+
+    Returns:
+        HTTPTransport: A coalescing transport with a shared cache.
+    """
+    return HTTPTransport(
+        pool_maxsize=pool_size,
+        cache=ResponseCache(default_ttl=ttl, compression=compression) if ttl else None,
+        coalesce=True,
+        rate_limits=GlobalRateLimit(rate) if rate else None,
+    )
+
+
+def main(argv: Optional[list] = None) -> None:
+    """
+    Runs the gateway until interrupted (``python -m api.gateway``).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m api.gateway",
+        description="Shared caching proxy between Streamlit sessions and CS-Cart.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--upstream",
+        default=os.environ.get("CSCART_UPSTREAM_URL", DEFAULT_BASE_URL),
+        help="the store's base URL (default: $CSCART_UPSTREAM_URL)",
+    )
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=DEFAULT_GATEWAY_TTL,
+        help="seconds GET responses are shared across sessions (0 disables)",
+    )
+    parser.add_argument(
+        "--rate", type=float, help="total requests per second sent to the store"
+    )
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_GATEWAY_POOL_SIZE)
+    args = parser.parse_args(argv)
+
+    server = GatewayServer(
+        (args.host, args.port),
+        args.upstream,
+        build_transport(args.ttl, args.rate, args.pool_size),
+    )
+    print(f"Gateway listening on http://{args.host}:{args.port} -> {args.upstream}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
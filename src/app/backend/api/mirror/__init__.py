@@ -0,0 +1,3 @@
+from .base import *
+from .orders_mirror import *
+from .catalog_sync import *
@@ -0,0 +1,75 @@
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+_STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY,
+    cursor INTEGER,
+    synced_at REAL,
+    upserted INTEGER
+);
+"""
+
+
+class SQLiteStore:
+    """
+    Base class of the local SQLite mirrors.
+
+    It owns one connection shared by every thread (Streamlit reruns a page on
+    a different thread each time) and guarded by a lock, creates the
+    subclass's ``schema`` and keeps one ``sync_state`` row per named sync.
+    Several mirrors can share one database file.
+
+    Attributes:
+        path (str): The SQLite database file, or ':memory:'.
+    """
+
+    schema = ""
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Opens (and if needed creates) the database.
+
+        Args:
+            path (str): The SQLite database file. Defaults to an in-memory
+                database.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(_STATE_SCHEMA + self.schema)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        The underlying connection, e.g. for ``pd.read_sql_query``.
+        """
+        return self._connection
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def _read_state(self, name: str) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT cursor, synced_at, upserted FROM sync_state WHERE name = ?",
+                (name,),
+            ).fetchone()
+
+    def _write_state(self, name: str, cursor: Optional[int], upserted: int) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO sync_state (name, cursor, synced_at, upserted) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT(name) DO UPDATE SET "
+                "cursor = excluded.cursor, synced_at = excluded.synced_at, "
+                "upserted = excluded.upserted",
+                (name, cursor, time.time(), upserted),
+            )
@@ -0,0 +1,277 @@
+import hashlib
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from api.codec import dumps, loads
+from api.columnar import PRODUCT_COLUMNS, ColumnarBuilder
+from api.mirror.base import SQLiteStore
+from api.pagination import DEFAULT_ITEMS_PER_PAGE
+
+# Products written per transaction during a sync.
+DEFAULT_BATCH_SIZE = 500
+
+# Consecutive unchanged products after which an incremental sync stops
+# walking the catalog.
+DEFAULT_STOP_AFTER = 100
+
+# Seconds between full reconciles, which are the only syncs that detect
+# deleted products.
+DEFAULT_RECONCILE_INTERVAL = 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    product_id INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL,
+    updated_timestamp INTEGER,
+    data BLOB NOT NULL
+);
+"""
+
+_UPSERT = (
+    "INSERT INTO products (product_id, hash, updated_timestamp, data) "
+    "VALUES (?, ?, ?, ?) ON CONFLICT(product_id) DO UPDATE SET "
+    "hash = excluded.hash, updated_timestamp = excluded.updated_timestamp, "
+    "data = excluded.data"
+)
+
+
+def content_hash(product: Dict) -> str:
+    """
+    Returns a fingerprint of a product's content.
+
+    Keys are sorted before hashing, so the fingerprint changes exactly when
+    one of the product's values does, whatever order the fields arrive in.
+
+    Args:
+        product (Dict): A product as returned by the products list.
+
+    Returns:
+        str: A 32-character hex digest.
+    """
+    return hashlib.blake2b(dumps(product, sort_keys=True), digest_size=16).hexdigest()
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class CatalogSync(SQLiteStore):
+    """
+    Keeps a local copy of the product catalog with one content hash per
+    product, and reports what changed since the previous sync.
+
+    An incremental sync walks the catalog most recently updated first and
+    stops once ``stop_after`` products in a row are unchanged, so a quiet
+    catalog costs a page or two. It cannot see deletions; those are found by
+    a full reconcile, which walks every page and drops the products the store
+    no longer returns. ``sync`` runs a reconcile on the first sync and then
+    whenever ``reconcile_interval`` has passed, e.g. nightly.
+
+    Example::
+
+        catalog = CatalogSync(products_service, "catalog.db")
+        delta = catalog.sync()
+        for product_id in delta["updated"]:
+            ...
+
+    Attributes:
+        service (ProductsService): The service products are pulled through.
+        path (str): The SQLite database file, or ':memory:'.
+        batch_size (int): Products written per transaction.
+        stop_after (int): Unchanged products in a row that end a sync.
+        reconcile_interval (float): Seconds between full reconciles.
+        items_per_page (int): Products requested per page.
+    """
+
+    name = "products"
+    schema = _SCHEMA
+
+    def __init__(
+        self,
+        service: Any,
+        path: str = ":memory:",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        stop_after: int = DEFAULT_STOP_AFTER,
+        reconcile_interval: float = DEFAULT_RECONCILE_INTERVAL,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ):
+        """
+        Opens (and if needed creates) the catalog database.
+
+        Args:
+            service (ProductsService): The service products are pulled through.
+            path (str): The SQLite database file. Defaults to an in-memory
+                database.
+            batch_size (int): Products written per transaction.
+            stop_after (int): Unchanged products in a row that end an
+                incremental sync.
+            reconcile_interval (float): Seconds between full reconciles.
+            items_per_page (int): Products requested per page.
+
+        Raises:
+            ValueError: If batch_size or stop_after is smaller than 1.
+        """
+        if batch_size < 1 or stop_after < 1:
+            raise ValueError("batch_size and stop_after must be at least 1")
+
+        super().__init__(path)
+        self.service = service
+        self.batch_size = batch_size
+        self.stop_after = stop_after
+        self.reconcile_interval = reconcile_interval
+        self.items_per_page = items_per_page
+
+    def last_reconciled(self) -> Optional[float]:
+        """
+        Returns the Unix time the last full reconcile completed, or None.
+        """
+        state = self._read_state(f"{self.name}:reconcile")
+        return None if state is None else state["synced_at"]
+
+    def sync(self, params: Optional[Dict] = None) -> Dict[str, List[int]]:
+        """
+        Brings the local catalog up to date, reconciling it if one is due.
+
+        Args:
+            params (Optional[Dict]): Extra filters sent with every page.
+
+        Returns:
+            Dict[str, List[int]]: The 'inserted', 'updated' and 'deleted'
+            product IDs.
+
+        Raises:
+            ConnectionError: If a page request fails.
+        """
+        last_reconciled = self.last_reconciled()
+        if last_reconciled is None or (
+            time.time() - last_reconciled >= self.reconcile_interval
+        ):
+            return self.reconcile(params)
+
+        page_params = dict(params or {})
+        page_params.update({"sort_by": "updated_timestamp", "sort_order": "desc"})
+        delta, _ = self._walk(page_params, stop_after=self.stop_after)
+        upserted = len(delta["inserted"]) + len(delta["updated"])
+        self._write_state(self.name, None, upserted)
+        return delta
+
+    def reconcile(self, params: Optional[Dict] = None) -> Dict[str, List[int]]:
+        """
+        Walks the whole catalog, detecting deleted products as well.
+
+        Args:
+            params (Optional[Dict]): Extra filters sent with every page; the
+                deletions are only meaningful if they match previous syncs.
+
+        Returns:
+            Dict[str, List[int]]: The 'inserted', 'updated' and 'deleted'
+            product IDs.
+
+        Raises:
+            ConnectionError: If a page request fails; nothing is deleted then.
+        """
+        delta, seen = self._walk(dict(params or {}), stop_after=None)
+        with self._lock, self._connection:
+            stored = [
+                row[0]
+                for row in self._connection.execute("SELECT product_id FROM products")
+            ]
+            deleted = [product_id for product_id in stored if product_id not in seen]
+            self._connection.executemany(
+                "DELETE FROM products WHERE product_id = ?",
+                [(product_id,) for product_id in deleted],
+            )
+        delta["deleted"] = deleted
+        upserted = len(delta["inserted"]) + len(delta["updated"])
+        self._write_state(self.name, None, upserted)
+        self._write_state(f"{self.name}:reconcile", None, upserted)
+        return delta
+
+    def products(self) -> Iterator[Dict]:
+        """
+        Yields every stored product, as returned by the API.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT data FROM products ORDER BY product_id"
+            ).fetchall()
+        for row in rows:
+            yield loads(row["data"])
+
+    def get(self, product_id: int) -> Optional[Dict]:
+        """
+        Returns one stored product, or None if it is not in the catalog.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM products WHERE product_id = ?", (product_id,)
+            ).fetchone()
+        return None if row is None else loads(row["data"])
+
+    def count(self) -> int:
+        """
+        Returns the number of stored products.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM products").fetchone()
+        return row[0]
+
+    def to_frame(self) -> Any:
+        """
+        Returns the stored catalog as a typed pandas DataFrame.
+
+        Raises:
+            ImportError: If numpy or pandas is not installed.
+        """
+        return ColumnarBuilder(PRODUCT_COLUMNS).extend(self.products()).to_frame()
+
+    def _walk(
+        self, params: Dict, stop_after: Optional[int]
+    ) -> Tuple[Dict[str, List[int]], set]:
+        # Compares every product walked with its stored hash, writing the
+        # changed ones in batches; stops after stop_after unchanged products
+        # in a row unless stop_after is None
+        with self._lock:
+            hashes = dict(
+                self._connection.execute("SELECT product_id, hash FROM products")
+            )
+        delta: Dict[str, List[int]] = {"inserted": [], "updated": [], "deleted": []}
+        seen = set()
+        batch: List[Tuple] = []
+        unchanged = 0
+        for product in self.service.iter_products(params, self.items_per_page):
+            product_id = _int(product.get("product_id"))
+            if product_id is None:
+                continue
+            seen.add(product_id)
+            digest = content_hash(product)
+            stored = hashes.get(product_id)
+            if stored == digest:
+                unchanged += 1
+                if stop_after is not None and unchanged >= stop_after:
+                    break
+                continue
+            unchanged = 0
+            delta["inserted" if stored is None else "updated"].append(product_id)
+            hashes[product_id] = digest
+            batch.append(
+                (
+                    product_id,
+                    digest,
+                    _int(product.get("updated_timestamp")),
+                    dumps(product),
+                )
+            )
+            if len(batch) >= self.batch_size:
+                self._upsert(batch)
+                batch = []
+        if batch:
+            self._upsert(batch)
+        return delta, seen
+
+    def _upsert(self, batch: List[Tuple]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(_UPSERT, batch)
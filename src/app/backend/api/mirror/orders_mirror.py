@@ -0,0 +1,345 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from api.codec import dumps, loads
+from api.mirror.base import SQLiteStore
+from api.pagination import DEFAULT_ITEMS_PER_PAGE, TablePage
+
+# pandas is only needed by to_frame.
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - depends on the installed extras
+    pd = None
+
+# Orders written per transaction during a sync.
+DEFAULT_BATCH_SIZE = 500
+
+# Seconds re-read before the cursor on every incremental sync, so orders saved
+# in the same second as the last sync, or committed late, are not missed.
+DEFAULT_OVERLAP = 300
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    order_id INTEGER PRIMARY KEY,
+    parent_order_id INTEGER,
+    user_id INTEGER,
+    company_id INTEGER,
+    company TEXT,
+    status TEXT,
+    timestamp INTEGER,
+    updated_at INTEGER,
+    total REAL,
+    firstname TEXT,
+    lastname TEXT,
+    email TEXT,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS orders_timestamp ON orders (timestamp);
+CREATE INDEX IF NOT EXISTS orders_status ON orders (status);
+"""
+
+# Columns stored next to the raw order, in table order.
+_COLUMNS = (
+    "order_id",
+    "parent_order_id",
+    "user_id",
+    "company_id",
+    "company",
+    "status",
+    "timestamp",
+    "updated_at",
+    "total",
+    "firstname",
+    "lastname",
+    "email",
+)
+
+_UPSERT = (
+    f"INSERT INTO orders ({', '.join(_COLUMNS)}, data) "
+    f"VALUES ({', '.join('?' * (len(_COLUMNS) + 1))}) "
+    "ON CONFLICT(order_id) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in _COLUMNS[1:] + ("data",))
+)
+
+_SORTABLE = frozenset(_COLUMNS)
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class OrdersMirror(SQLiteStore):
+    """
+    A local SQLite copy of the store's orders, kept current by incremental
+    syncs through an OrdersService.
+
+    An incremental sync walks the orders most recently updated first and
+    stops at the first one last changed before the stored high-water mark (the
+    newest ``updated_at``, or ``timestamp`` when the store does not report
+    it), so status changes to orders already mirrored are pulled again. The
+    orders are upserted in batched transactions and the new cursor saved last,
+    so a failed sync simply resumes from the previous one. Pages read the
+    mirror instead of waiting on the API.
+
+    Orders deleted from the store, and changes the store does not reflect in
+    ``updated_at``, are only picked up by a ``full`` sync.
+
+    Example::
+
+        mirror = OrdersMirror(orders_service, "orders.db")
+        mirror.sync()
+        recent = mirror.orders(status="P", limit=50)
+
+    Attributes:
+        service (OrdersService): The service orders are pulled through.
+        path (str): The SQLite database file, or ':memory:'.
+        batch_size (int): Orders written per transaction.
+        overlap (int): Seconds re-read before the cursor on every sync.
+        items_per_page (int): Orders requested per page.
+    """
+
+    name = "orders"
+    schema = _SCHEMA
+
+    def __init__(
+        self,
+        service: Any,
+        path: str = ":memory:",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        overlap: int = DEFAULT_OVERLAP,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ):
+        """
+        Opens (and if needed creates) the mirror database.
+
+        Args:
+            service (OrdersService): The service orders are pulled through.
+            path (str): The SQLite database file. Defaults to an in-memory
+                database.
+            batch_size (int): Orders written per transaction.
+            overlap (int): Seconds re-read before the cursor on every sync.
+            items_per_page (int): Orders requested per page.
+
+        Raises:
+            ValueError: If batch_size is smaller than 1.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        super().__init__(path)
+        self.service = service
+        self.batch_size = batch_size
+        self.overlap = overlap
+        self.items_per_page = items_per_page
+
+    def cursor(self) -> Optional[int]:
+        """
+        Returns the high-water mark of the last sync, or None before the first.
+        """
+        state = self._read_state(self.name)
+        return None if state is None else state["cursor"]
+
+    def last_synced(self) -> Optional[float]:
+        """
+        Returns the Unix time the last sync completed, or None.
+        """
+        state = self._read_state(self.name)
+        return None if state is None else state["synced_at"]
+
+    def changed_first_params(self) -> Dict:
+        """
+        Returns the orders list parameters listing the most recently updated
+        orders first. Override it if the store names the sort field
+        differently.
+
+        Returns:
+            Dict: Query parameters for ``get_orders``.
+        """
+        return {"sort_by": "updated", "sort_order": "desc"}
+
+    def sync(self, full: bool = False, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Pulls the orders changed since the last sync into the mirror.
+
+        Args:
+            full (bool): Ignore the cursor and pull every order.
+            params (Optional[Dict]): Extra filters sent with every page.
+
+        Returns:
+            Dict[str, Any]: 'upserted' (orders written) and 'cursor' (the new
+            high-water mark).
+
+        Raises:
+            ConnectionError: If a page request fails; the orders written so far
+                are kept and the cursor is left unchanged.
+        """
+        cursor = None if full else self.cursor()
+        page_params = dict(params or {})
+        stop_at = None
+        if cursor is not None:
+            page_params.update(self.changed_first_params())
+            stop_at = max(cursor - self.overlap, 0)
+
+        high_water = cursor or 0
+        upserted = 0
+        batch: List[Tuple] = []
+        for order in self.service.iter_orders(page_params, self.items_per_page):
+            row = self._row(order)
+            order_id, timestamp, updated_at = row[0], row[6], row[7]
+            if order_id is None:
+                continue
+            changed = updated_at or timestamp or 0
+            if stop_at is not None and changed < stop_at:
+                # The rest were last updated before the previous sync; leaving
+                # the loop stops requesting pages
+                break
+            high_water = max(high_water, changed)
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                upserted += self._upsert(batch)
+                batch = []
+        if batch:
+            upserted += self._upsert(batch)
+
+        self._write_state(self.name, high_water, upserted)
+        return {"upserted": upserted, "cursor": high_water}
+
+    def orders(
+        self,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        sort_by: str = "timestamp",
+        descending: bool = True,
+    ) -> List[Dict]:
+        """
+        Reads orders from the mirror, as returned by the API.
+
+        Args:
+            status (Optional[str]): Only return orders with this status code.
+            limit (Optional[int]): Maximum number of orders returned.
+            offset (int): Number of matching orders skipped.
+            sort_by (str): Column to sort by, e.g. 'timestamp' or 'total'.
+            descending (bool): Sort in descending order.
+
+        Returns:
+            List[Dict]: The matching orders.
+
+        Raises:
+            ValueError: If sort_by is not a mirrored column.
+        """
+        if sort_by not in _SORTABLE:
+            raise ValueError(f"Cannot sort orders by {sort_by!r}")
+
+        query = "SELECT data FROM orders"
+        args: List[Any] = []
+        if status is not None:
+            query += " WHERE status = ?"
+            args.append(status)
+        query += f" ORDER BY {sort_by} {'DESC' if descending else 'ASC'}, order_id"
+        if limit is not None or offset:
+            query += " LIMIT ? OFFSET ?"
+            args.extend((-1 if limit is None else limit, offset))
+        with self._lock:
+            rows = self._connection.execute(query, args).fetchall()
+        return [loads(row["data"]) for row in rows]
+
+    def table_page(
+        self,
+        page: int = 1,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        sort_by: str = "timestamp",
+        descending: bool = True,
+        status: Optional[str] = None,
+    ) -> TablePage:
+        """
+        Reads the one page of orders a table view shows, sorted and filtered
+        by SQLite.
+
+        Args:
+            page (int): The page number, starting at 1.
+            items_per_page (int): The page size.
+            sort_by (str): Column to sort by, e.g. 'timestamp' or 'total'.
+            descending (bool): Sort in descending order.
+            status (Optional[str]): Only return orders with this status code.
+
+        Returns:
+            TablePage: The page, with the number of matching orders as total.
+
+        Raises:
+            ValueError: If page or items_per_page is smaller than 1, or sort_by
+                is not a mirrored column.
+        """
+        if page < 1 or items_per_page < 1:
+            raise ValueError("page and items_per_page must be at least 1")
+        records = self.orders(
+            status, items_per_page, (page - 1) * items_per_page, sort_by, descending
+        )
+        return TablePage(records, page, items_per_page, self.count(status))
+
+    def get(self, order_id: int) -> Optional[Dict]:
+        """
+        Returns one mirrored order, or None if it is not in the mirror.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM orders WHERE order_id = ?", (order_id,)
+            ).fetchone()
+        return None if row is None else loads(row["data"])
+
+    def count(self, status: Optional[str] = None) -> int:
+        """
+        Returns the number of mirrored orders, optionally with one status.
+        """
+        query, args = "SELECT COUNT(*) FROM orders", ()
+        if status is not None:
+            query, args = query + " WHERE status = ?", (status,)
+        with self._lock:
+            return self._connection.execute(query, args).fetchone()[0]
+
+    def to_frame(self) -> Any:
+        """
+        Returns the mirrored order columns as a pandas DataFrame, newest first.
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        if pd is None:
+            raise ImportError("pandas must be installed to build DataFrames")
+        with self._lock:
+            return pd.read_sql_query(
+                f"SELECT {', '.join(_COLUMNS)} FROM orders "
+                "ORDER BY timestamp DESC, order_id",
+                self._connection,
+            )
+
+    def _row(self, order: Dict) -> Tuple:
+        return (
+            _int(order.get("order_id")),
+            _int(order.get("parent_order_id")),
+            _int(order.get("user_id")),
+            _int(order.get("company_id")),
+            order.get("company"),
+            order.get("status"),
+            _int(order.get("timestamp")),
+            _int(order.get("updated_at")),
+            _float(order.get("total")),
+            order.get("firstname"),
+            order.get("lastname"),
+            order.get("email"),
+            dumps(order),
+        )
+
+    def _upsert(self, batch: List[Tuple]) -> int:
+        with self._lock, self._connection:
+            self._connection.executemany(_UPSERT, batch)
+        return len(batch)
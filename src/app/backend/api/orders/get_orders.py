@@ -1,9 +1,29 @@
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
 from urllib.parse import urljoin
 import requests
 import json
 
 from api import BASE_URL, encode_credentials
+from api.codec import DEFAULT_CHUNK_SIZE, decode_response
+from api.columnar import ORDER_COLUMNS, ColumnarBuilder
+from api.pagination import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_ITEMS_PER_PAGE,
+    acount_items,
+    afetch_all_pages,
+    aiter_pages,
+    astream_items,
+    count_items,
+    fetch_all_pages,
+    iter_pages,
+    stream_items,
+)
+from api.records import Order
+from api.transport import (
+    AsyncServiceMixin,
+    HTTPTransport,
+    get_default_transport,
+)
 
 
 class OrdersService:
@@ -20,19 +40,32 @@ class OrdersService:
 
     Methods:
         get_orders(params): Retrieve a list of orders.
+        iter_orders(params, items_per_page): Lazily iterate over every order.
+        count_orders(params, max_age): Count the orders without downloading them.
+        fetch_all_orders(params, items_per_page, concurrency): Retrieve every order.
+        stream_orders(params, chunk_size): Yield one page of orders as it downloads.
+        to_frame(params, items_per_page): Retrieve every order as a typed DataFrame.
+        to_arrow(params, items_per_page): Retrieve every order as a typed Arrow Table.
         get_order(order_id): Retrieve details of a specific order.
         create_order(order_data): Create a new order.
         update_order(order_id, order_data): Update an existing order.
         delete_order(order_id): Delete an order.
     """
 
-    def __init__(self, email: str, api_key: str):
+    def __init__(
+        self,
+        email: str,
+        api_key: str,
+        transport: Optional[HTTPTransport] = None,
+    ):
         """
         Initializes the OrdersService with the provided email and API key.
 
         Args:
             email (str): The email of the user accessing the CS-Cart API.
             api_key (str): The API key associated with the user's account.
+            transport (Optional[HTTPTransport]): Pooled transport to send requests
+                through. Defaults to the process-wide shared transport.
 
         Raises:
             ValueError: If either email or API key is not provided.
@@ -41,6 +74,7 @@ class OrdersService:
             raise ValueError("Email and API key must be set")
 
         self.credentials = encode_credentials(email, api_key)
+        self.transport = transport or get_default_transport()
         self.url = urljoin(BASE_URL, "/api/orders/")
         self.headers = {
             "Content-Type": "application/json",
@@ -59,6 +93,156 @@ class OrdersService:
         """
         return self._handle_request(method="GET", params=params)
 
+    def iter_orders(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        records: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Lazily yields every order, fetching one page at a time.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the orders list.
+            items_per_page (int): Number of orders requested per page.
+            records (bool): Return Order records instead of dicts.
+
+        Returns:
+            Iterator[Any]: The orders, one at a time.
+        """
+        return iter_pages(
+            self.get_orders,
+            "orders",
+            params,
+            items_per_page,
+            convert=Order.from_dict if records else None,
+        )
+
+    def count_orders(
+        self, params: Optional[Dict] = None, max_age: float = 0
+    ) -> Optional[int]:
+        """
+        Counts the orders matching the filters with a single one-order
+        request, reading the total the store reports.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the orders list.
+            max_age (float): Seconds a count fetched earlier by any OrdersService
+                with the same credentials may be reused.
+
+        Returns:
+            Optional[int]: The number of orders, or None if not reported.
+
+        Raises:
+            ConnectionError: If the request fails.
+        """
+        return count_items(
+            self.get_orders, "orders", params, max_age, (self.credentials, self.url)
+        )
+
+    def fetch_all_orders(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        records: bool = False,
+    ) -> Dict:
+        """
+        Retrieves every order, fetching the pages after the first one in parallel.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the orders list.
+            items_per_page (int): Number of orders requested per page.
+            concurrency (int): Maximum number of pages requested at once, or an
+                AdaptiveConcurrencyLimiter to adapt it to the store's load.
+            records (bool): Return Order records instead of dicts.
+
+        Returns:
+            Dict: The first page's response with 'orders' holding every order.
+        """
+        return fetch_all_pages(
+            self.get_orders,
+            "orders",
+            params,
+            items_per_page,
+            concurrency,
+            convert=Order.from_dict if records else None,
+        )
+
+    def stream_orders(
+        self,
+        params: Optional[Dict] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        records: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Yields the orders of one page while the response is still downloading,
+        parsing the body incrementally instead of buffering the whole page.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter and paginate the orders list.
+            chunk_size (int): Number of body bytes read at a time.
+            records (bool): Return Order records instead of dicts.
+
+        Returns:
+            Iterator[Any]: The orders, one at a time.
+        """
+        return stream_items(
+            self.transport,
+            self.url,
+            "orders",
+            self.headers,
+            params,
+            chunk_size,
+            convert=Order.from_dict if records else None,
+        )
+
+    def to_frame(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        """
+        Retrieves every order as a typed pandas DataFrame, building the
+        columns page by page without keeping the order dicts.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the orders list.
+            items_per_page (int): Number of orders requested per page.
+
+        Returns:
+            Any: One column per order field.
+
+        Raises:
+            ConnectionError: If a page request fails.
+            ImportError: If numpy or pandas is not installed.
+        """
+        builder = ColumnarBuilder(ORDER_COLUMNS)
+        return builder.extend(self.iter_orders(params, items_per_page)).to_frame()
+
+    def to_arrow(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        """
+        Retrieves every order as a typed pyarrow Table, building the
+        columns page by page without keeping the order dicts.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the orders list.
+            items_per_page (int): Number of orders requested per page.
+
+        Returns:
+            Any: One column per order field.
+
+        Raises:
+            ConnectionError: If a page request fails.
+            ImportError: If numpy or pyarrow is not installed.
+        """
+        builder = ColumnarBuilder(ORDER_COLUMNS)
+        return builder.extend(self.iter_orders(params, items_per_page)).to_arrow()
+
     def get_order(self, order_id: int) -> Any | Dict[str, str]:
         """
         Retrieves details of a specific order by its ID.
@@ -125,7 +309,7 @@ class OrdersService:
         """
         try:
             response.raise_for_status()
-            json_response = response.json()
+            json_response = decode_response(response)
             return json_response
         except (requests.exceptions.HTTPError, json.JSONDecodeError) as e:
             print(f"Error: {e}")
@@ -165,16 +349,102 @@ class OrdersService:
 
         try:
             if method == "GET":
-                response = requests.get(url=_url, headers=_headers, params=params)
+                response = self.transport.get(
+                    url=_url, headers=_headers, params=params
+                )
             elif method == "POST":
-                response = requests.post(url=_url, headers=_headers, json=json)
+                response = self.transport.post(
+                    url=_url, headers=_headers, json=json
+                )
             elif method == "PUT":
-                response = requests.put(url=_url, headers=_headers, json=json)
+                response = self.transport.put(
+                    url=_url, headers=_headers, json=json
+                )
             elif method == "DELETE":
-                response = requests.delete(url=_url, headers=_headers)
+                response = self.transport.delete(url=_url, headers=_headers)
             else:
                 raise ValueError("Unsupported HTTP method")
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
             print(f"RequestException ({method}): {e}")
             return {"Error": str(e)}
+
+
+class AsyncOrdersService(AsyncServiceMixin, OrdersService):
+    """
+    The asyncio variant of OrdersService. Every method has the same name and
+    arguments as its synchronous counterpart and returns an awaitable.
+    Requests are sent through a shared AsyncHTTPTransport pool unless a
+    transport is passed explicitly.
+    """
+
+    def iter_orders(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        records: bool = False,
+    ) -> AsyncIterator[Any]:
+        return aiter_pages(
+            self.get_orders,
+            "orders",
+            params,
+            items_per_page,
+            convert=Order.from_dict if records else None,
+        )
+
+    async def fetch_all_orders(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        records: bool = False,
+    ) -> Dict:
+        return await afetch_all_pages(
+            self.get_orders,
+            "orders",
+            params,
+            items_per_page,
+            concurrency,
+            convert=Order.from_dict if records else None,
+        )
+
+    def stream_orders(
+        self,
+        params: Optional[Dict] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        records: bool = False,
+    ) -> AsyncIterator[Any]:
+        return astream_items(
+            self.transport,
+            self.url,
+            "orders",
+            self.headers,
+            params,
+            chunk_size,
+            convert=Order.from_dict if records else None,
+        )
+
+    async def to_frame(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        builder = ColumnarBuilder(ORDER_COLUMNS)
+        await builder.aextend(self.iter_orders(params, items_per_page))
+        return builder.to_frame()
+
+    async def to_arrow(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        builder = ColumnarBuilder(ORDER_COLUMNS)
+        await builder.aextend(self.iter_orders(params, items_per_page))
+        return builder.to_arrow()
+
+    async def count_orders(
+        self, params: Optional[Dict] = None, max_age: float = 0
+    ) -> Optional[int]:
+        return await acount_items(
+            self.get_orders, "orders", params, max_age, (self.credentials, self.url)
+        )
@@ -0,0 +1,4 @@
+from .paginate import *
+from .stream import *
+from .count import *
+from .table import *
@@ -0,0 +1,136 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from urllib.parse import urlencode
+
+from api.pagination.paginate import _check_response, page_items, total_items
+
+# Counts remembered for the max_age of the count_* methods.
+_MAX_CACHED_COUNTS = 256
+
+_counts: "OrderedDict[Tuple, Tuple[float, Optional[int]]]" = OrderedDict()
+_counts_lock = threading.Lock()
+
+
+def _count_params(params: Optional[Dict]) -> Dict:
+    count_params = dict(params or {})
+    count_params["page"] = 1
+    count_params["items_per_page"] = 1
+    return count_params
+
+
+def _memo_key(
+    cache_key: Optional[Hashable], items_key: str, count_params: Dict
+) -> Optional[Tuple]:
+    if cache_key is None:
+        return None
+    return (cache_key, items_key, urlencode(sorted(count_params.items()), doseq=True))
+
+
+def _cached_count(key: Optional[Tuple], max_age: float) -> Tuple[bool, Optional[int]]:
+    if key is None or max_age <= 0:
+        return False, None
+    with _counts_lock:
+        entry = _counts.get(key)
+        if entry is None or time.monotonic() - entry[0] > max_age:
+            return False, None
+        _counts.move_to_end(key)
+        return True, entry[1]
+
+
+def _remember_count(key: Optional[Tuple], total: Optional[int]) -> None:
+    if key is None:
+        return
+    with _counts_lock:
+        _counts[key] = (time.monotonic(), total)
+        _counts.move_to_end(key)
+        while len(_counts) > _MAX_CACHED_COUNTS:
+            _counts.popitem(last=False)
+
+
+def _total_of(response: Any, items_key: str) -> Optional[int]:
+    _check_response(response)
+    total = total_items(response)
+    if total is None and not page_items(response, items_key):
+        return 0
+    return total
+
+
+def count_items(
+    fetch_page: Callable[[Dict], Any],
+    items_key: str,
+    params: Optional[Dict] = None,
+    max_age: float = 0,
+    cache_key: Optional[Hashable] = None,
+) -> Optional[int]:
+    """
+    Returns the number of records a CS-Cart list endpoint holds, without
+    downloading them.
+
+    A single one-record page is requested and ``params.total_items`` read from
+    it. With ``max_age`` set, counts are remembered process-wide under
+    ``cache_key`` (e.g. the credentials and URL), so a page rendering its
+    header tiles on every rerun asks the store at most once per max_age.
+
+    Args:
+        fetch_page (Callable[[Dict], Any]): Fetches one page given its query
+            parameters, e.g. ``orders_service.get_orders``.
+        items_key (str): The key holding the records, e.g. 'orders'.
+        params (Optional[Dict]): Filters narrowing what is counted.
+        max_age (float): Seconds a remembered count may be reused; 0 always
+            asks the store.
+        cache_key (Optional[Hashable]): Identifies the collection and account
+            the count is remembered under.
+
+    Returns:
+        Optional[int]: The number of records, or None if the endpoint does
+        not report a total.
+
+    Raises:
+        ConnectionError: If the request fails.
+    """
+    count_params = _count_params(params)
+    key = _memo_key(cache_key, items_key, count_params)
+    hit, total = _cached_count(key, max_age)
+    if hit:
+        return total
+    total = _total_of(fetch_page(count_params), items_key)
+    _remember_count(key, total)
+    return total
+
+
+async def acount_items(
+    fetch_page: Callable[[Dict], Awaitable[Any]],
+    items_key: str,
+    params: Optional[Dict] = None,
+    max_age: float = 0,
+    cache_key: Optional[Hashable] = None,
+) -> Optional[int]:
+    """
+    The asyncio counterpart of count_items, for use with the async services.
+    """
+    count_params = _count_params(params)
+    key = _memo_key(cache_key, items_key, count_params)
+    hit, total = _cached_count(key, max_age)
+    if hit:
+        return total
+    total = _total_of(await fetch_page(count_params), items_key)
+    _remember_count(key, total)
+    return total
+
+
+def forget_counts(cache_key: Optional[Hashable] = None) -> None:
+    """
+    Drops remembered counts, e.g. after creating or deleting records.
+
+    Args:
+        cache_key (Optional[Hashable]): Only drop the counts remembered under
+            this key; None drops every count.
+    """
+    with _counts_lock:
+        if cache_key is None:
+            _counts.clear()
+            return
+        for key in [key for key in _counts if key[0] == cache_key]:
+            del _counts[key]
@@ -0,0 +1,352 @@
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from api.transport.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    AsyncAdaptiveConcurrencyLimiter,
+    arun_bulk,
+    run_bulk,
+)
+from api.transport.deadline import propagate_context
+
+# Number of records requested per page by the iter_* methods when the caller
+# does not choose one.
+DEFAULT_ITEMS_PER_PAGE = 100
+
+# Number of pages fetched at once by the fetch_all_* methods. Keep it at or
+# below the transport's pool size so every worker gets a pooled connection.
+DEFAULT_CONCURRENCY = 4
+
+
+def page_items(response: Dict, items_key: str) -> List[Dict]:
+    """
+    Extracts the records of one page from a CS-Cart list response.
+
+    Some CS-Cart endpoints return the records as an object keyed by ID rather
+    than as an array; both shapes are returned as a list.
+
+    Args:
+        response (Dict): The JSON response of a list endpoint.
+        items_key (str): The key holding the records, e.g. 'orders'.
+
+    Returns:
+        List[Dict]: The records of the page.
+    """
+    items = response.get(items_key) or []
+    if isinstance(items, dict):
+        return list(items.values())
+    return items
+
+
+def total_items(response: Dict) -> Optional[int]:
+    """
+    Reads ``params.total_items`` from a CS-Cart list response.
+
+    Args:
+        response (Dict): The JSON response of a list endpoint.
+
+    Returns:
+        Optional[int]: The total number of records, or None if not reported.
+    """
+    try:
+        return int(response["params"]["total_items"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _first_page_params(params: Optional[Dict], items_per_page: int) -> Dict:
+    page_params = dict(params or {})
+    page_params.setdefault("page", 1)
+    page_params.setdefault("items_per_page", items_per_page)
+    page_params["page"] = int(page_params["page"])
+    page_params["items_per_page"] = int(page_params["items_per_page"])
+    return page_params
+
+
+def _check_response(response: Any) -> None:
+    if not isinstance(response, dict):
+        raise ConnectionError(f"Unexpected list response: {response!r}")
+    if "Error" in response:
+        raise ConnectionError(f"Request failed: {response['Error']}")
+
+
+def _is_last_page(response: Dict, page_params: Dict, count: int) -> bool:
+    total = total_items(response)
+    if total is not None:
+        return page_params["page"] * page_params["items_per_page"] >= total
+    return count < page_params["items_per_page"]
+
+
+def iter_pages(
+    fetch_page: Callable[[Dict], Any],
+    items_key: str,
+    params: Optional[Dict] = None,
+    items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    convert: Optional[Callable[[Dict], Any]] = None,
+) -> Iterator[Any]:
+    """
+    Lazily yields every record of a paginated CS-Cart list endpoint.
+
+    Pages are requested one at a time and only after the previous page has been
+    consumed, so memory stays bounded by a single page. Iteration stops once
+    ``params.total_items`` records have been covered, or on the first short
+    page if the endpoint does not report a total.
+
+    Args:
+        fetch_page (Callable[[Dict], Any]): Fetches one page given its query
+            parameters, e.g. ``orders_service.get_orders``.
+        items_key (str): The key holding the records, e.g. 'orders'.
+        params (Optional[Dict]): Filters to send with every page request. A
+            'page' entry sets the first page to fetch.
+        items_per_page (int): Page size used unless params sets one.
+        convert (Optional[Callable[[Dict], Any]]): Applied to every record as
+            its page arrives, e.g. ``Order.from_dict``.
+
+    Yields:
+        Any: One record at a time.
+
+    Raises:
+        ConnectionError: If a page request fails.
+    """
+    page_params = _first_page_params(params, items_per_page)
+    while True:
+        response = fetch_page(dict(page_params))
+        _check_response(response)
+        items = page_items(response, items_key)
+        count = len(items)
+        last_page = count == 0 or _is_last_page(response, page_params, count)
+        # Drop the page before requesting the next one to keep one page in memory
+        del response
+        yield from items if convert is None else map(convert, items)
+        del items
+        if last_page:
+            return
+        page_params["page"] += 1
+
+
+async def aiter_pages(
+    fetch_page: Callable[[Dict], Awaitable[Any]],
+    items_key: str,
+    params: Optional[Dict] = None,
+    items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    convert: Optional[Callable[[Dict], Any]] = None,
+) -> AsyncIterator[Any]:
+    """
+    The asyncio counterpart of iter_pages, for use with the async services.
+
+    Args:
+        fetch_page (Callable[[Dict], Awaitable[Any]]): Coroutine function
+            fetching one page given its query parameters.
+        items_key (str): The key holding the records, e.g. 'orders'.
+        params (Optional[Dict]): Filters to send with every page request.
+        items_per_page (int): Page size used unless params sets one.
+        convert (Optional[Callable[[Dict], Any]]): Applied to every record as
+            its page arrives, e.g. ``Order.from_dict``.
+
+    Yields:
+        Any: One record at a time.
+
+    Raises:
+        ConnectionError: If a page request fails.
+    """
+    page_params = _first_page_params(params, items_per_page)
+    while True:
+        response = await fetch_page(dict(page_params))
+        _check_response(response)
+        items = page_items(response, items_key)
+        count = len(items)
+        last_page = count == 0 or _is_last_page(response, page_params, count)
+        del response
+        for item in items:
+            yield item if convert is None else convert(item)
+        del items
+        if last_page:
+            return
+        page_params["page"] += 1
+
+
+def _remaining_pages(response: Dict, page_params: Dict) -> List[Dict]:
+    total = total_items(response) or 0
+    last_page = math.ceil(total / page_params["items_per_page"])
+    return [
+        {**page_params, "page": page}
+        for page in range(page_params["page"] + 1, last_page + 1)
+    ]
+
+
+def _convert(items: List[Dict], convert: Optional[Callable[[Dict], Any]]) -> List:
+    # Copies the records (the response may be shared with a cache), converting
+    # them page by page so the dicts of only one page are alive at a time
+    return list(items) if convert is None else [convert(item) for item in items]
+
+
+def _extend(
+    items: List,
+    responses: Iterable[Any],
+    items_key: str,
+    convert: Optional[Callable[[Dict], Any]],
+) -> None:
+    for response in responses:
+        _check_response(response)
+        items.extend(_convert(page_items(response, items_key), convert))
+
+
+def _check_concurrency(concurrency: Any) -> None:
+    if not isinstance(concurrency, AdaptiveConcurrencyLimiter) and concurrency < 1:
+        raise ValueError("Concurrency must be at least 1")
+
+
+def _assemble(first: Dict, items_key: str, items: List[Dict]) -> Dict:
+    result = dict(first)
+    result[items_key] = items
+    return result
+
+
+def fetch_all_pages(
+    fetch_page: Callable[[Dict], Any],
+    items_key: str,
+    params: Optional[Dict] = None,
+    items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    concurrency: Union[int, AdaptiveConcurrencyLimiter] = DEFAULT_CONCURRENCY,
+    convert: Optional[Callable[[Dict], Any]] = None,
+) -> Dict:
+    """
+    Fetches every page of a CS-Cart list endpoint, requesting pages in parallel.
+
+    The first page is fetched on its own to learn ``params.total_items``; the
+    remaining pages are then fanned out over a pool of ``concurrency`` worker
+    threads and reassembled in page order. If the endpoint does not report a
+    total, the pages are walked sequentially instead.
+
+    Passing an AdaptiveConcurrencyLimiter as ``concurrency`` lets the number of
+    pages in flight grow while the store answers quickly and shrink on
+    429/5xx responses or latency spikes.
+
+    Args:
+        fetch_page (Callable[[Dict], Any]): Fetches one page given its query
+            parameters, e.g. ``orders_service.get_orders``.
+        items_key (str): The key holding the records, e.g. 'orders'.
+        params (Optional[Dict]): Filters to send with every page request.
+        items_per_page (int): Page size used unless params sets one.
+        concurrency (Union[int, AdaptiveConcurrencyLimiter]): Maximum number
+            of pages requested at once, or an adaptive limit.
+        convert (Optional[Callable[[Dict], Any]]): Applied to every record as
+            its page arrives, e.g. ``Order.from_dict``.
+
+    Returns:
+        Dict: The first page's response with ``items_key`` holding the records
+        of every page, in order.
+
+    Raises:
+        ConnectionError: If any page request fails.
+        ValueError: If concurrency is smaller than 1.
+    """
+    _check_concurrency(concurrency)
+
+    page_params = _first_page_params(params, items_per_page)
+    first = fetch_page(dict(page_params))
+    _check_response(first)
+    items = _convert(page_items(first, items_key), convert)
+
+    if total_items(first) is None:
+        if len(items) >= page_params["items_per_page"]:
+            next_params = {**page_params, "page": page_params["page"] + 1}
+            items.extend(
+                iter_pages(fetch_page, items_key, next_params, convert=convert)
+            )
+        return _assemble(first, items_key, items)
+
+    remaining = _remaining_pages(first, page_params)
+    if not remaining:
+        return _assemble(first, items_key, items)
+    if isinstance(concurrency, AdaptiveConcurrencyLimiter):
+        _extend(items, run_bulk(fetch_page, remaining, concurrency), items_key, convert)
+    else:
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(remaining))) as pool:
+            # map() yields results in submission order, i.e. page order; each
+            # page is converted while the later ones are still downloading
+            responses = pool.map(propagate_context(fetch_page), remaining)
+            _extend(items, responses, items_key, convert)
+    return _assemble(first, items_key, items)
+
+
+async def afetch_all_pages(
+    fetch_page: Callable[[Dict], Awaitable[Any]],
+    items_key: str,
+    params: Optional[Dict] = None,
+    items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    concurrency: Union[int, AsyncAdaptiveConcurrencyLimiter] = DEFAULT_CONCURRENCY,
+    convert: Optional[Callable[[Dict], Any]] = None,
+) -> Dict:
+    """
+    The asyncio counterpart of fetch_all_pages. At most ``concurrency`` page
+    requests are in flight at once on the event loop, or as many as an
+    AsyncAdaptiveConcurrencyLimiter allows.
+
+    Args:
+        fetch_page (Callable[[Dict], Awaitable[Any]]): Coroutine function
+            fetching one page given its query parameters.
+        items_key (str): The key holding the records, e.g. 'orders'.
+        params (Optional[Dict]): Filters to send with every page request.
+        items_per_page (int): Page size used unless params sets one.
+        concurrency (Union[int, AsyncAdaptiveConcurrencyLimiter]): Maximum
+            number of pages requested at once, or an adaptive limit.
+        convert (Optional[Callable[[Dict], Any]]): Applied to every record as
+            its page arrives, e.g. ``Order.from_dict``.
+
+    Returns:
+        Dict: The first page's response with ``items_key`` holding the records
+        of every page, in order.
+
+    Raises:
+        ConnectionError: If any page request fails.
+        ValueError: If concurrency is smaller than 1, or a limiter is not an
+            AsyncAdaptiveConcurrencyLimiter.
+    """
+    _check_concurrency(concurrency)
+    if isinstance(concurrency, AdaptiveConcurrencyLimiter) and not isinstance(
+        concurrency, AsyncAdaptiveConcurrencyLimiter
+    ):
+        raise ValueError("Async fetches need an AsyncAdaptiveConcurrencyLimiter")
+
+    page_params = _first_page_params(params, items_per_page)
+    first = await fetch_page(dict(page_params))
+    _check_response(first)
+    items = _convert(page_items(first, items_key), convert)
+
+    if total_items(first) is None:
+        if len(items) >= page_params["items_per_page"]:
+            next_params = {**page_params, "page": page_params["page"] + 1}
+            async for item in aiter_pages(
+                fetch_page, items_key, next_params, convert=convert
+            ):
+                items.append(item)
+        return _assemble(first, items_key, items)
+
+    remaining = _remaining_pages(first, page_params)
+    if isinstance(concurrency, AsyncAdaptiveConcurrencyLimiter):
+        responses = await arun_bulk(fetch_page, remaining, concurrency)
+    else:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page_params: Dict) -> Any:
+            async with semaphore:
+                return await fetch_page(page_params)
+
+        # gather() returns results in the order the pages were passed in
+        responses = await asyncio.gather(*(fetch(p) for p in remaining))
+    _extend(items, responses, items_key, convert)
+    return _assemble(first, items_key, items)
@@ -0,0 +1,90 @@
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
+
+import requests
+
+from api.codec import DEFAULT_CHUNK_SIZE, aiter_array_items, iter_array_items
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is only needed for async services
+    httpx = None
+
+
+def _check_status(response: Any) -> None:
+    if response.status_code >= 400:
+        raise ConnectionError(
+            f"Request failed with status code {response.status_code}"
+        )
+
+
+def stream_items(
+    transport: Any,
+    url: str,
+    items_key: str,
+    headers: Optional[Dict] = None,
+    params: Optional[Dict] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    convert: Optional[Callable[[Dict], Any]] = None,
+) -> Iterator[Any]:
+    """
+    Yields the records of one list page while its body is still being
+    received, so memory stays near a single record instead of the whole page
+    and processing overlaps with the transfer.
+
+    Args:
+        transport (HTTPTransport): The transport to send the request through.
+        url (str): The list endpoint, e.g. the service's orders URL.
+        items_key (str): The key holding the records, e.g. 'orders'.
+        headers (Optional[Dict]): Headers to send with the request.
+        params (Optional[Dict]): Filters and paging parameters.
+        chunk_size (int): Number of body bytes read at a time.
+        convert (Optional[Callable[[Dict], Any]]): Applied to every record as
+            it is parsed, e.g. ``Product.from_dict``.
+
+    Yields:
+        Any: One record at a time.
+
+    Raises:
+        ConnectionError: If the request or the transfer fails.
+        json.JSONDecodeError: If the body is malformed.
+    """
+    try:
+        response = transport.stream(url, headers=headers, params=params)
+    except requests.exceptions.RequestException as e:
+        raise ConnectionError(f"Request failed: {e}") from e
+    try:
+        _check_status(response)
+        items = iter_array_items(response.iter_content(chunk_size), items_key)
+        yield from items if convert is None else map(convert, items)
+    except requests.exceptions.RequestException as e:
+        raise ConnectionError(f"Request failed: {e}") from e
+    finally:
+        response.close()
+
+
+async def astream_items(
+    transport: Any,
+    url: str,
+    items_key: str,
+    headers: Optional[Dict] = None,
+    params: Optional[Dict] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    convert: Optional[Callable[[Dict], Any]] = None,
+) -> AsyncIterator[Any]:
+    """
+    The asyncio counterpart of stream_items, for use with AsyncHTTPTransport.
+    """
+    try:
+        response = await transport.stream(url, headers=headers, params=params)
+    except httpx.HTTPError as e:
+        raise ConnectionError(f"Request failed: {e}") from e
+    try:
+        _check_status(response)
+        async for item in aiter_array_items(
+            response.aiter_bytes(chunk_size), items_key
+        ):
+            yield item if convert is None else convert(item)
+    except httpx.HTTPError as e:
+        raise ConnectionError(f"Request failed: {e}") from e
+    finally:
+        await response.aclose()
@@ -0,0 +1,138 @@
+import math
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+from api.pagination.paginate import (
+    DEFAULT_ITEMS_PER_PAGE,
+    _check_response,
+    page_items,
+    total_items,
+)
+
+
+class TablePage(NamedTuple):
+    """
+    One page of a table view: only the records on screen, plus what is needed
+    to draw the pager.
+
+    Attributes:
+        records (List[Dict]): The records of the page.
+        page (int): The page number, starting at 1.
+        items_per_page (int): The page size.
+        total (Optional[int]): The number of matching records, or None if the
+            source does not report it.
+    """
+
+    records: List[Dict]
+    page: int
+    items_per_page: int
+    total: Optional[int]
+
+    @property
+    def page_count(self) -> Optional[int]:
+        if self.total is None:
+            return None
+        return max(1, math.ceil(self.total / self.items_per_page))
+
+    @property
+    def has_next(self) -> bool:
+        if self.total is None:
+            return len(self.records) >= self.items_per_page
+        return self.page < self.page_count
+
+
+def table_params(
+    page: int = 1,
+    items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    sort_by: Optional[str] = None,
+    descending: bool = False,
+    filters: Optional[Dict] = None,
+) -> Dict:
+    """
+    Builds the query parameters of one page of a sorted, filtered list, so
+    the store does the sorting and filtering rather than the client.
+
+    Args:
+        page (int): The page number, starting at 1.
+        items_per_page (int): The page size.
+        sort_by (Optional[str]): The CS-Cart sort field, e.g. 'price'.
+        descending (bool): Sort in descending order.
+        filters (Optional[Dict]): Extra filters, e.g. {'status': 'A'}. Empty
+            values are left out.
+
+    Returns:
+        Dict: The parameters to pass to a get_* method.
+
+    Raises:
+        ValueError: If page or items_per_page is smaller than 1.
+    """
+    if page < 1 or items_per_page < 1:
+        raise ValueError("page and items_per_page must be at least 1")
+
+    params = {k: v for k, v in (filters or {}).items() if v not in (None, "")}
+    params["page"] = page
+    params["items_per_page"] = items_per_page
+    if sort_by:
+        params["sort_by"] = sort_by
+        params["sort_order"] = "desc" if descending else "asc"
+    return params
+
+
+def _table_page(response: Any, items_key: str, params: Dict) -> TablePage:
+    _check_response(response)
+    return TablePage(
+        page_items(response, items_key),
+        params["page"],
+        params["items_per_page"],
+        total_items(response),
+    )
+
+
+def fetch_table_page(
+    fetch_page: Callable[[Dict], Any],
+    items_key: str,
+    page: int = 1,
+    items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    sort_by: Optional[str] = None,
+    descending: bool = False,
+    filters: Optional[Dict] = None,
+) -> TablePage:
+    """
+    Fetches the one page of a list endpoint a table view shows, with sorting
+    and filtering done by the store, so the cost of drawing the table does not
+    depend on how many records there are.
+
+    Args:
+        fetch_page (Callable[[Dict], Any]): Fetches one page given its query
+            parameters, e.g. ``products_service.get_products``.
+        items_key (str): The key holding the records, e.g. 'products'.
+        page (int): The page number, starting at 1.
+        items_per_page (int): The page size.
+        sort_by (Optional[str]): The CS-Cart sort field, e.g. 'price'.
+        descending (bool): Sort in descending order.
+        filters (Optional[Dict]): Extra filters, e.g. {'status': 'A'}.
+
+    Returns:
+        TablePage: The page.
+
+    Raises:
+        ConnectionError: If the request fails.
+        ValueError: If page or items_per_page is smaller than 1.
+    """
+    params = table_params(page, items_per_page, sort_by, descending, filters)
+    return _table_page(fetch_page(dict(params)), items_key, params)
+
+
+async def afetch_table_page(
+    fetch_page: Callable[[Dict], Awaitable[Any]],
+    items_key: str,
+    page: int = 1,
+    items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    sort_by: Optional[str] = None,
+    descending: bool = False,
+    filters: Optional[Dict] = None,
+) -> TablePage:
+    """
+    The asyncio counterpart of fetch_table_page.
+    """
+    params = table_params(page, items_per_page, sort_by, descending, filters)
+    return _table_page(await fetch_page(dict(params)), items_key, params)
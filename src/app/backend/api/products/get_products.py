@@ -1,8 +1,28 @@
 import json
 from urllib.parse import urljoin
 import requests
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
 from api import BASE_URL, encode_credentials
+from api.codec import DEFAULT_CHUNK_SIZE, decode_response
+from api.columnar import PRODUCT_COLUMNS, ColumnarBuilder
+from api.pagination import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_ITEMS_PER_PAGE,
+    acount_items,
+    afetch_all_pages,
+    aiter_pages,
+    astream_items,
+    count_items,
+    fetch_all_pages,
+    iter_pages,
+    stream_items,
+)
+from api.records import Product
+from api.transport import (
+    AsyncServiceMixin,
+    HTTPTransport,
+    get_default_transport,
+)
 
 
 class ProductsService:
@@ -14,13 +34,20 @@ class ProductsService:
     options.
     """
 
-    def __init__(self, vendor_email: str, vendor_api_key: str):
+    def __init__(
+        self,
+        vendor_email: str,
+        vendor_api_key: str,
+        transport: Optional[HTTPTransport] = None,
+    ):
         """
         Initializes the ProductsService with credentials for API access.
 
         Args:
             vendor_email (str): The vendor's email address.
             vendor_api_key (str): The API key associated with the vendor account.
+            transport (Optional[HTTPTransport]): Pooled transport to send requests
+                through. Defaults to the process-wide shared transport.
         """
         # Ensure both email and API key are provided
         if not vendor_email or not vendor_api_key:
@@ -28,6 +55,7 @@ class ProductsService:
 
         # Encode the credentials for HTTP Basic Authentication
         self.credentials = encode_credentials(vendor_email, vendor_api_key)
+        self.transport = transport or get_default_transport()
 
         # Construct URLs for different product-related API endpoints
         self.url = urljoin(BASE_URL, "/api/products/")
@@ -44,14 +72,167 @@ class ProductsService:
             "Authorization": f"Basic {self.credentials}",
         }
 
-    def get_products(self) -> Any | Dict[str, str]:
+    def get_products(self, params: Optional[Dict] = None) -> Any | Dict[str, str]:
         """
         Retrieves a list of products.
 
+        Args:
+            params (Optional[Dict]): Parameters to filter and paginate the products list.
+
         Returns:
             A dictionary representing the JSON response containing the list of products.
         """
-        return self._handle_request(method="GET")
+        return self._handle_request(method="GET", params=params)
+
+    def iter_products(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        records: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Lazily yields every product, fetching one page at a time.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the products list.
+            items_per_page (int): Number of products requested per page.
+            records (bool): Return Product records instead of dicts.
+
+        Returns:
+            Iterator[Any]: The products, one at a time.
+        """
+        return iter_pages(
+            self.get_products,
+            "products",
+            params,
+            items_per_page,
+            convert=Product.from_dict if records else None,
+        )
+
+    def count_products(
+        self, params: Optional[Dict] = None, max_age: float = 0
+    ) -> Optional[int]:
+        """
+        Counts the products matching the filters with a single one-product
+        request, reading the total the store reports.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the products list.
+            max_age (float): Seconds a count fetched earlier by any ProductsService
+                with the same credentials may be reused.
+
+        Returns:
+            Optional[int]: The number of products, or None if not reported.
+
+        Raises:
+            ConnectionError: If the request fails.
+        """
+        return count_items(
+            self.get_products, "products", params, max_age, (self.credentials, self.url)
+        )
+
+    def fetch_all_products(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        records: bool = False,
+    ) -> Dict:
+        """
+        Retrieves every product, fetching the pages after the first one in parallel.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the products list.
+            items_per_page (int): Number of products requested per page.
+            concurrency (int): Maximum number of pages requested at once, or an
+                AdaptiveConcurrencyLimiter to adapt it to the store's load.
+            records (bool): Return Product records instead of dicts.
+
+        Returns:
+            Dict: The first page's response with 'products' holding every product.
+        """
+        return fetch_all_pages(
+            self.get_products,
+            "products",
+            params,
+            items_per_page,
+            concurrency,
+            convert=Product.from_dict if records else None,
+        )
+
+    def stream_products(
+        self,
+        params: Optional[Dict] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        records: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Yields the products of one page while the response is still downloading,
+        parsing the body incrementally instead of buffering the whole page.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter and paginate the products list.
+            chunk_size (int): Number of body bytes read at a time.
+            records (bool): Return Product records instead of dicts.
+
+        Returns:
+            Iterator[Any]: The products, one at a time.
+        """
+        return stream_items(
+            self.transport,
+            self.url,
+            "products",
+            self.headers,
+            params,
+            chunk_size,
+            convert=Product.from_dict if records else None,
+        )
+
+    def to_frame(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        """
+        Retrieves every product as a typed pandas DataFrame, building the
+        columns page by page without keeping the product dicts.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the products list.
+            items_per_page (int): Number of products requested per page.
+
+        Returns:
+            Any: One column per product field.
+
+        Raises:
+            ConnectionError: If a page request fails.
+            ImportError: If numpy or pandas is not installed.
+        """
+        builder = ColumnarBuilder(PRODUCT_COLUMNS)
+        return builder.extend(self.iter_products(params, items_per_page)).to_frame()
+
+    def to_arrow(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        """
+        Retrieves every product as a typed pyarrow Table, building the
+        columns page by page without keeping the product dicts.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the products list.
+            items_per_page (int): Number of products requested per page.
+
+        Returns:
+            Any: One column per product field.
+
+        Raises:
+            ConnectionError: If a page request fails.
+            ImportError: If numpy or pyarrow is not installed.
+        """
+        builder = ColumnarBuilder(PRODUCT_COLUMNS)
+        return builder.extend(self.iter_products(params, items_per_page)).to_arrow()
 
     def create_product(self, payload: Dict[str, Any]) -> Any | Dict[str, int | str]:
         """
@@ -354,7 +535,7 @@ class ProductsService:
         """
         try:
             response.raise_for_status()
-            json_response = response.json()
+            json_response = decode_response(response)
             return json_response
         except (requests.exceptions.HTTPError, json.JSONDecodeError) as e:
             print(f"Error: {e}")
@@ -395,16 +576,96 @@ class ProductsService:
         # Perform the appropriate HTTP request based on the method
         try:
             if method == "GET":
-                response = requests.get(url=url, headers=headers, params=params)
+                response = self.transport.get(url=url, headers=headers, params=params)
             elif method == "POST":
-                response = requests.post(url=url, headers=headers, json=json, data=data)
+                response = self.transport.post(url=url, headers=headers, json=json, data=data)
             elif method == "PUT":
-                response = requests.put(url=url, headers=headers, json=json, data=data)
+                response = self.transport.put(url=url, headers=headers, json=json, data=data)
             elif method == "DELETE":
-                response = requests.delete(url=url, headers=headers)
+                response = self.transport.delete(url=url, headers=headers)
             else:
                 raise ValueError("Unsupported HTTP method")
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
             print(f"RequestException ({method}): {e}")
             return {"Error": str(e)}
+
+
+class AsyncProductsService(AsyncServiceMixin, ProductsService):
+    """
+    The asyncio variant of ProductsService. Every method has the same name and
+    arguments as its synchronous counterpart and returns an awaitable.
+    Requests are sent through a shared AsyncHTTPTransport pool unless a
+    transport is passed explicitly.
+    """
+
+    def iter_products(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        records: bool = False,
+    ) -> AsyncIterator[Any]:
+        return aiter_pages(
+            self.get_products,
+            "products",
+            params,
+            items_per_page,
+            convert=Product.from_dict if records else None,
+        )
+
+    async def fetch_all_products(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        records: bool = False,
+    ) -> Dict:
+        return await afetch_all_pages(
+            self.get_products,
+            "products",
+            params,
+            items_per_page,
+            concurrency,
+            convert=Product.from_dict if records else None,
+        )
+
+    def stream_products(
+        self,
+        params: Optional[Dict] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        records: bool = False,
+    ) -> AsyncIterator[Any]:
+        return astream_items(
+            self.transport,
+            self.url,
+            "products",
+            self.headers,
+            params,
+            chunk_size,
+            convert=Product.from_dict if records else None,
+        )
+
+    async def to_frame(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        builder = ColumnarBuilder(PRODUCT_COLUMNS)
+        await builder.aextend(self.iter_products(params, items_per_page))
+        return builder.to_frame()
+
+    async def to_arrow(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        builder = ColumnarBuilder(PRODUCT_COLUMNS)
+        await builder.aextend(self.iter_products(params, items_per_page))
+        return builder.to_arrow()
+
+    async def count_products(
+        self, params: Optional[Dict] = None, max_age: float = 0
+    ) -> Optional[int]:
+        return await acount_items(
+            self.get_products, "products", params, max_age, (self.credentials, self.url)
+        )
@@ -0,0 +1,243 @@
+import sys
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# A field is declared as (name, converter). Converters turn the loosely typed
+# values CS-Cart returns (numbers as strings, "" for missing) into compact
+# Python values.
+Field = Tuple[str, Callable[[Any], Any]]
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return None
+
+
+def _float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _str(value: Any) -> Optional[str]:
+    return value if isinstance(value, str) else str(value)
+
+
+def _interned(value: Any) -> Optional[str]:
+    # Status codes, user types and company names repeat across thousands of
+    # records; interning keeps a single copy of each
+    return sys.intern(value if isinstance(value, str) else str(value))
+
+
+class Record:
+    """
+    Base class of the compact record models.
+
+    Subclasses declare their fields in ``FIELDS``; ``__slots__`` is derived
+    from it, so a record has no per-instance ``__dict__`` and costs a fraction
+    of the memory of the dict it was built from. Fields CS-Cart returns that a
+    model does not declare are kept in ``extra`` (None when there are none),
+    so no data is lost.
+    """
+
+    __slots__ = ("extra",)
+    FIELDS: Tuple[Field, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._names = frozenset(name for name, _ in cls.FIELDS)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Record":
+        """
+        Builds a record from one record of a CS-Cart JSON response.
+
+        Args:
+            data (Dict): The record as decoded from JSON.
+
+        Returns:
+            Record: The typed record.
+        """
+        record = cls.__new__(cls)
+        for name, convert in cls.FIELDS:
+            value = data.get(name)
+            setattr(
+                record, name, None if value is None or value == "" else convert(value)
+            )
+        names = cls._names
+        extra = {key: value for key, value in data.items() if key not in names}
+        record.extra = extra or None
+        return record
+
+    def to_dict(self) -> Dict:
+        """
+        Returns the record as a plain dict, including the extra fields.
+        """
+        data = {name: getattr(self, name) for name, _ in self.FIELDS}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name, _ in self.FIELDS[:3]
+        )
+        return f"{type(self).__name__}({fields}, ...)"
+
+
+def _slots(fields: Tuple[Field, ...]) -> Tuple[str, ...]:
+    return tuple(name for name, _ in fields)
+
+
+class OrderItem(Record):
+    """
+    One product line of an order.
+    """
+
+    FIELDS = (
+        ("item_id", _int),
+        ("order_id", _int),
+        ("product_id", _int),
+        ("product_code", _interned),
+        ("product", _str),
+        ("price", _float),
+        ("amount", _int),
+    )
+    __slots__ = _slots(FIELDS)
+
+
+def _order_items(value: Any) -> Tuple[OrderItem, ...]:
+    # Order details list their products as an object keyed by item ID
+    items = value.values() if isinstance(value, dict) else value
+    return tuple(OrderItem.from_dict(item) for item in items)
+
+
+class Order(Record):
+    """
+    An order, as returned by the orders list and order details endpoints.
+    """
+
+    FIELDS = (
+        ("order_id", _int),
+        ("issuer_id", _int),
+        ("is_parent_order", _interned),
+        ("parent_order_id", _int),
+        ("user_id", _int),
+        ("company_id", _int),
+        ("company", _interned),
+        ("status", _interned),
+        ("timestamp", _int),
+        ("total", _float),
+        ("subtotal", _float),
+        ("firstname", _interned),
+        ("lastname", _interned),
+        ("email", _str),
+        ("phone", _str),
+        ("products", _order_items),
+    )
+    __slots__ = _slots(FIELDS)
+
+
+class Product(Record):
+    """
+    A product, as returned by the products list and product details endpoints.
+    """
+
+    FIELDS = (
+        ("product_id", _int),
+        ("product", _str),
+        ("product_code", _interned),
+        ("company_id", _int),
+        ("company_name", _interned),
+        ("status", _interned),
+        ("price", _float),
+        ("list_price", _float),
+        ("amount", _int),
+        ("main_category", _int),
+        ("timestamp", _int),
+        ("updated_timestamp", _int),
+    )
+    __slots__ = _slots(FIELDS)
+
+
+class User(Record):
+    """
+    A customer, vendor administrator or store administrator account.
+    """
+
+    FIELDS = (
+        ("user_id", _int),
+        ("user_type", _interned),
+        ("status", _interned),
+        ("firstname", _str),
+        ("lastname", _str),
+        ("email", _str),
+        ("phone", _str),
+        ("company_id", _int),
+        ("company", _interned),
+        ("lang_code", _interned),
+        ("timestamp", _int),
+    )
+    __slots__ = _slots(FIELDS)
+
+
+class Vendor(Record):
+    """
+    A marketplace vendor (CS-Cart company).
+    """
+
+    FIELDS = (
+        ("company_id", _int),
+        ("company", _interned),
+        ("status", _interned),
+        ("email", _str),
+        ("phone", _str),
+        ("lang_code", _interned),
+        ("timestamp", _int),
+    )
+    __slots__ = _slots(FIELDS)
+
+
+class Store(Record):
+    """
+    A storefront.
+    """
+
+    FIELDS = (
+        ("company_id", _int),
+        ("company", _interned),
+        ("storefront", _str),
+        ("secure_storefront", _str),
+        ("status", _interned),
+        ("email", _str),
+    )
+    __slots__ = _slots(FIELDS)
+
+
+class Shipment(Record):
+    """
+    A shipment of (part of) an order.
+    """
+
+    FIELDS = (
+        ("shipment_id", _int),
+        ("order_id", _int),
+        ("shipping_id", _int),
+        ("shipping", _interned),
+        ("carrier", _interned),
+        ("tracking_number", _str),
+        ("status", _interned),
+        ("timestamp", _int),
+        ("comments", _str),
+    )
+    __slots__ = _slots(FIELDS)
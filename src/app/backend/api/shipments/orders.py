@@ -1,15 +1,33 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 import requests
 import json
+try:
+    import httpx
+except ImportError:  # pragma: no cover - only needed by the async variants
+    httpx = None
+
 from api import BASE_URL, encode_credentials
+from api.codec import decode_response
+from api.transport import (
+    AsyncHTTPTransport,
+    HTTPTransport,
+    get_default_async_transport,
+    get_default_transport,
+)
 
 
 class OrderService:
-    def __init__(self, vendor_email: str, vendor_api_key: str):
+    def __init__(
+        self,
+        vendor_email: str,
+        vendor_api_key: str,
+        transport: Optional[HTTPTransport] = None,
+    ):
         if not vendor_email or not vendor_api_key:
             raise ValueError("Vendor email and API key must be set")
 
         self.credentials = encode_credentials(vendor_email, vendor_api_key)
+        self.transport = transport or get_default_transport()
         self.url = BASE_URL
 
     def send_auth_request(self) -> Any | Dict[str, str]:
@@ -19,7 +37,7 @@ class OrderService:
         }
 
         try:
-            response = requests.get(url=self.url, headers=headers)
+            response = self.transport.get(url=self.url, headers=headers)
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
             return {"Error": str(e)}
@@ -27,8 +45,45 @@ class OrderService:
     def _handle_response(self, response: Any) -> Dict:
         try:
             response.raise_for_status()
-            json_response = response.json()
+            json_response = decode_response(response)
             return json_response
         except (requests.exceptions.HTTPError, json.JSONDecodeError) as e:
             print(f"Error: {e}")
             return {"Error": str(e)}
+
+
+class AsyncOrderService(OrderService):
+    """
+    The asyncio variant of OrderService, sending requests through a shared
+    AsyncHTTPTransport pool.
+    """
+
+    def __init__(
+        self,
+        vendor_email: str,
+        vendor_api_key: str,
+        transport: Optional[AsyncHTTPTransport] = None,
+    ):
+        super().__init__(vendor_email, vendor_api_key)
+        self.transport = transport or get_default_async_transport()
+
+    async def send_auth_request(self) -> Any | Dict[str, str]:
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Basic {self.credentials}",
+        }
+
+        try:
+            response = await self.transport.get(url=self.url, headers=headers)
+            return self._handle_response(response)
+        except httpx.HTTPError as e:
+            return {"Error": str(e)}
+
+    def _handle_response(self, response: Any) -> Dict:
+        try:
+            response.raise_for_status()
+            json_response = decode_response(response)
+            return json_response
+        except (httpx.HTTPStatusError, json.JSONDecodeError) as e:
+            print(f"Error: {e}")
+            return {"Error": str(e)}
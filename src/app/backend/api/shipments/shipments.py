@@ -1,9 +1,23 @@
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
 from urllib.parse import urljoin
 import requests
 import json
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - only needed by the async variants
+    httpx = None
+
 from api import BASE_URL, encode_credentials
+from api.codec import decode_response
+from api.pagination import DEFAULT_ITEMS_PER_PAGE, aiter_pages, iter_pages
+from api.records import Shipment
+from api.transport import (
+    AsyncHTTPTransport,
+    HTTPTransport,
+    get_default_async_transport,
+    get_default_transport,
+)
 
 
 class ShipmentService:
@@ -19,15 +33,25 @@ class ShipmentService:
 
     Methods:
         send_auth_request(): Sends an authenticated request to retrieve shipments.
+        get_shipments(params): Retrieves one page of shipments.
+        iter_shipments(params, items_per_page, records): Lazily yields every
+            shipment.
     """
 
-    def __init__(self, vendor_email: str, vendor_api_key: str):
+    def __init__(
+        self,
+        vendor_email: str,
+        vendor_api_key: str,
+        transport: Optional[HTTPTransport] = None,
+    ):
         """
         Initializes the ShipmentService with the provided vendor email and API key.
 
         Args:
             vendor_email (str): The email of the vendor accessing the CS-Cart API.
             vendor_api_key (str): The API key associated with the vendor's account.
+            transport (Optional[HTTPTransport]): Pooled transport to send requests
+                through. Defaults to the process-wide shared transport.
 
         Raises:
             ValueError: If either vendor email or API key is not provided.
@@ -36,6 +60,7 @@ class ShipmentService:
             raise ValueError("Vendor email and API key must be set")
 
         self.credentials = encode_credentials(vendor_email, vendor_api_key)
+        self.transport = transport or get_default_transport()
         self.url = urljoin(BASE_URL, "/api/shipments")
 
     def send_auth_request(self) -> Any | Dict[str, str]:
@@ -51,11 +76,59 @@ class ShipmentService:
         }
 
         try:
-            response = requests.get(url=self.url, headers=headers)
+            response = self.transport.get(url=self.url, headers=headers)
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
             return {"Error": str(e)}
 
+    def get_shipments(self, params: Optional[Dict] = None) -> Any | Dict[str, str]:
+        """
+        Retrieves one page of shipments.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the shipments list,
+                e.g. {'order_id': 101, 'page': 2}.
+
+        Returns:
+            Any | Dict[str, str]: Response from the API with a dictionary of
+            shipments data.
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Basic {self.credentials}",
+        }
+
+        try:
+            response = self.transport.get(url=self.url, headers=headers, params=params)
+            return self._handle_response(response)
+        except requests.exceptions.RequestException as e:
+            return {"Error": str(e)}
+
+    def iter_shipments(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        records: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Lazily yields every shipment, fetching one page at a time.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the shipments list.
+            items_per_page (int): Number of shipments requested per page.
+            records (bool): Return Shipment records instead of dicts.
+
+        Returns:
+            Iterator[Any]: The shipments, one at a time.
+        """
+        return iter_pages(
+            self.get_shipments,
+            "shipments",
+            params,
+            items_per_page,
+            convert=Shipment.from_dict if records else None,
+        )
+
     def _handle_response(self, response: Any) -> Dict:
         """
         Handles the response from an API request.
@@ -68,8 +141,99 @@ class ShipmentService:
         """
         try:
             response.raise_for_status()
-            json_response = response.json()
+            json_response = decode_response(response)
             return json_response
         except (requests.exceptions.HTTPError, json.JSONDecodeError) as e:
             print(f"Error: {e}")
             return {"Error": str(e)}
+
+
+class AsyncShipmentService(ShipmentService):
+    """
+    The asyncio variant of ShipmentService, sending requests through a shared
+    AsyncHTTPTransport pool.
+    """
+
+    def __init__(
+        self,
+        vendor_email: str,
+        vendor_api_key: str,
+        transport: Optional[AsyncHTTPTransport] = None,
+    ):
+        """
+        Initializes the AsyncShipmentService with the provided vendor email and API key.
+
+        Args:
+            vendor_email (str): The email of the vendor accessing the CS-Cart API.
+            vendor_api_key (str): The API key associated with the vendor's account.
+            transport (Optional[AsyncHTTPTransport]): Async pool to send requests
+                through. Defaults to the process-wide shared async transport.
+        """
+        super().__init__(vendor_email, vendor_api_key)
+        self.transport = transport or get_default_async_transport()
+
+    async def send_auth_request(self) -> Any | Dict[str, str]:
+        """
+        Sends an authenticated GET request to retrieve shipments.
+
+        Returns:
+            Any | Dict[str, str]: The response from the API. This will be a dictionary of shipment data.
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Basic {self.credentials}",
+        }
+
+        try:
+            response = await self.transport.get(url=self.url, headers=headers)
+            return self._handle_response(response)
+        except httpx.HTTPError as e:
+            return {"Error": str(e)}
+
+    async def get_shipments(
+        self, params: Optional[Dict] = None
+    ) -> Any | Dict[str, str]:
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Basic {self.credentials}",
+        }
+
+        try:
+            response = await self.transport.get(
+                url=self.url, headers=headers, params=params
+            )
+            return self._handle_response(response)
+        except httpx.HTTPError as e:
+            return {"Error": str(e)}
+
+    def iter_shipments(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        records: bool = False,
+    ) -> AsyncIterator[Any]:
+        return aiter_pages(
+            self.get_shipments,
+            "shipments",
+            params,
+            items_per_page,
+            convert=Shipment.from_dict if records else None,
+        )
+
+    def _handle_response(self, response: Any) -> Dict:
+        """
+        Handles the response from an API request.
+
+        Args:
+            response (Any): The response object from the httpx library.
+
+        Returns:
+            Dict: Parsed JSON data from the response.
+        """
+        try:
+            response.raise_for_status()
+            json_response = decode_response(response)
+            return json_response
+        except (httpx.HTTPStatusError, json.JSONDecodeError) as e:
+            print(f"Error: {e}")
+            return {"Error": str(e)}
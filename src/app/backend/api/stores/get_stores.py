@@ -1,9 +1,24 @@
 import json
 from urllib.parse import urljoin
 import requests
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
 
 from api import BASE_URL, encode_credentials
+from api.codec import decode_response
+from api.columnar import STORE_COLUMNS, ColumnarBuilder
+from api.pagination import (
+    DEFAULT_ITEMS_PER_PAGE,
+    acount_items,
+    aiter_pages,
+    count_items,
+    iter_pages,
+)
+from api.records import Store
+from api.transport import (
+    AsyncServiceMixin,
+    HTTPTransport,
+    get_default_transport,
+)
 
 
 class StoresService:
@@ -19,13 +34,20 @@ class StoresService:
         headers (dict): Headers for API requests, including Authorization.
     """
 
-    def __init__(self, store_email: str, store_api_key: str):
+    def __init__(
+        self,
+        store_email: str,
+        store_api_key: str,
+        transport: Optional[HTTPTransport] = None,
+    ):
         """
         Initializes the service with the provided store email and API key.
 
         Args:
             store_email (str): Email of the store admin user.
             store_api_key (str): API key for the store's admin account.
+            transport (Optional[HTTPTransport]): Pooled transport to send requests
+                through. Defaults to the process-wide shared transport.
 
         Raises:
             ValueError: If store email or API key is missing.
@@ -34,6 +56,7 @@ class StoresService:
             raise ValueError("Store email and API key must be set")
 
         self.credentials = encode_credentials(store_email, store_api_key)
+        self.transport = transport or get_default_transport()
         self.url = urljoin(BASE_URL, "/api/stores/")
         self.shipping_url = urljoin(BASE_URL, "/api/shippings/")
         self.headers = {
@@ -53,6 +76,99 @@ class StoresService:
         """
         return self._handle_request(method="GET", params=params)
 
+    def iter_stores(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        records: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Lazily yields every store, fetching one page at a time.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the stores list.
+            items_per_page (int): Number of stores requested per page.
+            records (bool): Return Store records instead of dicts.
+
+        Returns:
+            Iterator[Any]: The stores, one at a time.
+        """
+        return iter_pages(
+            self.get_stores,
+            "stores",
+            params,
+            items_per_page,
+            convert=Store.from_dict if records else None,
+        )
+
+    def count_stores(
+        self, params: Optional[Dict] = None, max_age: float = 0
+    ) -> Optional[int]:
+        """
+        Counts the stores matching the filters with a single one-store
+        request, reading the total the store reports.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the stores list.
+            max_age (float): Seconds a count fetched earlier by any StoresService
+                with the same credentials may be reused.
+
+        Returns:
+            Optional[int]: The number of stores, or None if not reported.
+
+        Raises:
+            ConnectionError: If the request fails.
+        """
+        return count_items(
+            self.get_stores, "stores", params, max_age, (self.credentials, self.url)
+        )
+
+    def to_frame(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        """
+        Retrieves every store as a typed pandas DataFrame, building the
+        columns page by page without keeping the store dicts.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the stores list.
+            items_per_page (int): Number of stores requested per page.
+
+        Returns:
+            Any: One column per store field.
+
+        Raises:
+            ConnectionError: If a page request fails.
+            ImportError: If numpy or pandas is not installed.
+        """
+        builder = ColumnarBuilder(STORE_COLUMNS)
+        return builder.extend(self.iter_stores(params, items_per_page)).to_frame()
+
+    def to_arrow(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        """
+        Retrieves every store as a typed pyarrow Table, building the
+        columns page by page without keeping the store dicts.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the stores list.
+            items_per_page (int): Number of stores requested per page.
+
+        Returns:
+            Any: One column per store field.
+
+        Raises:
+            ConnectionError: If a page request fails.
+            ImportError: If numpy or pyarrow is not installed.
+        """
+        builder = ColumnarBuilder(STORE_COLUMNS)
+        return builder.extend(self.iter_stores(params, items_per_page)).to_arrow()
+
     def get_store(self, store_id: int) -> Any | Dict[str, str]:
         """
         Retrieves details of a specific store by its ID.
@@ -193,7 +309,7 @@ class StoresService:
         """
         try:
             response.raise_for_status()
-            json_response = response.json()
+            json_response = decode_response(response)
             return json_response
         except (requests.exceptions.HTTPError, json.JSONDecodeError) as e:
             print(f"Error: {e}")
@@ -235,22 +351,70 @@ class StoresService:
 
         try:
             if method == "GET":
-                response = requests.get(
+                response = self.transport.get(
                     url=_url, headers=_headers, params=params, data=data
                 )
             elif method == "POST":
-                response = requests.post(
+                response = self.transport.post(
                     url=_url, headers=_headers, json=json, data=data
                 )
             elif method == "PUT":
-                response = requests.put(
+                response = self.transport.put(
                     url=_url, headers=_headers, json=json, data=data
                 )
             elif method == "DELETE":
-                response = requests.delete(url=_url, headers=_headers)
+                response = self.transport.delete(url=_url, headers=_headers)
             else:
                 raise ValueError("Unsupported HTTP method")
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
             print(f"RequestException ({method}): {e}")
             return {"Error": str(e)}
+
+
+class AsyncStoresService(AsyncServiceMixin, StoresService):
+    """
+    The asyncio variant of StoresService. Every method has the same name and
+    arguments as its synchronous counterpart and returns an awaitable.
+    Requests are sent through a shared AsyncHTTPTransport pool unless a
+    transport is passed explicitly.
+    """
+
+    def iter_stores(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        records: bool = False,
+    ) -> AsyncIterator[Any]:
+        return aiter_pages(
+            self.get_stores,
+            "stores",
+            params,
+            items_per_page,
+            convert=Store.from_dict if records else None,
+        )
+
+    async def to_frame(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        builder = ColumnarBuilder(STORE_COLUMNS)
+        await builder.aextend(self.iter_stores(params, items_per_page))
+        return builder.to_frame()
+
+    async def to_arrow(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        builder = ColumnarBuilder(STORE_COLUMNS)
+        await builder.aextend(self.iter_stores(params, items_per_page))
+        return builder.to_arrow()
+
+    async def count_stores(
+        self, params: Optional[Dict] = None, max_age: float = 0
+    ) -> Optional[int]:
+        return await acount_items(
+            self.get_stores, "stores", params, max_age, (self.credentials, self.url)
+        )
@@ -0,0 +1,8 @@
+from .http_transport import *
+from .async_transport import *
+from .coalesce import *
+from .retry import *
+from .rate_limit import *
+from .concurrency import *
+from .deadline import *
+from .hedge import *
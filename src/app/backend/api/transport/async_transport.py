@@ -0,0 +1,508 @@
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from api.cache import ResponseCache, ValidatorCache, cache_key, disk_cache_from_env
+from api.codec import decode_response
+from api.transport.coalesce import AsyncSingleFlight
+from api.transport.deadline import (
+    call_deadline,
+    cap_timeout,
+    deadline_allows,
+    time_remaining,
+)
+from api.transport.hedge import HedgePolicy
+from api.transport.rate_limit import RateLimiterRegistry, rate_limiters
+from api.transport.retry import RetryPolicy, TransportMetrics
+from api.transport.http_transport import DEFAULT_TIMEOUT, _encode_json
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is only needed for async services
+    httpx = None
+
+# Default limits for the async pool. One event loop can keep this many CS-Cart
+# calls in flight at once; idle connections beyond the keep-alive limit are closed.
+DEFAULT_MAX_CONNECTIONS = 200
+DEFAULT_MAX_KEEPALIVE = 50
+
+
+class AsyncHTTPTransport:
+    """
+    The asyncio counterpart of HTTPTransport, backed by an ``httpx.AsyncClient``
+    connection pool.
+
+    The client is created lazily inside the running event loop, so the same
+    transport can be shared by every async service of a process. If it is later
+    used from a different event loop (e.g. a second ``asyncio.run``), a fresh
+    pool is opened for that loop.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        cache: Optional[ResponseCache] = None,
+        validators: Optional[ValidatorCache] = None,
+        coalesce: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        rate_limits: Optional[RateLimiterRegistry] = None,
+        deadline: Optional[float] = None,
+        hedge: Optional[HedgePolicy] = None,
+    ):
+        """
+        Initializes the transport.
+
+        Args:
+            max_connections (int): Maximum number of concurrent connections.
+            max_keepalive_connections (int): Idle connections kept open for reuse.
+            timeout (Tuple[float, float]): Default (connect, read) timeouts in seconds.
+            cache (Optional[ResponseCache]): Serves repeated GETs from memory, or
+                from disk with a DiskResponseCache, and is invalidated by writes
+                sent through this transport.
+            validators (Optional[ValidatorCache]): Revalidates repeat GETs with
+                If-None-Match/If-Modified-Since and serves the stored body on a 304.
+            coalesce (bool): Share one in-flight request between concurrent callers
+                asking for the same URL, parameters and credentials.
+            retry (Optional[RetryPolicy]): How failed requests are retried. Defaults
+                to RetryPolicy(), which retries GET, PUT and DELETE.
+            rate_limits (Optional[RateLimiterRegistry]): Per-credential token buckets
+                every attempt waits on. Defaults to the process-wide registry.
+            deadline (Optional[float]): Time budget, in seconds, of every call
+                including its retries. A shorter call_deadline() still applies.
+            hedge (Optional[HedgePolicy]): Sends a duplicate of a GET that is
+                slower than its endpoint's p95 and keeps the first response.
+
+        Raises:
+            ImportError: If httpx is not installed.
+            ValueError: If a pool limit is smaller than 1.
+        """
+        if httpx is None:
+            raise ImportError("httpx must be installed to use the async services")
+        if max_connections < 1 or max_keepalive_connections < 1:
+            raise ValueError("Pool limits must be at least 1")
+
+        self.timeout = timeout
+        self.cache = cache
+        self.validators = validators
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limits = rate_limits if rate_limits is not None else rate_limiters
+        self.metrics = TransportMetrics()
+        self.deadline = deadline
+        self.hedge = hedge
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._in_flight = 0
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _to_httpx_timeout(self, timeout: Any) -> "httpx.Timeout":
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """
+        Returns the pooled client bound to the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                limits=self.limits, timeout=self._to_httpx_timeout(self.timeout)
+            )
+            self._loop = loop
+        return self._client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        timeout: Optional[Any] = None,
+    ) -> "httpx.Response":
+        """
+        Sends an HTTP request over the pooled async client, with the same
+        caching, revalidation and coalescing behaviour as HTTPTransport.request.
+
+        Args:
+            method (str): The HTTP method to use ('GET', 'POST', etc.).
+            url (str): The URL to send the request to.
+            headers (Optional[Dict]): Headers to send with the request.
+            params (Optional[Dict]): Query parameters to append to the URL.
+            json (Optional[Any]): A JSON payload to send with the request.
+            data (Optional[Any]): Form data, or a pre-encoded str/bytes body.
+            timeout (Optional[Any]): Overrides the transport's default timeout.
+
+        Returns:
+            httpx.Response: The raw HTTP response, or a CachedResponse on a
+            cache hit.
+        """
+        if method != "GET":
+            if json is not None:
+                headers, data, json = _encode_json(headers, json)
+            response = await self._send(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                json=json,
+                data=data,
+                timeout=timeout,
+            )
+            if self.cache is not None:
+                self.cache.invalidate(url)
+            return response
+
+        key = cache_key(url, params, headers)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self.single_flight is not None:
+            return await self.single_flight.do(
+                key, lambda: self._fetch(key, url, headers, params, timeout)
+            )
+        return await self._fetch(key, url, headers, params, timeout)
+
+    async def _fetch(
+        self,
+        key: Tuple,
+        url: str,
+        headers: Optional[Dict],
+        params: Optional[Dict],
+        timeout: Optional[Any],
+    ) -> Any:
+        # Sends a GET that missed the cache, revalidating and caching the result
+        stored = None
+        if self.validators is not None:
+            stored, headers = self.validators.prepare(key, headers)
+
+        if self.hedge is not None:
+            response = await self._send_hedged(
+                url, headers=headers, params=params, timeout=timeout
+            )
+        else:
+            response = await self._send(
+                "GET", url, headers=headers, params=params, timeout=timeout
+            )
+
+        if self.validators is not None:
+            response = self.validators.resolve(key, stored, response)
+        if self.cache is not None:
+            self.cache.set(key, response)
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: Optional[Any] = None,
+        timeout: Optional[Any] = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> "httpx.Response":
+        content = None
+        if isinstance(data, (str, bytes)):
+            content, data = data, None
+        retries = self.retry.retries_for(method)
+        limiter = self.rate_limits.limiter_for_headers(kwargs.get("headers"))
+        attempt = 0
+        with call_deadline(self.deadline):
+            while True:
+                if limiter is not None:
+                    # Never wait on the bucket past the call's deadline
+                    waited = await limiter.acquire_async(timeout=time_remaining())
+                    if waited is None:
+                        self.metrics.increment(method, "failures")
+                        raise httpx.TimeoutException(
+                            f"Deadline exceeded waiting for the rate limit: {url}"
+                        )
+                    if waited:
+                        self.metrics.increment(method, "throttled")
+                remaining = time_remaining()
+                if remaining is not None and remaining <= 0:
+                    self.metrics.increment(method, "failures")
+                    raise httpx.TimeoutException(
+                        f"Deadline exceeded for {method} {url}"
+                    )
+                self.metrics.increment(method, "requests")
+                start = time.monotonic()
+                request_kwargs = dict(
+                    data=data,
+                    content=content,
+                    timeout=self._to_httpx_timeout(
+                        cap_timeout(timeout or self.timeout, remaining)
+                    ),
+                    **kwargs,
+                )
+                try:
+                    response = await self._request(
+                        method, url, stream, **request_kwargs
+                    )
+                except httpx.TransportError:
+                    delay = self.retry.backoff(attempt)
+                    if attempt >= retries or not deadline_allows(delay):
+                        self.metrics.increment(method, "failures")
+                        raise
+                else:
+                    if self.hedge is not None and method == "GET" and not stream:
+                        self.hedge.observe(url, time.monotonic() - start)
+                    if not self.retry.should_retry(response.status_code):
+                        return response
+                    delay = self.retry.backoff(attempt, response)
+                    if attempt >= retries or not deadline_allows(delay):
+                        self.metrics.increment(method, "failures")
+                        return response
+                    if stream:
+                        await response.aclose()
+
+                attempt += 1
+                self.metrics.increment(method, "retries")
+                await asyncio.sleep(delay)
+
+    async def _request(
+        self, method: str, url: str, stream: bool, **kwargs: Any
+    ) -> "httpx.Response":
+        # Sends one attempt, counting it against the connection pool
+        self._in_flight += 1
+        try:
+            if stream:
+                request = self.client.build_request(method, url, **kwargs)
+                return await self.client.send(request, stream=True)
+            return await self.client.request(method, url, **kwargs)
+        finally:
+            self._in_flight -= 1
+
+    async def _send_hedged(self, url: str, **kwargs: Any) -> "httpx.Response":
+        # Sends a GET and, if it is still outstanding after the endpoint's p95
+        # latency, a duplicate of it; the first successful response wins and
+        # the other request is cancelled. Duplicates are capped by the policy's
+        # max_hedges and skipped while every pooled connection is busy.
+        with call_deadline(self.deadline):
+            delay = self.hedge.hedge_delay(url)
+            if delay is None:
+                return await self._send("GET", url, **kwargs)
+
+            primary = asyncio.ensure_future(self._send("GET", url, **kwargs))
+            tasks = [primary]
+            try:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if done:
+                    return primary.result()
+
+                if (
+                    self._in_flight >= self.limits.max_connections
+                    or not self.hedge.start_hedge()
+                ):
+                    self.metrics.increment("GET", "hedges_skipped")
+                    return await primary
+                self.metrics.increment("GET", "hedged")
+                hedged = asyncio.ensure_future(self._send("GET", url, **kwargs))
+                hedged.add_done_callback(self.hedge.finish_hedge)
+                tasks.append(hedged)
+                pending = set(tasks)
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        if task.exception() is None:
+                            if task is hedged:
+                                self.metrics.increment("GET", "hedge_wins")
+                            return task.result()
+                return primary.result()
+            finally:
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+
+    async def stream(
+        self,
+        url: str,
+        *,
+        headers: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        timeout: Optional[Any] = None,
+    ) -> "httpx.Response":
+        """
+        Sends a GET whose body is read incrementally, bypassing the cache.
+
+        Args:
+            url (str): The URL to send the request to.
+            headers (Optional[Dict]): Headers to send with the request.
+            params (Optional[Dict]): Query parameters to append to the URL.
+            timeout (Optional[Any]): Overrides the transport's default timeout.
+
+        Returns:
+            httpx.Response: A response whose body has not been read yet; iterate
+            ``aiter_bytes()`` and close it with ``aclose()``.
+        """
+        return await self._send(
+            "GET", url, headers=headers, params=params, timeout=timeout, stream=True
+        )
+
+    async def get(self, url: str, **kwargs: Any) -> "httpx.Response":
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> "httpx.Response":
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> "httpx.Response":
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> "httpx.Response":
+        return await self.request("DELETE", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """
+        Closes every pooled connection held by the transport.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+    async def __aenter__(self) -> "AsyncHTTPTransport":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+_default_async_transport: Optional[AsyncHTTPTransport] = None
+_default_async_transport_lock = threading.Lock()
+
+
+def get_default_async_transport() -> AsyncHTTPTransport:
+    """
+    Returns the process-wide async transport shared by async services that were
+    not given one explicitly, creating it on first use.
+    When CSCART_CACHE_PATH is set, its GETs are cached on disk (see
+    disk_cache_from_env).
+
+    Returns:
+        AsyncHTTPTransport: The shared async transport.
+    """
+    global _default_async_transport
+    with _default_async_transport_lock:
+        if _default_async_transport is None:
+            _default_async_transport = AsyncHTTPTransport(cache=disk_cache_from_env())
+        return _default_async_transport
+
+
+def set_default_async_transport(transport: AsyncHTTPTransport) -> None:
+    """
+    Replaces the process-wide async transport.
+
+    Args:
+        transport (AsyncHTTPTransport): The transport to share.
+    """
+    global _default_async_transport
+    with _default_async_transport_lock:
+        _default_async_transport = transport
+
+
+class AsyncServiceMixin:
+    """
+    Turns a synchronous service class into its asyncio variant.
+
+    The service classes build every request through ``_handle_request``, so
+    overriding it with a coroutine gives each public method an awaitable
+    counterpart with the same name and signature, e.g.::
+
+        class AsyncOrdersService(AsyncServiceMixin, OrdersService):
+            pass
+
+        orders = await AsyncOrdersService(email, api_key).get_orders()
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        transport: Optional[AsyncHTTPTransport] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.transport = transport or get_default_async_transport()
+
+    def _handle_response(self, response: Any) -> Dict:
+        """
+        Handles the HTTP response, converting it to a JSON dictionary.
+        Captures and reports errors.
+
+        Args:
+            response (Any): The httpx response object to handle.
+
+        Returns:
+            A dictionary representing the JSON response.
+        """
+        try:
+            response.raise_for_status()
+            json_response = decode_response(response)
+            return json_response
+        except (httpx.HTTPStatusError, json.JSONDecodeError) as e:
+            print(f"Error: {e}")
+            return {"Error": str(e)}
+
+    async def _handle_request(
+        self,
+        *,
+        url: Optional[str] = None,
+        method: Optional[str] = None,
+        headers: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+    ) -> Any | Dict[str, int | str]:
+        """
+        Performs an HTTP request with the specified parameters.
+
+        Args:
+            url (Optional[str]): The URL to send the request to.
+            method (Optional[str]): The HTTP method to use ('GET', 'POST', etc.).
+            headers (Optional[Dict]): Additional headers to send with the request.
+            json (Optional[Dict]): A JSON payload to send with the request.
+            data (Optional[Dict]): Data to send in the body of the request.
+            params (Optional[Dict]): Query parameters to append to the request URL.
+
+        Returns:
+            A dictionary representing the JSON response.
+        """
+        _url = url or self.url
+        _headers = headers or self.headers
+
+        try:
+            if method == "GET":
+                response = await self.transport.get(
+                    url=_url, headers=_headers, params=params
+                )
+            elif method == "POST":
+                response = await self.transport.post(
+                    url=_url, headers=_headers, json=json, data=data
+                )
+            elif method == "PUT":
+                response = await self.transport.put(
+                    url=_url, headers=_headers, json=json, data=data
+                )
+            elif method == "DELETE":
+                response = await self.transport.delete(url=_url, headers=_headers)
+            else:
+                raise ValueError("Unsupported HTTP method")
+            return self._handle_response(response)
+        except httpx.HTTPError as e:
+            print(f"RequestException ({method}): {e}")
+            return {"Error": str(e)}
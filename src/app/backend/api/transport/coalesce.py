@@ -0,0 +1,97 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls into one.
+
+    While a call for a key is in flight, every other thread asking for the same
+    key waits for it and receives its result (or exception) instead of
+    starting a call of its own. Once the call completes the key is forgotten,
+    so later calls run again.
+
+    Attributes:
+        coalesced (int): Number of calls that were served by another caller's
+            in-flight call.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Runs fn for key, or joins the call already in flight for key.
+
+        Args:
+            key (Hashable): Identifies equivalent calls.
+            fn (Callable[[], Any]): Performs the call.
+
+        Returns:
+            Any: The result of the (possibly shared) call.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return future.result()
+
+
+class AsyncSingleFlight:
+    """
+    The asyncio counterpart of SingleFlight: coroutines awaiting the same key
+    share one in-flight call.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Awaits fn for key, or joins the call already in flight for key.
+
+        Args:
+            key (Hashable): Identifies equivalent calls.
+            fn (Callable[[], Awaitable[Any]]): Coroutine function performing the call.
+
+        Returns:
+            Any: The result of the (possibly shared) call.
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            # shield() keeps one cancelled follower from cancelling the leader
+            return await asyncio.shield(future)
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fn()
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else is waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
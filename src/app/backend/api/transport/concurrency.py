@@ -0,0 +1,276 @@
+import asyncio
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Awaitable, Callable, Iterable, List, Optional
+
+from api.transport.deadline import propagate_context
+
+# Leading status code of the error strings built from HTTPError messages, e.g.
+# "429 Client Error: Too Many Requests for url: ...".
+_STATUS_PATTERN = re.compile(r"^\s*(\d{3})\b")
+
+
+def is_overloaded(result: Any) -> bool:
+    """
+    Returns True if a service call result signals that the store is overloaded:
+    an exception, a 429 or a 5xx error, as reported by the services' error
+    dictionaries. Other errors (e.g. 404) say nothing about load.
+
+    Args:
+        result (Any): The value returned (or exception raised) by a service call.
+
+    Returns:
+        bool: Whether the concurrency should be cut.
+    """
+    if isinstance(result, BaseException):
+        return True
+    if isinstance(result, dict) and "Error" in result:
+        match = _STATUS_PATTERN.match(str(result["Error"]))
+        if match is None:
+            # Connection errors and timeouts carry no status code
+            return True
+        status = int(match.group(1))
+        return status == 429 or status >= 500
+    return False
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    An AIMD (additive increase, multiplicative decrease) concurrency limit for
+    bulk operations.
+
+    Each completed call reports its latency and whether the store looked
+    overloaded. While calls succeed with healthy latency, the limit grows by
+    ``increase`` per full window of calls (i.e. roughly +1 per round trip);
+    on a 429/5xx, a connection failure or a latency spike it is multiplied by
+    ``decrease``. The limit therefore settles near what the store can handle.
+
+    A latency spike is a latency above ``latency_threshold`` if one is given,
+    otherwise above ``latency_tolerance`` times the smoothed baseline latency.
+
+    Attributes:
+        limit (float): The current concurrency limit.
+        in_flight (int): Calls currently holding a slot.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_threshold: Optional[float] = None,
+        latency_tolerance: float = 2.0,
+    ):
+        """
+        Initializes the limiter.
+
+        Args:
+            initial (int): Starting concurrency limit.
+            min_limit (int): The limit never drops below this.
+            max_limit (int): The limit never grows beyond this.
+            increase (float): Additive increase per window of healthy calls.
+            decrease (float): Multiplicative factor applied on overload.
+            latency_threshold (Optional[float]): Absolute latency, in seconds,
+                above which a call counts as a spike.
+            latency_tolerance (float): Multiple of the baseline latency above
+                which a call counts as a spike when no threshold is given.
+
+        Raises:
+            ValueError: If the limits or factors are inconsistent.
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial <= max_limit")
+        if not 0 < decrease < 1 or increase <= 0:
+            raise ValueError("decrease must be in (0, 1) and increase positive")
+
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_threshold = latency_threshold
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self._baseline: Optional[float] = None
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def _is_spike(self, latency: float) -> bool:
+        if self.latency_threshold is not None:
+            return latency > self.latency_threshold
+        return (
+            self._baseline is not None
+            and latency > self._baseline * self.latency_tolerance
+        )
+
+    def _update(self, latency: float, overloaded: bool) -> None:
+        # Called with the condition held
+        now = time.monotonic()
+        if overloaded or self._is_spike(latency):
+            # Cut at most once per round trip, so one burst of failures from
+            # the same window does not collapse the limit to the minimum
+            if now - self._last_decrease >= (self._baseline or latency):
+                self.limit = max(self.min_limit, self.limit * self.decrease)
+                self._last_decrease = now
+        else:
+            self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+        if not overloaded:
+            self._baseline = (
+                latency
+                if self._baseline is None
+                else 0.9 * self._baseline + 0.1 * latency
+            )
+
+    def acquire(self) -> None:
+        """
+        Blocks until a slot is free under the current limit.
+        """
+        with self._condition:
+            self._condition.wait_for(self._has_capacity)
+            self.in_flight += 1
+
+    def release(self, latency: float, overloaded: bool = False) -> None:
+        """
+        Frees a slot and adapts the limit to the call's outcome.
+
+        Args:
+            latency (float): Duration of the call in seconds.
+            overloaded (bool): Whether the call hit a 429/5xx or failed.
+        """
+        with self._condition:
+            self.in_flight -= 1
+            self._update(latency, overloaded)
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """
+        Holds a slot for the duration of the block, reporting the block's
+        latency on exit. Call ``report(result)`` on the yielded object to
+        classify the outcome; exceptions count as overload.
+        """
+        outcome = _Outcome()
+        self.acquire()
+        start = time.monotonic()
+        try:
+            yield outcome
+        except BaseException:
+            outcome.overloaded = True
+            raise
+        finally:
+            self.release(time.monotonic() - start, outcome.overloaded)
+
+
+class AsyncAdaptiveConcurrencyLimiter(AdaptiveConcurrencyLimiter):
+    """
+    The asyncio counterpart of AdaptiveConcurrencyLimiter, waiting for a slot
+    on the event loop instead of blocking a thread.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._async_condition: Optional[asyncio.Condition] = None
+
+    @property
+    def _waiters(self) -> asyncio.Condition:
+        if self._async_condition is None:
+            self._async_condition = asyncio.Condition()
+        return self._async_condition
+
+    async def acquire_async(self) -> None:
+        async with self._waiters:
+            await self._waiters.wait_for(self._has_capacity)
+            self.in_flight += 1
+
+    async def release_async(self, latency: float, overloaded: bool = False) -> None:
+        async with self._waiters:
+            self.in_flight -= 1
+            self._update(latency, overloaded)
+            self._waiters.notify_all()
+
+    @asynccontextmanager
+    async def slot_async(self):
+        outcome = _Outcome()
+        await self.acquire_async()
+        start = time.monotonic()
+        try:
+            yield outcome
+        except BaseException:
+            outcome.overloaded = True
+            raise
+        finally:
+            await self.release_async(time.monotonic() - start, outcome.overloaded)
+
+
+class _Outcome:
+    __slots__ = ("overloaded",)
+
+    def __init__(self):
+        self.overloaded = False
+
+    def report(self, result: Any) -> Any:
+        self.overloaded = is_overloaded(result)
+        return result
+
+
+def run_bulk(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+) -> List[Any]:
+    """
+    Calls fn for every item in parallel under an adaptive concurrency limit
+    and returns the results in item order.
+
+    Args:
+        fn (Callable[[Any], Any]): A service call, e.g. ``orders_service.get_order``.
+        items (Iterable[Any]): The arguments to call fn with, one call each.
+        limiter (Optional[AdaptiveConcurrencyLimiter]): The limit to run under.
+            Defaults to a fresh AdaptiveConcurrencyLimiter().
+
+    Returns:
+        List[Any]: fn's results, in the order of items.
+    """
+    limiter = limiter or AdaptiveConcurrencyLimiter()
+
+    def call(item: Any) -> Any:
+        with limiter.slot() as outcome:
+            return outcome.report(fn(item))
+
+    with ThreadPoolExecutor(max_workers=limiter.max_limit) as pool:
+        # Run every call in the caller's context, so a call_deadline() applies
+        return list(pool.map(propagate_context(call), items))
+
+
+async def arun_bulk(
+    fn: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    limiter: Optional[AsyncAdaptiveConcurrencyLimiter] = None,
+) -> List[Any]:
+    """
+    The asyncio counterpart of run_bulk.
+
+    Args:
+        fn (Callable[[Any], Awaitable[Any]]): An async service call.
+        items (Iterable[Any]): The arguments to call fn with, one call each.
+        limiter (Optional[AsyncAdaptiveConcurrencyLimiter]): The limit to run
+            under. Defaults to a fresh AsyncAdaptiveConcurrencyLimiter().
+
+    Returns:
+        List[Any]: fn's results, in the order of items.
+    """
+    limiter = limiter or AsyncAdaptiveConcurrencyLimiter()
+
+    async def call(item: Any) -> Any:
+        async with limiter.slot_async() as outcome:
+            return outcome.report(await fn(item))
+
+    return await asyncio.gather(*(call(item) for item in items))
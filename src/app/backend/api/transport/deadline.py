@@ -0,0 +1,111 @@
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+import requests
+
+# Absolute time.monotonic() by which the current call must complete, or None.
+# A ContextVar follows the call into asyncio tasks, and into worker threads
+# started through propagate_context.
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "cs_cart_deadline", default=None
+)
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """
+    Raised when a call's deadline expires before a response was received.
+
+    It subclasses requests' Timeout, so the services report it like any other
+    failed request.
+    """
+
+
+@contextmanager
+def call_deadline(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Gives every request sent within the block a shared time budget.
+
+    The budget covers all attempts of a request, including rate limiting waits
+    and retry backoff: each attempt's timeout is capped to the time left, and
+    no retry is started that could not finish in time. Nested deadlines can
+    only shorten the budget, never extend it::
+
+        with call_deadline(2.0):
+            order = orders_service.get_order(order_id)
+
+    Args:
+        seconds (Optional[float]): The budget in seconds; None leaves the
+            current deadline (if any) unchanged.
+
+    Yields:
+        Optional[float]: The effective deadline as a time.monotonic() value.
+    """
+    if seconds is None:
+        yield _deadline.get()
+        return
+
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires = min(expires, current)
+    token = _deadline.set(expires)
+    try:
+        yield expires
+    finally:
+        _deadline.reset(token)
+
+
+def time_remaining() -> Optional[float]:
+    """
+    Returns the seconds left before the current deadline, or None if no
+    deadline is set. The value is negative once the deadline has passed.
+    """
+    expires = _deadline.get()
+    if expires is None:
+        return None
+    return expires - time.monotonic()
+
+
+def deadline_allows(delay: float) -> bool:
+    """
+    Returns True if sleeping ``delay`` seconds leaves time for another attempt.
+    """
+    remaining = time_remaining()
+    return remaining is None or delay < remaining
+
+
+def cap_timeout(timeout: Any, remaining: Optional[float]) -> Any:
+    """
+    Caps a requests-style timeout (a number or a (connect, read) tuple) to the
+    time left before the deadline.
+
+    Args:
+        timeout (Any): The timeout the request would otherwise use.
+        remaining (Optional[float]): Seconds left, as returned by time_remaining.
+
+    Returns:
+        Any: The capped timeout, in the same shape.
+    """
+    if remaining is None:
+        return timeout
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, tuple):
+        return tuple(min(value, remaining) for value in timeout)
+    return min(timeout, remaining)
+
+
+def propagate_context(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wraps fn so that it runs in a copy of the caller's context, e.g. to carry
+    the current deadline into a ThreadPoolExecutor worker.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        # A context cannot be entered by two threads at once, so copy it per call
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
@@ -0,0 +1,143 @@
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional
+
+from api.cache import endpoint_of
+
+# Latency samples kept per endpoint to estimate the hedging delay.
+DEFAULT_WINDOW = 200
+
+# Samples needed before an endpoint is hedged at all.
+DEFAULT_MIN_SAMPLES = 20
+
+# Duplicate requests allowed in flight at once, across every endpoint.
+DEFAULT_MAX_HEDGES = 2
+
+
+class HedgePolicy:
+    """
+    Decides when a slow GET gets a duplicate ("hedged") request.
+
+    The policy keeps a sliding window of attempt latencies per endpoint. Once
+    an attempt has been outstanding longer than the endpoint's ``quantile``
+    latency (p95 by default), the transport sends a second, identical request
+    and uses whichever response arrives first. This trims the latency tail at
+    the cost of roughly ``1 - quantile`` extra requests. At most ``max_hedges``
+    duplicates are in flight at once, so a slow store is not sent twice the
+    traffic just when it can least take it.
+
+    Attributes:
+        quantile (float): Latency quantile after which a request is hedged.
+        min_samples (int): Samples required before an endpoint is hedged.
+        min_delay (float): Lower bound for the hedging delay, in seconds.
+        endpoints (Optional[FrozenSet[str]]): Endpoints eligible for hedging,
+            e.g. '/api/orders/'; None hedges every GET.
+        max_hedges (int): Duplicate requests allowed in flight at once.
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        window: int = DEFAULT_WINDOW,
+        min_delay: float = 0.01,
+        endpoints: Optional[Iterable[str]] = None,
+        max_hedges: int = DEFAULT_MAX_HEDGES,
+    ):
+        """
+        Initializes the policy.
+
+        Args:
+            quantile (float): Latency quantile after which a request is hedged.
+            min_samples (int): Samples required before an endpoint is hedged.
+            window (int): Latency samples kept per endpoint.
+            min_delay (float): Lower bound for the hedging delay, in seconds.
+            endpoints (Optional[Iterable[str]]): Endpoints eligible for hedging.
+            max_hedges (int): Duplicate requests allowed in flight at once.
+
+        Raises:
+            ValueError: If quantile is not between 0 and 1, or max_hedges is
+                smaller than 1.
+        """
+        if not 0 < quantile < 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if max_hedges < 1:
+            raise ValueError("max_hedges must be at least 1")
+
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.window = window
+        self.min_delay = min_delay
+        self.endpoints = frozenset(endpoints) if endpoints is not None else None
+        self.max_hedges = max_hedges
+        self._hedges = 0
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, url: str, latency: float) -> None:
+        """
+        Records the latency of one attempt against its endpoint.
+        """
+        endpoint = endpoint_of(url)
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def hedge_delay(self, url: str) -> Optional[float]:
+        """
+        Returns how long to wait for a GET before hedging it.
+
+        Args:
+            url (str): The URL about to be requested.
+
+        Returns:
+            Optional[float]: The delay in seconds, or None if the request
+            should not be hedged.
+        """
+        endpoint = endpoint_of(url)
+        if self.endpoints is not None and endpoint not in self.endpoints:
+            return None
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        if len(samples) < self.min_samples:
+            return None
+        index = min(int(self.quantile * len(samples)), len(samples) - 1)
+        return max(samples[index], self.min_delay)
+
+    def start_hedge(self) -> bool:
+        """
+        Takes one of the max_hedges slots for a duplicate request.
+
+        Returns:
+            bool: True if a slot was free; call finish_hedge() once the
+            duplicate is done. False if the request should not be hedged.
+        """
+        with self._lock:
+            if self._hedges >= self.max_hedges:
+                return False
+            self._hedges += 1
+            return True
+
+    def finish_hedge(self, *_: Any) -> None:
+        """
+        Gives back the slot of a finished duplicate request. Accepts and ignores
+        arguments so it can be used as a done callback.
+        """
+        with self._lock:
+            self._hedges -= 1
+
+    def stats(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Returns the sample count and current hedging delay per endpoint.
+        """
+        with self._lock:
+            endpoints = list(self._samples)
+        return {
+            endpoint: {
+                "samples": len(self._samples[endpoint]),
+                "delay": self.hedge_delay(endpoint),
+            }
+            for endpoint in endpoints
+        }
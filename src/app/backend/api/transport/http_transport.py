@@ -0,0 +1,410 @@
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeout,
+    wait,
+)
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from api.cache import ResponseCache, ValidatorCache, cache_key, disk_cache_from_env
+from api.codec import dumps
+from api.transport.coalesce import SingleFlight
+from api.transport.deadline import (
+    DeadlineExceeded,
+    call_deadline,
+    cap_timeout,
+    deadline_allows,
+    propagate_context,
+    time_remaining,
+)
+from api.transport.hedge import HedgePolicy
+from api.transport.rate_limit import RateLimiterRegistry, rate_limiters
+from api.transport.retry import RetryPolicy, TransportMetrics
+
+# Default (connect, read) timeouts in seconds applied to every request sent
+# through an HTTPTransport unless the caller overrides them.
+DEFAULT_TIMEOUT: Tuple[float, float] = (5.0, 30.0)
+
+# Default number of keep-alive connections kept open per host.
+DEFAULT_POOL_SIZE = 10
+
+
+class HTTPTransport:
+    """
+    A shared HTTP transport that keeps connections to the CS-Cart store alive
+    between calls.
+
+    Every service class sends its requests through an HTTPTransport instead of
+    the module-level ``requests`` functions, so consecutive calls reuse pooled
+    TCP/TLS connections rather than opening a new one each time.
+
+    Attributes:
+        session (requests.Session): The underlying session holding the pools.
+        timeout (Tuple[float, float]): Default (connect, read) timeouts.
+        cache (Optional[ResponseCache]): Optional cache for GET responses.
+        validators (Optional[ValidatorCache]): Optional store for conditional GETs.
+        single_flight (Optional[SingleFlight]): Coalesces identical in-flight GETs.
+        retry (RetryPolicy): How failed requests are retried.
+        rate_limits (RateLimiterRegistry): Per-credential request rate limits.
+        metrics (TransportMetrics): Request, retry, throttle and failure counters.
+        deadline (Optional[float]): Default time budget, in seconds, of every call.
+        hedge (Optional[HedgePolicy]): When slow GETs get a duplicate request.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_SIZE,
+        pool_maxsize: int = DEFAULT_POOL_SIZE,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        cache: Optional[ResponseCache] = None,
+        validators: Optional[ValidatorCache] = None,
+        coalesce: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        rate_limits: Optional[RateLimiterRegistry] = None,
+        deadline: Optional[float] = None,
+        hedge: Optional[HedgePolicy] = None,
+    ):
+        """
+        Initializes the transport and mounts pooled adapters for HTTP and HTTPS.
+
+        Args:
+            pool_connections (int): Number of distinct hosts to keep pools for.
+            pool_maxsize (int): Maximum number of connections kept per host.
+            timeout (Tuple[float, float]): Default (connect, read) timeouts in seconds.
+            cache (Optional[ResponseCache]): Serves repeated GETs from memory, or
+                from disk with a DiskResponseCache, and is invalidated by writes
+                sent through this transport.
+            validators (Optional[ValidatorCache]): Revalidates repeat GETs with
+                If-None-Match/If-Modified-Since and serves the stored body on a 304.
+            coalesce (bool): Share one in-flight request between concurrent callers
+                asking for the same URL, parameters and credentials.
+            retry (Optional[RetryPolicy]): How failed requests are retried. Defaults
+                to RetryPolicy(), which retries GET, PUT and DELETE.
+            rate_limits (Optional[RateLimiterRegistry]): Per-credential token buckets
+                every attempt waits on. Defaults to the process-wide registry.
+            deadline (Optional[float]): Time budget, in seconds, of every call
+                including its retries. A shorter call_deadline() still applies.
+            hedge (Optional[HedgePolicy]): Sends a duplicate of a GET that is
+                slower than its endpoint's p95 and keeps the first response.
+
+        Raises:
+            ValueError: If a pool size is smaller than 1.
+        """
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("Pool sizes must be at least 1")
+
+        self.timeout = timeout
+        self.cache = cache
+        self.validators = validators
+        self.single_flight = SingleFlight() if coalesce else None
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limits = rate_limits if rate_limits is not None else rate_limiters
+        self.metrics = TransportMetrics()
+        self.deadline = deadline
+        self.hedge = hedge
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
+        self._hedge_pool_lock = threading.Lock()
+        self._pool_maxsize = pool_maxsize
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        timeout: Optional[Any] = None,
+    ) -> requests.Response:
+        """
+        Sends an HTTP request over the pooled session.
+
+        GETs are served from the cache when one is attached, and identical
+        concurrent GETs share one request when coalescing is enabled. Writes
+        invalidate the cached entries of the collection they touch.
+
+        Args:
+            method (str): The HTTP method to use ('GET', 'POST', etc.).
+            url (str): The URL to send the request to.
+            headers (Optional[Dict]): Headers to send with the request.
+            params (Optional[Dict]): Query parameters to append to the URL.
+            json (Optional[Any]): A JSON payload to send with the request.
+            data (Optional[Any]): Data to send in the body of the request.
+            timeout (Optional[Any]): Overrides the transport's default timeout.
+
+        Returns:
+            requests.Response: The raw HTTP response, or a CachedResponse on a
+            cache hit.
+        """
+        if method != "GET":
+            if json is not None:
+                headers, data, json = _encode_json(headers, json)
+            response = self._send(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                json=json,
+                data=data,
+                timeout=timeout,
+            )
+            if self.cache is not None:
+                self.cache.invalidate(url)
+            return response
+
+        key = cache_key(url, params, headers)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self.single_flight is not None:
+            return self.single_flight.do(
+                key, lambda: self._fetch(key, url, headers, params, timeout)
+            )
+        return self._fetch(key, url, headers, params, timeout)
+
+    def _fetch(
+        self,
+        key: Tuple,
+        url: str,
+        headers: Optional[Dict],
+        params: Optional[Dict],
+        timeout: Optional[Any],
+    ) -> Any:
+        # Sends a GET that missed the cache, revalidating and caching the result
+        stored = None
+        if self.validators is not None:
+            stored, headers = self.validators.prepare(key, headers)
+
+        if self.hedge is not None:
+            response = self._send_hedged(
+                url, headers=headers, params=params, timeout=timeout
+            )
+        else:
+            response = self._send(
+                "GET", url, headers=headers, params=params, timeout=timeout
+            )
+
+        if self.validators is not None:
+            response = self.validators.resolve(key, stored, response)
+        if self.cache is not None:
+            self.cache.set(key, response)
+        return response
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        # Puts the request on the wire, retrying it as the retry policy allows and
+        # pacing every attempt by the rate limit of the request's credentials.
+        # All attempts share the call's deadline.
+        timeout = kwargs.get("timeout") or self.timeout
+        retries = self.retry.retries_for(method)
+        limiter = self.rate_limits.limiter_for_headers(kwargs.get("headers"))
+        attempt = 0
+        with call_deadline(self.deadline):
+            while True:
+                if limiter is not None:
+                    # Never wait on the bucket past the call's deadline
+                    waited = limiter.acquire(timeout=time_remaining())
+                    if waited is None:
+                        self.metrics.increment(method, "failures")
+                        raise DeadlineExceeded(
+                            f"Deadline exceeded waiting for the rate limit: {url}"
+                        )
+                    if waited:
+                        self.metrics.increment(method, "throttled")
+                remaining = time_remaining()
+                if remaining is not None and remaining <= 0:
+                    self.metrics.increment(method, "failures")
+                    raise DeadlineExceeded(f"Deadline exceeded for {method} {url}")
+                kwargs["timeout"] = cap_timeout(timeout, remaining)
+                self.metrics.increment(method, "requests")
+                start = time.monotonic()
+                try:
+                    response = self._request(method, url, **kwargs)
+                except (
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                ):
+                    delay = self.retry.backoff(attempt)
+                    if attempt >= retries or not deadline_allows(delay):
+                        self.metrics.increment(method, "failures")
+                        raise
+                else:
+                    if (
+                        self.hedge is not None
+                        and method == "GET"
+                        and not kwargs.get("stream")
+                    ):
+                        self.hedge.observe(url, time.monotonic() - start)
+                    if not self.retry.should_retry(response.status_code):
+                        return response
+                    delay = self.retry.backoff(attempt, response)
+                    if attempt >= retries or not deadline_allows(delay):
+                        self.metrics.increment(method, "failures")
+                        return response
+                    response.close()
+
+                attempt += 1
+                self.metrics.increment(method, "retries")
+                time.sleep(delay)
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        # Sends one attempt, counting it against the connection pool
+        with self._in_flight_lock:
+            self._in_flight += 1
+        try:
+            return self.session.request(method, url, **kwargs)
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= 1
+
+    def _send_hedged(self, url: str, **kwargs: Any) -> requests.Response:
+        # Sends a GET and, if it is still outstanding after the endpoint's p95
+        # latency, a duplicate of it; the first successful response wins.
+        # Duplicates are capped by the policy's max_hedges and skipped while
+        # every pooled connection is busy.
+        with call_deadline(self.deadline):
+            delay = self.hedge.hedge_delay(url)
+            if delay is None:
+                return self._send("GET", url, **kwargs)
+
+            with self._hedge_pool_lock:
+                if self._hedge_pool is None:
+                    # Room for a primary per pooled connection plus the hedges
+                    self._hedge_pool = ThreadPoolExecutor(
+                        max_workers=self._pool_maxsize + self.hedge.max_hedges
+                    )
+            send = propagate_context(lambda: self._send("GET", url, **kwargs))
+            primary = self._hedge_pool.submit(send)
+            try:
+                return primary.result(timeout=delay)
+            except FutureTimeout:
+                pass
+
+            if self._in_flight >= self._pool_maxsize or not self.hedge.start_hedge():
+                self.metrics.increment("GET", "hedges_skipped")
+                return primary.result()
+            self.metrics.increment("GET", "hedged")
+            hedged = self._hedge_pool.submit(send)
+            hedged.add_done_callback(self.hedge.finish_hedge)
+            pending = {primary, hedged}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        if future is hedged:
+                            self.metrics.increment("GET", "hedge_wins")
+                        for loser in pending:
+                            loser.add_done_callback(_close_response)
+                        return future.result()
+            return primary.result()
+
+    def stream(
+        self,
+        url: str,
+        *,
+        headers: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        timeout: Optional[Any] = None,
+    ) -> requests.Response:
+        """
+        Sends a GET whose body is read incrementally, bypassing the cache.
+
+        Args:
+            url (str): The URL to send the request to.
+            headers (Optional[Dict]): Headers to send with the request.
+            params (Optional[Dict]): Query parameters to append to the URL.
+            timeout (Optional[Any]): Overrides the transport's default timeout.
+
+        Returns:
+            requests.Response: A response whose body has not been read yet;
+            iterate ``iter_content()`` and close it when done.
+        """
+        return self._send(
+            "GET", url, headers=headers, params=params, timeout=timeout, stream=True
+        )
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """
+        Closes every pooled connection held by the transport.
+        """
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+            self._hedge_pool = None
+        self.session.close()
+
+
+def _encode_json(headers: Optional[Dict], payload: Any) -> Tuple[Dict, bytes, None]:
+    # Encodes a JSON payload with the fastest available codec instead of letting
+    # the HTTP client fall back to the standard library
+    headers = dict(headers or {})
+    if not any(name.lower() == "content-type" for name in headers):
+        headers["Content-Type"] = "application/json"
+    return headers, dumps(payload), None
+
+
+def _close_response(future: Future) -> None:
+    # Releases the connection of a hedged request whose duplicate won
+    if future.exception() is None:
+        future.result().close()
+
+
+_default_transport: Optional[HTTPTransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> HTTPTransport:
+    """
+    Returns the process-wide transport shared by services that were not given
+    one explicitly, creating it on first use.
+    When CSCART_CACHE_PATH is set, its GETs are cached on disk (see
+    disk_cache_from_env).
+
+    Returns:
+        HTTPTransport: The shared transport.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = HTTPTransport(cache=disk_cache_from_env())
+        return _default_transport
+
+
+def set_default_transport(transport: HTTPTransport) -> None:
+    """
+    Replaces the process-wide transport, e.g. to change pool sizes or timeouts
+    for every service created afterwards.
+
+    Args:
+        transport (HTTPTransport): The transport to share.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        _default_transport = transport
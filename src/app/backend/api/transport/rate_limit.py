@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+from api import encode_credentials
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket pacing requests to ``rate`` per second with
+    bursts of up to ``capacity`` requests.
+
+    Callers reserve a token and sleep until it becomes available, rather than
+    failing, so concurrent callers are spread out smoothly. Sync callers use
+    ``acquire`` and async callers ``acquire_async``; both draw from the same
+    bucket.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initializes a full bucket.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (Optional[float]): Maximum burst size. Defaults to rate
+                (i.e. one second worth of requests), and at least 1.
+
+        Raises:
+            ValueError: If rate is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+
+        self.rate = rate
+        self.capacity = max(capacity if capacity is not None else rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_delay: Optional[float] = None) -> Optional[float]:
+        """
+        Takes one token, possibly going into debt, and returns how long the
+        caller must wait before using it.
+
+        Args:
+            max_delay (Optional[float]): Give up, without taking a token, if
+                the wait would be longer than this many seconds.
+
+        Returns:
+            Optional[float]: The delay in seconds (0 if a token was
+            available), or None if it would exceed max_delay.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+            if max_delay is not None and delay > max_delay:
+                return None
+            self._tokens -= 1
+            return delay
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Blocks the calling thread until a token is available.
+
+        Args:
+            timeout (Optional[float]): Maximum number of seconds to wait, e.g.
+                the time left before the call's deadline.
+
+        Returns:
+            Optional[float]: The time spent waiting, in seconds, or None if no
+            token could be had within timeout.
+        """
+        delay = self.reserve(timeout)
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Suspends the calling coroutine until a token is available.
+
+        Args:
+            timeout (Optional[float]): Maximum number of seconds to wait.
+
+        Returns:
+            Optional[float]: The time spent waiting, in seconds, or None if no
+            token could be had within timeout.
+        """
+        delay = self.reserve(timeout)
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class RateLimiterRegistry:
+    """
+    Holds one TokenBucket per set of encoded credentials, so every service and
+    transport using the same CS-Cart API key shares one limit.
+
+    Credentials without an explicit rate use the default rate, if one is set;
+    otherwise they are not limited.
+    """
+
+    def __init__(
+        self,
+        default_rate: Optional[float] = None,
+        default_capacity: Optional[float] = None,
+    ):
+        self.default_rate = default_rate
+        self.default_capacity = default_capacity
+        self._rates: Dict[str, tuple] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self, credentials: str, rate: Optional[float], capacity: Optional[float] = None
+    ) -> None:
+        """
+        Sets the rate for one set of encoded credentials.
+
+        Args:
+            credentials (str): Credentials as returned by encode_credentials.
+            rate (Optional[float]): Requests per second; None removes the limit.
+            capacity (Optional[float]): Maximum burst size.
+        """
+        with self._lock:
+            self._rates[credentials] = (rate, capacity)
+            self._buckets.pop(credentials, None)
+
+    def configure_user(
+        self,
+        email: str,
+        api_key: str,
+        rate: Optional[float],
+        capacity: Optional[float] = None,
+    ) -> None:
+        """
+        Sets the rate for a vendor or admin account by email and API key.
+        """
+        self.configure(encode_credentials(email, api_key), rate, capacity)
+
+    def limiter_for(self, credentials: str) -> Optional[TokenBucket]:
+        """
+        Returns the shared bucket for a set of credentials, or None if they
+        are not rate limited.
+        """
+        with self._lock:
+            bucket = self._buckets.get(credentials)
+            if bucket is not None:
+                return bucket
+            rate, capacity = self._rates.get(
+                credentials, (self.default_rate, self.default_capacity)
+            )
+            if rate is None:
+                return None
+            bucket = self._buckets[credentials] = TokenBucket(rate, capacity)
+            return bucket
+
+    def limiter_for_headers(self, headers: Optional[Dict]) -> Optional[TokenBucket]:
+        """
+        Returns the bucket for the credentials in a request's Authorization
+        header, or None if the request is not rate limited.
+        """
+        authorization = (headers or {}).get("Authorization", "")
+        credentials = authorization.split(" ", 1)[-1]
+        return self.limiter_for(credentials) if credentials else None
+
+
+# The process-wide registry used by every transport that is not given its own.
+rate_limiters = RateLimiterRegistry()
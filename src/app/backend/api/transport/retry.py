@@ -0,0 +1,142 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, FrozenSet, Optional
+
+# Statuses worth retrying: rate limiting and transient server/gateway errors.
+RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+# Idempotent methods are retried by default; POST is not, since CS-Cart
+# creates a new record on every POST.
+DEFAULT_METHOD_RETRIES: Dict[str, int] = {"GET": 3, "PUT": 3, "DELETE": 3, "POST": 0}
+
+
+class RetryPolicy:
+    """
+    Describes how a transport retries failed requests.
+
+    Failed attempts (connection errors, timeouts and the statuses listed in
+    ``retry_statuses``) are retried up to a per-method limit, sleeping with
+    exponential backoff and full jitter in between. A ``Retry-After`` header
+    sent with a 429/503 takes precedence over the computed backoff.
+
+    Attributes:
+        method_retries (Dict[str, int]): Maximum retries per HTTP method.
+        backoff_factor (float): Base delay in seconds; attempt n waits up to
+            backoff_factor * 2**n.
+        max_backoff (float): Upper bound for the computed backoff.
+        jitter (bool): Randomize each delay between 0 and the computed backoff.
+        retry_statuses (FrozenSet[int]): Response statuses that are retried.
+        respect_retry_after (bool): Honour the server's Retry-After header.
+        max_retry_after (float): Upper bound for a Retry-After delay.
+    """
+
+    def __init__(
+        self,
+        method_retries: Optional[Dict[str, int]] = None,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: FrozenSet[int] = RETRY_STATUSES,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120.0,
+    ):
+        self.method_retries = dict(DEFAULT_METHOD_RETRIES)
+        if method_retries:
+            self.method_retries.update(
+                {method.upper(): count for method, count in method_retries.items()}
+            )
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def retries_for(self, method: str) -> int:
+        """
+        Returns the maximum number of retries for an HTTP method.
+        """
+        return self.method_retries.get(method.upper(), 0)
+
+    def should_retry(self, status_code: Any) -> bool:
+        """
+        Returns True if a response with this status should be retried.
+        """
+        return status_code in self.retry_statuses
+
+    def retry_after(self, response: Any) -> Optional[float]:
+        """
+        Parses the Retry-After header of a response into seconds.
+
+        Args:
+            response (Any): The response that will be retried.
+
+        Returns:
+            Optional[float]: The delay requested by the server, or None.
+        """
+        value = response.headers.get("Retry-After") if response is not None else None
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(seconds, 0.0), self.max_retry_after)
+
+    def backoff(self, attempt: int, response: Any = None) -> float:
+        """
+        Returns how long to sleep before the next attempt.
+
+        Args:
+            attempt (int): Number of the attempt that just failed, from 0.
+            response (Any): The failed response, if one was received.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        if self.respect_retry_after:
+            delay = self.retry_after(response)
+            if delay is not None:
+                return delay
+
+        delay = min(self.backoff_factor * (2**attempt), self.max_backoff)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+class TransportMetrics:
+    """
+    Thread-safe counters of the requests sent through a transport.
+
+    Counters are kept per HTTP method: ``requests`` counts every attempt put
+    on the wire, ``retries`` the attempts that were repeats of a failed one and
+    ``failures`` the calls that still failed once retries were exhausted.
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, method: str, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(
+                method, {"requests": 0, "retries": 0, "failures": 0}
+            )
+            counters[counter] = counters.get(counter, 0) + amount
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns a copy of the counters, keyed by HTTP method.
+        """
+        with self._lock:
+            return {method: dict(c) for method, c in self._counters.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
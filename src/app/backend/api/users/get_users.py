@@ -1,13 +1,38 @@
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
 from urllib.parse import urljoin
 import requests
 import json
 
 from api import BASE_URL, encode_credentials
+from api.codec import DEFAULT_CHUNK_SIZE, decode_response
+from api.columnar import USER_COLUMNS, ColumnarBuilder
+from api.pagination import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_ITEMS_PER_PAGE,
+    acount_items,
+    afetch_all_pages,
+    aiter_pages,
+    astream_items,
+    count_items,
+    fetch_all_pages,
+    iter_pages,
+    stream_items,
+)
+from api.records import User
+from api.transport import (
+    AsyncServiceMixin,
+    HTTPTransport,
+    get_default_transport,
+)
 
 
 class UserService:
-    def __init__(self, admin_email: str, admin_api_key: str):
+    def __init__(
+        self,
+        admin_email: str,
+        admin_api_key: str,
+        transport: Optional[HTTPTransport] = None,
+    ):
         if not admin_email or not admin_api_key:
             raise ValueError("Admin email and API key must be set")
 
@@ -15,12 +40,103 @@ class UserService:
         self.users_url = urljoin(self.url, "/api/users/")
         self.usergroups_url = urljoin(self.url, "/api/usergroups/")
         self.credentials = encode_credentials(admin_email, admin_api_key)
+        self.transport = transport or get_default_transport()
         self.headers = {"Authorization": f"Basic {self.credentials}"}
 
-    def get_users(self, page: int = 1, items_per_page: int = 10, user_type: str = "C"):
-        params = {"page": page, "items_per_page": items_per_page, "user_type": user_type}
+    def get_users(
+        self,
+        page: int = 1,
+        items_per_page: int = 10,
+        user_type: str = "C",
+        params: Optional[Dict] = None,
+    ):
+        # params carries extra filters and sorting, e.g. {"sort_by": "name"}
+        params = {
+            **(params or {}),
+            "page": page,
+            "items_per_page": items_per_page,
+            "user_type": user_type,
+        }
         return self._handle_request(url=self.users_url, method="GET", params=params)
 
+    def iter_users(
+        self,
+        user_type: str = "C",
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        records: bool = False,
+    ) -> Iterator[Any]:
+        return iter_pages(
+            lambda params: self.get_users(
+                params["page"], params["items_per_page"], user_type
+            ),
+            "users",
+            items_per_page=items_per_page,
+            convert=User.from_dict if records else None,
+        )
+
+    def count_users(self, user_type: str = "C", max_age: float = 0) -> Optional[int]:
+        return count_items(
+            lambda params: self.get_users(
+                params["page"], params["items_per_page"], user_type
+            ),
+            "users",
+            {"user_type": user_type},
+            max_age,
+            (self.credentials, self.users_url),
+        )
+
+    def fetch_all_users(
+        self,
+        user_type: str = "C",
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        records: bool = False,
+    ) -> Dict:
+        return fetch_all_pages(
+            lambda params: self.get_users(
+                params["page"], params["items_per_page"], user_type
+            ),
+            "users",
+            items_per_page=items_per_page,
+            concurrency=concurrency,
+            convert=User.from_dict if records else None,
+        )
+
+    def stream_users(
+        self,
+        page: int = 1,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        user_type: str = "C",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        records: bool = False,
+    ) -> Iterator[Any]:
+        params = {"page": page, "items_per_page": items_per_page, "user_type": user_type}
+        return stream_items(
+            self.transport,
+            self.users_url,
+            "users",
+            self.headers,
+            params,
+            chunk_size,
+            convert=User.from_dict if records else None,
+        )
+
+    def to_frame(
+        self,
+        user_type: str = "C",
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        builder = ColumnarBuilder(USER_COLUMNS)
+        return builder.extend(self.iter_users(user_type, items_per_page)).to_frame()
+
+    def to_arrow(
+        self,
+        user_type: str = "C",
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        builder = ColumnarBuilder(USER_COLUMNS)
+        return builder.extend(self.iter_users(user_type, items_per_page)).to_arrow()
+
     def get_user(self, user_id: int):
         url = urljoin(self.users_url, str(user_id))
         return self._handle_request(url=url, method="GET")
@@ -73,7 +189,7 @@ class UserService:
     def _handle_response(self, response: Any) -> Dict:
         try:
             response.raise_for_status()
-            json_response = response.json()
+            json_response = decode_response(response)
             return json_response
         except (requests.exceptions.HTTPError, json.JSONDecodeError) as e:
             print(f"Error: {e}")
@@ -101,22 +217,113 @@ class UserService:
 
         try:
             if method == "GET":
-                response = requests.get(
+                response = self.transport.get(
                     url=_url, headers=_headers, params=params, data=data
                 )
             elif method == "POST":
-                response = requests.post(
+                response = self.transport.post(
                     url=_url, headers=_headers, json=json, data=data
                 )
             elif method == "PUT":
-                response = requests.put(
+                response = self.transport.put(
                     url=_url, headers=_headers, json=json, data=data
                 )
             elif method == "DELETE":
-                response = requests.delete(url=_url, headers=_headers)
+                response = self.transport.delete(url=_url, headers=_headers)
             else:
                 raise ValueError("Unsupported HTTP method")
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
             print(f"RequestException ({method}): {e}")
             return {"Error": str(e)}
+
+
+class AsyncUserService(AsyncServiceMixin, UserService):
+    """
+    The asyncio variant of UserService. Every method has the same name and
+    arguments as its synchronous counterpart and returns an awaitable.
+    Requests are sent through a shared AsyncHTTPTransport pool unless a
+    transport is passed explicitly.
+    """
+
+    def iter_users(
+        self,
+        user_type: str = "C",
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        records: bool = False,
+    ) -> AsyncIterator[Any]:
+        return aiter_pages(
+            lambda params: self.get_users(
+                params["page"], params["items_per_page"], user_type
+            ),
+            "users",
+            items_per_page=items_per_page,
+            convert=User.from_dict if records else None,
+        )
+
+    async def fetch_all_users(
+        self,
+        user_type: str = "C",
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        records: bool = False,
+    ) -> Dict:
+        return await afetch_all_pages(
+            lambda params: self.get_users(
+                params["page"], params["items_per_page"], user_type
+            ),
+            "users",
+            items_per_page=items_per_page,
+            concurrency=concurrency,
+            convert=User.from_dict if records else None,
+        )
+
+    def stream_users(
+        self,
+        page: int = 1,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        user_type: str = "C",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        records: bool = False,
+    ) -> AsyncIterator[Any]:
+        params = {"page": page, "items_per_page": items_per_page, "user_type": user_type}
+        return astream_items(
+            self.transport,
+            self.users_url,
+            "users",
+            self.headers,
+            params,
+            chunk_size,
+            convert=User.from_dict if records else None,
+        )
+
+    async def to_frame(
+        self,
+        user_type: str = "C",
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        builder = ColumnarBuilder(USER_COLUMNS)
+        await builder.aextend(self.iter_users(user_type, items_per_page))
+        return builder.to_frame()
+
+    async def to_arrow(
+        self,
+        user_type: str = "C",
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        builder = ColumnarBuilder(USER_COLUMNS)
+        await builder.aextend(self.iter_users(user_type, items_per_page))
+        return builder.to_arrow()
+
+    async def count_users(
+        self, user_type: str = "C", max_age: float = 0
+    ) -> Optional[int]:
+        return await acount_items(
+            lambda params: self.get_users(
+                params["page"], params["items_per_page"], user_type
+            ),
+            "users",
+            {"user_type": user_type},
+            max_age,
+            (self.credentials, self.users_url),
+        )
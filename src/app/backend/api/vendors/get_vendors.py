@@ -1,9 +1,27 @@
 import json
 from urllib.parse import urljoin
 import requests
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
 
 from api import BASE_URL, encode_credentials
+from api.codec import decode_response
+from api.columnar import VENDOR_COLUMNS, ColumnarBuilder
+from api.pagination import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_ITEMS_PER_PAGE,
+    acount_items,
+    afetch_all_pages,
+    aiter_pages,
+    count_items,
+    fetch_all_pages,
+    iter_pages,
+)
+from api.records import Vendor
+from api.transport import (
+    AsyncServiceMixin,
+    HTTPTransport,
+    get_default_transport,
+)
 
 
 class VendorsService:
@@ -17,13 +35,20 @@ class VendorsService:
         headers (dict): Headers for API requests, including Authorization.
     """
 
-    def __init__(self, vendor_email: str, vendor_api_key: str):
+    def __init__(
+        self,
+        vendor_email: str,
+        vendor_api_key: str,
+        transport: Optional[HTTPTransport] = None,
+    ):
         """
         Initializes the service with the provided vendor email and API key.
 
         Args:
             vendor_email (str): Email of the vendor user.
             vendor_api_key (str): API key for the vendor account.
+            transport (Optional[HTTPTransport]): Pooled transport to send requests
+                through. Defaults to the process-wide shared transport.
 
         Raises:
             ValueError: If vendor email or API key is missing.
@@ -33,6 +58,7 @@ class VendorsService:
 
         self.url = urljoin(BASE_URL, "/api/vendors/")
         self.credentials = encode_credentials(vendor_email, vendor_api_key)
+        self.transport = transport or get_default_transport()
         self.headers = {
             "Content-Type": "application/json",
             "Authorization": f"Basic {self.credentials}",
@@ -50,6 +76,128 @@ class VendorsService:
         """
         return self._handle_request(method="GET", params=params)
 
+    def iter_vendors(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        records: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Lazily yields every vendor, fetching one page at a time.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the vendors list.
+            items_per_page (int): Number of vendors requested per page.
+            records (bool): Return Vendor records instead of dicts.
+
+        Returns:
+            Iterator[Any]: The vendors, one at a time.
+        """
+        return iter_pages(
+            self.get_vendors,
+            "vendors",
+            params,
+            items_per_page,
+            convert=Vendor.from_dict if records else None,
+        )
+
+    def count_vendors(
+        self, params: Optional[Dict] = None, max_age: float = 0
+    ) -> Optional[int]:
+        """
+        Counts the vendors matching the filters with a single one-vendor
+        request, reading the total the store reports.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the vendors list.
+            max_age (float): Seconds a count fetched earlier by any VendorsService
+                with the same credentials may be reused.
+
+        Returns:
+            Optional[int]: The number of vendors, or None if not reported.
+
+        Raises:
+            ConnectionError: If the request fails.
+        """
+        return count_items(
+            self.get_vendors, "vendors", params, max_age, (self.credentials, self.url)
+        )
+
+    def fetch_all_vendors(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        records: bool = False,
+    ) -> Dict:
+        """
+        Retrieves every vendor, fetching the pages after the first one in parallel.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the vendors list.
+            items_per_page (int): Number of vendors requested per page.
+            concurrency (int): Maximum number of pages requested at once, or an
+                AdaptiveConcurrencyLimiter to adapt it to the store's load.
+            records (bool): Return Vendor records instead of dicts.
+
+        Returns:
+            Dict: The first page's response with 'vendors' holding every vendor.
+        """
+        return fetch_all_pages(
+            self.get_vendors,
+            "vendors",
+            params,
+            items_per_page,
+            concurrency,
+            convert=Vendor.from_dict if records else None,
+        )
+
+    def to_frame(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        """
+        Retrieves every vendor as a typed pandas DataFrame, building the
+        columns page by page without keeping the vendor dicts.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the vendors list.
+            items_per_page (int): Number of vendors requested per page.
+
+        Returns:
+            Any: One column per vendor field.
+
+        Raises:
+            ConnectionError: If a page request fails.
+            ImportError: If numpy or pandas is not installed.
+        """
+        builder = ColumnarBuilder(VENDOR_COLUMNS)
+        return builder.extend(self.iter_vendors(params, items_per_page)).to_frame()
+
+    def to_arrow(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        """
+        Retrieves every vendor as a typed pyarrow Table, building the
+        columns page by page without keeping the vendor dicts.
+
+        Args:
+            params (Optional[Dict]): Parameters to filter the vendors list.
+            items_per_page (int): Number of vendors requested per page.
+
+        Returns:
+            Any: One column per vendor field.
+
+        Raises:
+            ConnectionError: If a page request fails.
+            ImportError: If numpy or pyarrow is not installed.
+        """
+        builder = ColumnarBuilder(VENDOR_COLUMNS)
+        return builder.extend(self.iter_vendors(params, items_per_page)).to_arrow()
+
     def get_vendor(self, vendor_id: int) -> Any | Dict[str, str]:
         """
         Retrieves details of a specific vendor by their ID.
@@ -114,7 +262,7 @@ class VendorsService:
         """
         try:
             response.raise_for_status()
-            json_response = response.json()
+            json_response = decode_response(response)
             return json_response
         except (requests.exceptions.HTTPError, json.JSONDecodeError) as e:
             print(f"Error: {e}")
@@ -158,22 +306,86 @@ class VendorsService:
 
         try:
             if method == "GET":
-                response = requests.get(
+                response = self.transport.get(
                     url=_url, headers=_headers, params=params, data=data
                 )
             elif method == "POST":
-                response = requests.post(
+                response = self.transport.post(
                     url=_url, headers=_headers, json=json, data=data
                 )
             elif method == "PUT":
-                response = requests.put(
+                response = self.transport.put(
                     url=_url, headers=_headers, json=json, data=data
                 )
             elif method == "DELETE":
-                response = requests.delete(url=_url, headers=_headers)
+                response = self.transport.delete(url=_url, headers=_headers)
             else:
                 raise ValueError("Unsupported HTTP method")
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
             print(f"RequestException ({method}): {e}")
             return {"Error": str(e)}
+
+
+class AsyncVendorsService(AsyncServiceMixin, VendorsService):
+    """
+    The asyncio variant of VendorsService. Every method has the same name and
+    arguments as its synchronous counterpart and returns an awaitable.
+    Requests are sent through a shared AsyncHTTPTransport pool unless a
+    transport is passed explicitly.
+    """
+
+    def iter_vendors(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        records: bool = False,
+    ) -> AsyncIterator[Any]:
+        return aiter_pages(
+            self.get_vendors,
+            "vendors",
+            params,
+            items_per_page,
+            convert=Vendor.from_dict if records else None,
+        )
+
+    async def fetch_all_vendors(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        records: bool = False,
+    ) -> Dict:
+        return await afetch_all_pages(
+            self.get_vendors,
+            "vendors",
+            params,
+            items_per_page,
+            concurrency,
+            convert=Vendor.from_dict if records else None,
+        )
+
+    async def to_frame(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        builder = ColumnarBuilder(VENDOR_COLUMNS)
+        await builder.aextend(self.iter_vendors(params, items_per_page))
+        return builder.to_frame()
+
+    async def to_arrow(
+        self,
+        params: Optional[Dict] = None,
+        items_per_page: int = DEFAULT_ITEMS_PER_PAGE,
+    ) -> Any:
+        builder = ColumnarBuilder(VENDOR_COLUMNS)
+        await builder.aextend(self.iter_vendors(params, items_per_page))
+        return builder.to_arrow()
+
+    async def count_vendors(
+        self, params: Optional[Dict] = None, max_age: float = 0
+    ) -> Optional[int]:
+        return await acount_items(
+            self.get_vendors, "vendors", params, max_age, (self.credentials, self.url)
+        )
@@ -0,0 +1,58 @@
+import streamlit as st
+import pandas as pd
+import os
+from dotenv import load_dotenv
+from api.dashboard import load_concurrently
+from utils.data import fetch
+
+# Load environment variables
+load_dotenv()
+vendor_email = os.getenv("VENDOR_EMAIL")
+vendor_api_key = os.getenv("VENDOR_API_KEY")
+
+# Rows shown per section
+PREVIEW_ROWS = 10
+
+
+def preview(name, method):
+    # Loads a section through the data layer, so reruns reuse its last result
+    return lambda: fetch(
+        name, method, vendor_email, vendor_api_key, {"items_per_page": PREVIEW_ROWS}
+    )
+
+
+# Section title, the key holding its records, and the call loading it
+sections = {
+    "orders": ("Latest Orders", "orders", preview("orders", "get_orders")),
+    "products": ("Products", "products", preview("products", "get_products")),
+    "vendors": ("Vendors", "vendors", preview("vendors", "get_vendors")),
+    "stores": ("Stores", "stores", preview("stores", "get_stores")),
+    "shipments": (
+        "Shipments",
+        "shipment",
+        lambda: fetch("shipments", "send_auth_request", vendor_email, vendor_api_key),
+    ),
+}
+
+st.title("Dashboard")
+
+# Reserve every section's place up front so the layout does not jump, then
+# fill each one in as soon as its data arrives
+placeholders = {}
+for name, (title, _, _) in sections.items():
+    placeholders[name] = st.empty()
+    placeholders[name].info(f"Loading {title.lower()}...")
+
+tasks = {name: load for name, (_, _, load) in sections.items()}
+for section in load_concurrently(tasks, timeout=30):
+    title, items_key, _ = sections[section.name]
+    with placeholders[section.name].container():
+        st.header(title)
+        if not section.ok:
+            st.error(f"Could not load {title.lower()}: {section.error}")
+            continue
+        records = section.data.get(items_key) or []
+        if isinstance(records, dict):
+            records = list(records.values())
+        st.caption(f"Loaded in {section.seconds:.2f}s")
+        st.dataframe(pd.json_normalize(records), width=1000)
@@ -2,8 +2,11 @@ from ast import arg
 from math import prod
 from xxlimited import new
 import streamlit as st
-import pandas as pd
-from api.orders import OrdersService
+from functools import partial
+from api.columnar import ORDER_COLUMNS
+from utils.data import count, mirror_orders_page, write
+from utils.refresh import latest, refresh_now
+from utils.table import paginated_table
 import os
 from dotenv import load_dotenv
 import json
@@ -14,17 +17,18 @@ vendor_email = os.getenv("VENDOR_EMAIL")
 vendor_api_key = os.getenv("VENDOR_API_KEY")
 
 
-# Initialize SessionStore and AuthService
-orders_service = OrdersService(vendor_email, vendor_api_key)
-
-json_response = orders_service.get_orders()
-orders = pd.json_normalize(json_response["orders"])
-orders.index = range(1, len(orders) + 1)
-
 # Create a Streamlit app for the Order Page
 st.title("Orders")
+
+# The local mirror is refreshed in the background; show how fresh it is
+latest("orders", vendor_email, vendor_api_key)
+
 col1, col2, col3 = st.columns(3)
-col1.metric("Total Orders", len(orders), "Order Dashboard")
+# Count on the store with a one-order request rather than len() of a download
+total_orders = count("orders", vendor_email, vendor_api_key)
+col1.metric(
+    "Total Orders", "NA" if total_orders is None else total_orders, "Order Dashboard"
+)
 col2.metric("Total Order Value", "$ NA", "Order Dashboard")
 
 
@@ -34,10 +38,11 @@ def submitted():
         "Quantity": st.session_state["Quantity"],
         "Customer Name": st.session_state["Customer Name"],
         "Order Description": st.session_state["Order Description"],
-        "Order ID": len(orders) + 1,
+        "Order ID": (total_orders or 0) + 1,
     }
 
-    response = orders_service.create_order(new_order)
+    response = write("orders", "create_order", vendor_email, vendor_api_key, new_order)
+    refresh_now("orders", vendor_email, vendor_api_key)
     if response:
         st.success(response)
     else:
@@ -67,6 +72,12 @@ def submitted():
 # if submit_button:
 #     submitted()
 
-# Display the order information table
+# Display the order information table, one page at a time from the mirror
 st.title("Order Information Table")
-st.dataframe(orders, width=1000, height=len(orders) * 24)
+paginated_table(
+    "orders",
+    partial(mirror_orders_page, vendor_email, vendor_api_key),
+    {"Date": "timestamp", "Total": "total", "Order ID": "order_id", "Status": "status"},
+    schema=ORDER_COLUMNS,
+    filters={"Status code": "status"},
+)
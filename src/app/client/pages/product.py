@@ -1,17 +1,16 @@
 import streamlit as st
-import pandas as pd
 import os
 from dotenv import load_dotenv
-from api.products import ProductsService
+from api.columnar import PRODUCT_COLUMNS
+from utils.data import api_page, count, write
+from utils.refresh import PRODUCTS_VIEW, latest, refresh_now
+from utils.table import paginated_table
 
 # Load environment variables
 load_dotenv()
 vendor_email = os.getenv("VENDOR_EMAIL")
 vendor_api_key = os.getenv("VENDOR_API_KEY")
 
-# Initialize ProductsService
-product_service = ProductsService(vendor_email, vendor_api_key)
-
 # Streamlit app for Products Page
 st.title("Products")
 
@@ -24,7 +23,10 @@ def submitted_product():
         "price": st.session_state["Price"],
     }
 
-    response = product_service.create_product(new_product)
+    response = write(
+        "products", "create_product", vendor_email, vendor_api_key, new_product
+    )
+    refresh_now("products", vendor_email, vendor_api_key)
     if response:
         st.success(response)
     else:
@@ -44,13 +46,46 @@ with st.form(key="create_product_form"):
 if submit_button:
     submitted_product()
 
-# Fetch products from the API
-json_response = product_service.get_products()
-products = pd.json_normalize(json_response["products"])
-products.index = range(1, len(products) + 1)
-
 # Display metrics and product information table
 col1, col2, col3 = st.columns(3)
-col2.metric("Total Products", len(products))
+total_products = count("products", vendor_email, vendor_api_key)
+col2.metric("Total Products", "NA" if total_products is None else total_products)
 st.title("Product Information Table")
-st.dataframe(products, width=1000, height=len(products) * 24)
+
+
+def products_page(page, items_per_page, sort_by, descending, filters):
+    # The default view's first page is kept fresh in the background
+    if page == 1 and (items_per_page, sort_by, descending) == PRODUCTS_VIEW:
+        if not any(filters.values()):
+            snapshot = latest("products", vendor_email, vendor_api_key)
+            if snapshot is not None and snapshot.data is not None:
+                return snapshot.data
+    # CS-Cart only searches product names for 'q' with pname=Y
+    if filters.get("q"):
+        filters = {**filters, "pname": "Y"}
+    return api_page(
+        "products",
+        vendor_email,
+        vendor_api_key,
+        page,
+        items_per_page,
+        sort_by,
+        descending,
+        filters,
+    )
+
+
+# Fetch only the page on screen, sorted and filtered by the store
+paginated_table(
+    "products",
+    products_page,
+    {
+        "Newest": "timestamp",
+        "Last updated": "updated_timestamp",
+        "Name": "product",
+        "Price": "price",
+        "Stock": "amount",
+    },
+    schema=PRODUCT_COLUMNS,
+    filters={"Search by name": "q"},
+)
@@ -1,6 +1,6 @@
 import streamlit as st
 import pandas as pd
-from api.shipments import ShipmentService
+from utils.refresh import latest
 import os
 from dotenv import load_dotenv
 import json
@@ -10,11 +10,11 @@ load_dotenv()
 vendor_email = os.getenv("VENDOR_EMAIL")
 vendor_api_key = os.getenv("VENDOR_API_KEY")
 
-# Initialize SessionStore and AuthService
-product_service = ShipmentService(vendor_email, vendor_api_key)
+st.title('Shipments')
 
-# Use AuthService to send authentication requests
-json_response = product_service.send_auth_request()
+# Read the latest shipments refreshed in the background
+snapshot = latest("shipments", vendor_email, vendor_api_key)
+json_response = snapshot.data if snapshot and snapshot.data is not None else {}
 shipment = pd.DataFrame()
 
 if 'shipment' in json_response:
@@ -25,7 +25,6 @@ else:
 
 
 # Create a Streamlit app for the Shipment Page
-st.title('Shipments')
 col1, col2, col3 = st.columns(3)
 col1.metric("Total Shipments", len(shipment), "Shipment Dashboard")
 col2.metric("Total Shipment Value", "Rs 0", "Shipment Dashboard")
@@ -1,7 +1,9 @@
 import streamlit as st
-import pandas as pd
 import requests
-from api.stores import StoresService
+from functools import partial
+from api.columnar import STORE_COLUMNS
+from utils.data import api_page, count
+from utils.table import paginated_table
 import os
 from dotenv import load_dotenv
 import json
@@ -13,19 +15,13 @@ vendor_api_key = os.getenv("VENDOR_API_KEY")
 
 print(vendor_api_key, vendor_email)
 
-# Initialize Session and StoresService
-store_service = StoresService(vendor_email, vendor_api_key)
-
-# Fetch all stores
-json_response = store_service.get_stores()
-
-stores = pd.json_normalize(json_response['stores'])
-stores.index = range(1, len(stores) + 1)
-
 st.title('Stores')
 
 col1, col2, col3 = st.columns(3)
-col1.metric("Total stores", len(stores), "Store Dashboard")
+total_stores = count("stores", vendor_email, vendor_api_key)
+col1.metric(
+    "Total stores", "NA" if total_stores is None else total_stores, "Store Dashboard"
+)
 col2.metric("Total Sales", "Rs 2345", "Sales Dashboard")
 # col3.metric("Humidity", "86%", "4%")
 
@@ -89,9 +85,11 @@ st.title('Store Information Table')
 edit_icon = "https://image.flaticon.com/icons/svg/565/565026.svg"
 delete_icon = "https://image.flaticon.com/icons/svg/3221/3221897.svg"
 
-# stores['Actions'] = [f"[Edit]| [Delete]" for _ in range(len(stores))]
-
-df = pd.DataFrame(stores)
-
-# Display the table using st.dataframe
-st.dataframe(df, width=800, height=len(stores))
+# Display the stores one page at a time, sorted by the store
+paginated_table(
+    "stores",
+    partial(api_page, "stores", vendor_email, vendor_api_key),
+    {"Name": "company", "ID": "id", "Created": "date"},
+    schema=STORE_COLUMNS,
+    descending=False,
+)
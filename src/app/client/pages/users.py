@@ -1,6 +1,8 @@
 import streamlit as st
-import pandas as pd
-from api.users import UserService
+from functools import partial
+from api.columnar import USER_COLUMNS
+from utils.data import api_page, count
+from utils.table import paginated_table
 import os
 from dotenv import load_dotenv
 import json
@@ -12,19 +14,13 @@ vendor_api_key = os.getenv("VENDOR_API_KEY")
 
 print(vendor_api_key, vendor_email)
 
-# Initialize Session and StoresService
-user_service = UserService(vendor_email, vendor_api_key)
-
-
-# Fetch all users
-json_response = user_service.get_users()
-users = pd.json_normalize(json_response["users"])
-users.index = range(1, len(users) + 1)
-
 # Create a Streamlit app for the User Page
 st.title("User Management")
 col1, col2, col3 = st.columns(3)
-col1.metric("Total Users", "123", "User Dashboard")
+total_users = count("users", vendor_email, vendor_api_key)
+col1.metric(
+    "Total Users", "NA" if total_users is None else total_users, "User Dashboard"
+)
 
 # Define a function to open the modal for adding a user
 
@@ -96,5 +92,11 @@ users_data = [
 ]
 
 
-# Display the table using st.dataframe
-st.dataframe(users, width=1000, height=len(users_data) * 2)
+# Display the users one page at a time, sorted and filtered by the store
+paginated_table(
+    "users",
+    partial(api_page, "users", vendor_email, vendor_api_key),
+    {"Registered": "date", "Name": "name", "Email": "email", "Status": "status"},
+    schema=USER_COLUMNS,
+    filters={"Name": "name", "Email": "email"},
+)
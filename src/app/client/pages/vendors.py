@@ -2,33 +2,29 @@ import streamlit as st
 import pandas as pd
 import os
 from dotenv import load_dotenv
-from api.vendors import VendorsService
+from utils.data import count, list_frame
 
 # Load environment variables
 load_dotenv()
 vendor_email = os.getenv("VENDOR_EMAIL")
 vendor_api_key = os.getenv("VENDOR_API_KEY")
 
-# Initialize VendorsService
-vendor_service = VendorsService(vendor_email, vendor_api_key)
-
-# Fetch vendor data
-json_response = vendor_service.get_vendors()
-
-# Initialize an empty DataFrame for vendors
-vendors_data = pd.DataFrame()
-
-if "vendors" in json_response:
-    # Normalize JSON data and create DataFrame
-    vendors_data = pd.json_normalize(json_response["vendors"])
+# Fetch vendor data, reused across reruns by the data layer
+try:
+    vendors_data = list_frame("vendors", vendor_email, vendor_api_key)
     vendors_data.index = range(1, len(vendors_data) + 1)
-else:
+except ConnectionError:
+    # Initialize an empty DataFrame for vendors
+    vendors_data = pd.DataFrame()
     st.write("No vendor data available in the API response.")
 
 # Streamlit app layout
 st.title("Vendor Management")
 col1, col2, col3 = st.columns(3)
-col1.metric("Total Vendors", len(vendors_data), "Vendor Dashboard")
+total_vendors = count("vendors", vendor_email, vendor_api_key)
+col1.metric(
+    "Total Vendors", "NA" if total_vendors is None else total_vendors, "Vendor Dashboard"
+)
 
 
 # Function to create a modal for adding a vendor
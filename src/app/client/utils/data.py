@@ -0,0 +1,201 @@
+import hashlib
+import os
+from typing import Any, Dict, Optional
+
+import pandas as pd
+import streamlit as st
+
+from api.mirror import OrdersMirror
+from api.orders import OrdersService
+from api.pagination import TablePage, fetch_table_page, forget_counts
+from api.products import ProductsService
+from api.shipments import ShipmentService
+from api.stores import StoresService
+from api.users import UserService
+from api.vendors import VendorsService
+
+# The client's data layer. Services (and with them the pooled transport) are
+# created once per set of credentials and shared by every rerun and session;
+# fetched data is memoized for DATA_TTL seconds, keyed by credentials and
+# parameters, and dropped as soon as a page writes to any collection.
+
+# Seconds fetched data is reused across reruns.
+DATA_TTL = 60
+
+# Seconds the metric tile counts are reused.
+COUNT_TTL = 60
+
+SERVICES = {
+    "orders": OrdersService,
+    "products": ProductsService,
+    "shipments": ShipmentService,
+    "stores": StoresService,
+    "users": UserService,
+    "vendors": VendorsService,
+}
+
+
+@st.cache_resource(show_spinner=False)
+def get_service(name: str, email: str, api_key: str) -> Any:
+    """
+    Returns the shared service for a collection and set of credentials.
+
+    Args:
+        name (str): The collection, a key of SERVICES, e.g. 'orders'.
+        email (str): The account's email.
+        api_key (str): The account's API key.
+
+    Returns:
+        Any: The service instance.
+    """
+    return SERVICES[name](email, api_key)
+
+
+def store_path(path: str, email: str, api_key: str) -> str:
+    """
+    Returns the database file of one account's local copy, e.g.
+    'orders_mirror-1f2e3d4c5b6a7980.db' for 'orders_mirror.db', so accounts
+    never share rows, sync cursors or deletions.
+    """
+    if path == ":memory:":
+        return path
+    digest = hashlib.sha256(f"{email}:{api_key}".encode()).hexdigest()[:16]
+    root, extension = os.path.splitext(path)
+    return f"{root}-{digest}{extension}"
+
+
+@st.cache_resource(show_spinner=False)
+def get_orders_mirror(email: str, api_key: str) -> OrdersMirror:
+    """
+    Returns the shared local orders mirror for a set of credentials.
+    """
+    return OrdersMirror(
+        get_service("orders", email, api_key),
+        store_path(
+            os.getenv("ORDERS_MIRROR_PATH", "orders_mirror.db"), email, api_key
+        ),
+    )
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner="Loading...")
+def list_frame(name: str, email: str, api_key: str, **kwargs: Any) -> pd.DataFrame:
+    """
+    Returns every record of a collection as a typed DataFrame, e.g.
+    ``list_frame("users", email, api_key, user_type="V")``.
+
+    Raises:
+        ConnectionError: If a page request fails.
+    """
+    return get_service(name, email, api_key).to_frame(**kwargs)
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def api_page(
+    name: str,
+    email: str,
+    api_key: str,
+    page: int,
+    items_per_page: int,
+    sort_by: str,
+    descending: bool,
+    filters: Dict,
+) -> TablePage:
+    """
+    Fetches one sorted, filtered page of a collection from the API, for a
+    paginated table. A 'user_type' filter selects the kind of users listed.
+
+    Raises:
+        ConnectionError: If the request fails.
+    """
+    service = get_service(name, email, api_key)
+    if name == "users":
+        filters = dict(filters)
+        user_type = filters.pop("user_type", "C")
+
+        def fetch_page(params):
+            return service.get_users(
+                params["page"], params["items_per_page"], user_type, params
+            )
+
+    else:
+        fetch_page = getattr(service, f"get_{name}")
+    return fetch_table_page(
+        fetch_page, name, page, items_per_page, sort_by, descending, filters
+    )
+
+
+def mirror_orders_page(
+    email: str,
+    api_key: str,
+    page: int,
+    items_per_page: int,
+    sort_by: str,
+    descending: bool,
+    filters: Dict,
+) -> TablePage:
+    """
+    Reads one page of orders from the local mirror, for a paginated table. A
+    'status' filter selects the orders with that status code.
+    """
+    return get_orders_mirror(email, api_key).table_page(
+        page, items_per_page, sort_by, descending, filters.get("status") or None
+    )
+
+
+@st.cache_data(ttl=COUNT_TTL, show_spinner=False)
+def count(name: str, email: str, api_key: str, **kwargs: Any) -> Optional[int]:
+    """
+    Returns the number of records in a collection, or None if the store does
+    not report it or cannot be reached.
+    """
+    service = get_service(name, email, api_key)
+    try:
+        return getattr(service, f"count_{name}")(**kwargs)
+    except ConnectionError:
+        return None
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def fetch(name: str, method: str, email: str, api_key: str, *args: Any) -> Any:
+    """
+    Memoizes any read method of a service, e.g.
+    ``fetch("shipments", "send_auth_request", email, api_key)``.
+
+    Raises:
+        ConnectionError: If the service reports an error, which is then not
+            memoized.
+    """
+    response = getattr(get_service(name, email, api_key), method)(*args)
+    if isinstance(response, dict) and "Error" in response:
+        raise ConnectionError(f"Request failed: {response['Error']}")
+    return response
+
+
+def invalidate() -> None:
+    """
+    Drops all memoized data and remembered counts, so the next read of any
+    collection goes back to the store.
+
+    Streamlit clears a cached function for every argument at once, so there
+    is no dropping a single collection's or account's copies; the others are
+    simply fetched again.
+    """
+    list_frame.clear()
+    api_page.clear()
+    count.clear()
+    fetch.clear()
+    forget_counts()
+
+
+def write(name: str, method: str, email: str, api_key: str, *args: Any) -> Any:
+    """
+    Calls a create/update/delete method of a service and drops all memoized
+    data, so the pages show the change, e.g.
+    ``write("products", "create_product", email, api_key, payload)``.
+
+    Returns:
+        Any: What the service method returned.
+    """
+    result = getattr(get_service(name, email, api_key), method)(*args)
+    invalidate()
+    return result
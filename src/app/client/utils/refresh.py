@@ -0,0 +1,97 @@
+import os
+from functools import partial
+from typing import Optional
+
+import streamlit as st
+
+from api.dashboard import RefreshWorker, Snapshot
+from api.pagination import fetch_table_page
+from api.transport import TokenBucket
+from utils.data import get_orders_mirror, get_service
+from utils.table import PAGE_SIZES
+
+# Seconds between background refreshes of each dataset, overridable with
+# REFRESH_<NAME>_INTERVAL environment variables.
+DEFAULT_INTERVALS = {
+    "orders": 60,
+    "products": 300,
+    "shipments": 120,
+}
+
+# The products table's default view, (items_per_page, sort_by, descending),
+# whose first page is refreshed in the background.
+PRODUCTS_VIEW = (PAGE_SIZES[0], "timestamp", True)
+
+# Refreshes started per second across all datasets (REFRESH_RATE), leaving
+# the rest of the store's request budget to the pages.
+DEFAULT_REFRESH_RATE = 0.2
+
+# Seconds a page waits for the first snapshot before giving up.
+FIRST_SNAPSHOT_TIMEOUT = 30
+
+
+def _interval(name: str) -> float:
+    return float(
+        os.getenv(f"REFRESH_{name.upper()}_INTERVAL", DEFAULT_INTERVALS[name])
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_refresh_worker(email: str, api_key: str) -> RefreshWorker:
+    """
+    Returns the running background worker for a set of credentials, started
+    on first use and shared by every session.
+
+    Orders are refreshed into the local mirror, so every refresh only pulls
+    what changed since the previous one; their snapshot holds the sync result
+    and the orders page reads the records from the mirror itself. Products
+    are refreshed as the first page of the products table's default view.
+    """
+    mirror = get_orders_mirror(email, api_key)
+    products = get_service("products", email, api_key)
+    shipments = get_service("shipments", email, api_key)
+
+    rate = float(os.getenv("REFRESH_RATE", DEFAULT_REFRESH_RATE))
+    worker = RefreshWorker(rate=TokenBucket(rate) if rate > 0 else None)
+    worker.add("orders", mirror.sync, _interval("orders"))
+    worker.add(
+        "products",
+        partial(fetch_table_page, products.get_products, "products", 1, *PRODUCTS_VIEW),
+        _interval("products"),
+    )
+    worker.add("shipments", shipments.send_auth_request, _interval("shipments"))
+    worker.start()
+    return worker
+
+
+def latest(name: str, email: str, api_key: str) -> Optional[Snapshot]:
+    """
+    Returns the latest snapshot of a dataset and shows how old it is, waiting
+    for the first refresh if the worker has only just started.
+
+    Returns:
+        Optional[Snapshot]: The snapshot, or None if no refresh has finished
+        within FIRST_SNAPSHOT_TIMEOUT seconds.
+    """
+    worker = get_refresh_worker(email, api_key)
+    snapshot = worker.store.get(name)
+    if snapshot is None:
+        with st.spinner(f"Loading {name}..."):
+            snapshot = worker.store.wait(name, FIRST_SNAPSHOT_TIMEOUT)
+    if snapshot is None:
+        st.info(f"The {name} are still loading, check back in a moment.")
+        return None
+
+    age = snapshot.age()
+    if age is not None:
+        st.caption(f"Updated {age:.0f}s ago")
+    if not snapshot.ok:
+        st.warning(f"Could not refresh {name}: {snapshot.error}")
+    return snapshot
+
+
+def refresh_now(name: str, email: str, api_key: str) -> None:
+    """
+    Asks the worker to refresh a dataset next, e.g. after the page wrote to it.
+    """
+    get_refresh_worker(email, api_key).refresh_now(name)
@@ -0,0 +1,122 @@
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+import streamlit as st
+
+from api.columnar import ColumnarBuilder
+from api.pagination import TablePage
+
+# Page sizes offered by the tables.
+PAGE_SIZES = (25, 50, 100)
+
+# Rows visible without scrolling; the table's height never depends on the data.
+VISIBLE_ROWS = 20
+ROW_HEIGHT = 35
+
+# Loads one page: (page, items_per_page, sort_by, descending, filters).
+PageLoader = Callable[[int, int, str, bool, Dict], TablePage]
+
+
+def _turn(page_key: str, step: int) -> None:
+    st.session_state[page_key] += step
+
+
+def paginated_table(
+    key: str,
+    load_page: PageLoader,
+    sort_fields: Dict[str, str],
+    schema: Optional[Dict] = None,
+    filters: Optional[Dict[str, str]] = None,
+    descending: bool = True,
+) -> Optional[TablePage]:
+    """
+    Draws a table showing one page of a collection at a time, with sorting,
+    filtering and paging done by whatever load_page reads from (the API or a
+    local mirror), so memory and render time stay the same however many
+    records there are.
+
+    Args:
+        key (str): Unique prefix of the table's widget keys, e.g. 'orders'.
+        load_page (PageLoader): Loads the page to show.
+        sort_fields (Dict[str, str]): Sort field by label, e.g.
+            {'Price': 'price'}; the first one is the default.
+        schema (Optional[Dict]): Column schema from api.columnar for a typed
+            frame, e.g. PRODUCT_COLUMNS. Defaults to flattening the records.
+        filters (Optional[Dict[str, str]]): Filter parameter by label, each
+            drawn as a text input, e.g. {'Name': 'q'}.
+        descending (bool): Sort in descending order by default.
+
+    Returns:
+        Optional[TablePage]: The page shown, or None if it could not be
+        loaded.
+    """
+    sort_column, order_column, size_column = st.columns(3)
+    sort_label = sort_column.selectbox("Sort by", list(sort_fields), key=f"{key}_sort")
+    order = order_column.selectbox(
+        "Order",
+        ("Descending", "Ascending"),
+        index=0 if descending else 1,
+        key=f"{key}_order",
+    )
+    items_per_page = size_column.selectbox(
+        "Rows per page", PAGE_SIZES, key=f"{key}_size"
+    )
+    values = {}
+    if filters:
+        for column, (label, param) in zip(st.columns(len(filters)), filters.items()):
+            values[param] = column.text_input(label, key=f"{key}_{param}")
+
+    # Go back to the first page whenever the query changes
+    page_key = f"{key}_page"
+    query = (sort_label, order, items_per_page, tuple(sorted(values.items())))
+    if st.session_state.get(f"{key}_query") != query:
+        st.session_state[f"{key}_query"] = query
+        st.session_state[page_key] = 1
+    page_number = st.session_state[page_key]
+
+    try:
+        page = load_page(
+            page_number,
+            items_per_page,
+            sort_fields[sort_label],
+            order == "Descending",
+            values,
+        )
+    except ConnectionError as e:
+        st.error(f"Could not load the table: {e}")
+        return None
+
+    if schema is not None:
+        frame = ColumnarBuilder(schema).extend(page.records).to_frame()
+    else:
+        frame = pd.json_normalize(page.records)
+    offset = (page.page - 1) * page.items_per_page
+    frame.index = range(offset + 1, offset + len(frame) + 1)
+    st.dataframe(
+        frame,
+        width=1000,
+        height=ROW_HEIGHT * (min(items_per_page, VISIBLE_ROWS) + 1),
+    )
+
+    previous_column, info_column, next_column = st.columns([1, 4, 1])
+    previous_column.button(
+        "Previous",
+        key=f"{key}_previous",
+        disabled=page_number <= 1,
+        on_click=_turn,
+        args=(page_key, -1),
+    )
+    next_column.button(
+        "Next",
+        key=f"{key}_next",
+        disabled=not page.has_next,
+        on_click=_turn,
+        args=(page_key, 1),
+    )
+    if page.total is None:
+        info_column.caption(f"Page {page.page}")
+    else:
+        info_column.caption(
+            f"Page {page.page} of {page.page_count} ({page.total} records)"
+        )
+    return page
@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import patch
+import requests
 from api.api_key_generation import APIKeyGeneratorService  # Update this import
 import json
 import os
@@ -16,14 +17,15 @@ class TestAPIKeyGeneratorService(unittest.TestCase):
         "ADMIN_API_KEY", "AdminAPIkey"
     )  # Fetch admin api key from env variables or default to 'AdminAPIkey'
 
-    @patch("api.api_key_generation.requests.post")  # Update this import
+    @patch("requests.Session.request")
     def test_generate_api_key_successful(self, mock_post):
         mock_response = {
             "vendor_email": "vendor@example.com",
             "api_key": "e7297267e13cbfa8ac691367c6fc3d96",
         }
         mock_post.return_value.status_code = 201
-        mock_post.return_value.json.return_value = mock_response
+        mock_post.return_value.content = json.dumps(mock_response).encode()
+        mock_post.return_value.headers = {}
 
         generator = APIKeyGeneratorService(self.admin_email, self.admin_api_key)
         response = generator.generate_api_key("vendor2@example.com")
@@ -31,26 +33,30 @@ class TestAPIKeyGeneratorService(unittest.TestCase):
 
         self.assertEqual(response, mock_response)
 
-    @patch("api.api_key_generation.requests.post")  # Update this import
+    @patch("requests.Session.request")
     def test_generate_api_key_failed(self, mock_post):
         mock_post.return_value.status_code = 400
+        mock_post.return_value.content = b'{"message": "Bad Request"}'
+        mock_post.return_value.headers = {}
+        mock_post.return_value.raise_for_status.side_effect = (
+            requests.exceptions.HTTPError("400 Client Error: Bad Request")
+        )
 
         generator = APIKeyGeneratorService(self.admin_email, self.admin_api_key)
+        response = generator.generate_api_key("vendor@example.com")
 
-        with self.assertRaises(ConnectionError):
-            generator.generate_api_key("vendor@example.com")
+        self.assertEqual(response, {"Error": "400 Client Error: Bad Request"})
 
-    @patch("api.api_key_generation.requests.post")  # Update this import
+    @patch("requests.Session.request")
     def test_generate_api_key_invalid_json(self, mock_post):
         mock_post.return_value.status_code = 200
-        mock_post.return_value.json.side_effect = json.JSONDecodeError(
-            "Invalid JSON", "", 0
-        )
+        mock_post.return_value.content = b"<html>Not JSON</html>"
+        mock_post.return_value.headers = {}
 
         generator = APIKeyGeneratorService(self.admin_email, self.admin_api_key)
+        response = generator.generate_api_key("vendor@example.com")
 
-        with self.assertRaises(ValueError):
-            generator.generate_api_key("vendor@example.com")
+        self.assertIn("Error", response)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+from api.transport import AsyncHTTPTransport
+from api.orders import AsyncOrdersService
+from api.products import AsyncProductsService
+from api.shipments import AsyncShipmentService
+
+
+def mock_response(payload):
+    response = MagicMock()
+    response.json.return_value = payload
+    return response
+
+
+class TestAsyncServices(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.transport = AsyncHTTPTransport()
+
+    async def asyncTearDown(self):
+        await self.transport.aclose()
+
+    async def test_get_orders(self):
+        orders_service = AsyncOrdersService(
+            "test@example.com", "key", transport=self.transport
+        )
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_response({"orders": [{"order_id": 1}]})
+            orders = await orders_service.get_orders({"page": 2})
+            self.assertEqual(orders, {"orders": [{"order_id": 1}]})
+            self.assertEqual(mock_request.call_args.args[0], "GET")
+            self.assertEqual(mock_request.call_args.kwargs["params"], {"page": 2})
+
+    async def test_update_product(self):
+        products_service = AsyncProductsService(
+            "test@example.com", "key", transport=self.transport
+        )
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_response({"product_id": 5})
+            result = await products_service.update_product(5, {"price": "10"})
+            self.assertEqual(result, {"product_id": 5})
+            self.assertEqual(mock_request.call_args.args[0], "PUT")
+            self.assertTrue(mock_request.call_args.args[1].endswith("/api/products/5"))
+
+    async def test_many_calls_in_flight(self):
+        orders_service = AsyncOrdersService(
+            "test@example.com", "key", transport=self.transport
+        )
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_response({"order_id": 1})
+            results = await asyncio.gather(
+                *(orders_service.get_order(i) for i in range(50))
+            )
+            self.assertEqual(len(results), 50)
+            self.assertEqual(mock_request.await_count, 50)
+
+    async def test_shipments(self):
+        shipment_service = AsyncShipmentService(
+            "test@example.com", "key", transport=self.transport
+        )
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_response({"shipments": []})
+            result = await shipment_service.send_auth_request()
+            self.assertEqual(result, {"shipments": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
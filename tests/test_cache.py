@@ -0,0 +1,175 @@
+import json
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from api.cache import ResponseCache, ValidatorCache, cache_key, endpoint_of
+from api.transport import HTTPTransport
+from api.products import ProductsService
+
+
+def make_response(payload, status_code=200, url="https://shop.example.com/api/features/"):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"Content-Type": "application/json"}
+    response.content = json.dumps(payload).encode()
+    response.url = url
+    response.json.return_value = payload
+    return response
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def test_endpoint_of(self):
+        self.assertEqual(endpoint_of("https://shop/api/products/12/options"), "/api/products/")
+        self.assertEqual(endpoint_of("https://shop/api/features/"), "/api/features/")
+
+    def test_hit_and_miss_counters(self):
+        cache = ResponseCache(ttls={"/api/features/": 60})
+        key = cache_key("https://shop/api/features/", None, {"Authorization": "Basic a"})
+        self.assertIsNone(cache.get(key))
+        cache.set(key, make_response({"features": []}))
+        self.assertEqual(cache.get(key).json(), {"features": []})
+        self.assertEqual(cache.stats()["/api/features/"]["hits"], 1)
+        self.assertEqual(cache.stats()["/api/features/"]["misses"], 1)
+
+    def test_ttl_expiry(self):
+        cache = ResponseCache(ttls={"/api/features/": 0.01})
+        key = cache_key("https://shop/api/features/", None, None)
+        cache.set(key, make_response({}))
+        time.sleep(0.02)
+        self.assertIsNone(cache.get(key))
+
+    def test_endpoints_without_ttl_are_not_cached(self):
+        cache = ResponseCache(ttls={})
+        key = cache_key("https://shop/api/orders/", None, None)
+        cache.set(key, make_response({}))
+        self.assertEqual(len(cache), 0)
+
+    def test_errors_are_not_cached(self):
+        cache = ResponseCache(ttls={"/api/features/": 60})
+        key = cache_key("https://shop/api/features/", None, None)
+        cache.set(key, make_response({}, status_code=502))
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2, ttls={"/api/features/": 60})
+        keys = [cache_key(f"https://shop/api/features/{i}", None, None) for i in range(3)]
+        cache.set(keys[0], make_response({}))
+        cache.set(keys[1], make_response({}))
+        cache.get(keys[0])
+        cache.set(keys[2], make_response({}))
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertEqual(cache.stats()["/api/features/"]["evictions"], 1)
+
+    def test_credentials_are_part_of_the_key(self):
+        self.assertNotEqual(
+            cache_key("https://shop/api/features/", None, {"Authorization": "Basic a"}),
+            cache_key("https://shop/api/features/", None, {"Authorization": "Basic b"}),
+        )
+
+
+class TestCompressedCache(unittest.TestCase):
+
+    def test_payloads_are_stored_compressed(self):
+        cache = ResponseCache(compression="zlib", ttls={"/api/products/": 60})
+        key = cache_key("https://shop/api/products/", None, None)
+        payload = {"products": [{"product": "Mug", "price": "12.75"}] * 200}
+        cache.set(key, make_response(payload))
+        self.assertEqual(cache.get(key).json(), payload)
+        self.assertEqual(cache.get(key).json(), payload)
+
+        stats = cache.compression_stats()["/api/products/"]
+        self.assertEqual(stats["raw_bytes"], len(json.dumps(payload)))
+        self.assertGreater(stats["ratio"], 10)
+        self.assertGreater(stats["compress_seconds"], 0)
+        self.assertGreater(stats["decompress_seconds"], 0)
+
+    def test_small_payloads_are_stored_as_is(self):
+        cache = ResponseCache(compression="zlib", ttls={"/api/features/": 60})
+        key = cache_key("https://shop/api/features/", None, None)
+        cache.set(key, make_response({"features": []}))
+        self.assertEqual(cache.compression_stats()["/api/features/"]["ratio"], 1.0)
+        self.assertEqual(cache.get(key).json(), {"features": []})
+
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            ResponseCache(compression="brotli")
+
+
+class TestCachedTransport(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = ResponseCache()
+        self.transport = HTTPTransport(cache=self.cache)
+        self.products_service = ProductsService(
+            "test@example.com", "key", transport=self.transport
+        )
+
+    def test_repeated_get_is_served_from_cache(self):
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value = make_response({"features": [{"feature_id": 1}]})
+            first = self.products_service.get_features()
+            second = self.products_service.get_features()
+            self.assertEqual(first, second)
+            self.assertEqual(mock_request.call_count, 1)
+
+    def test_write_invalidates_collection(self):
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value = make_response({"features": []})
+            self.products_service.get_features()
+            self.products_service.update_feature(1, {"description": "Color"})
+            self.products_service.get_features()
+            self.assertEqual(mock_request.call_count, 3)
+            self.assertEqual(self.cache.stats()["/api/features/"]["invalidations"], 1)
+
+    def test_variation_writes_invalidate_variation_groups(self):
+        groups = "/api/product_variations_groups/"
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value = make_response({"product_variations_groups": []})
+            self.products_service.get_variation_groups()
+            self.products_service.generate_variations(12, [])
+            self.products_service.get_variation_groups()
+            self.assertEqual(mock_request.call_count, 3)
+            self.assertEqual(self.cache.stats()[groups]["invalidations"], 1)
+
+
+class TestConditionalGet(unittest.TestCase):
+
+    def setUp(self):
+        self.validators = ValidatorCache()
+        self.transport = HTTPTransport(validators=self.validators)
+        self.products_service = ProductsService(
+            "test@example.com", "key", transport=self.transport
+        )
+
+    def test_revalidates_and_serves_stored_body_on_304(self):
+        fresh = make_response({"products": [{"product_id": 1}]})
+        fresh.headers = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        not_modified = make_response({})
+        not_modified.status_code = 304
+        not_modified.content = b""
+        with patch("requests.Session.request") as mock_request:
+            mock_request.side_effect = [fresh, not_modified]
+            first = self.products_service.get_products()
+            second = self.products_service.get_products()
+            self.assertEqual(first, {"products": [{"product_id": 1}]})
+            self.assertEqual(first, second)
+            headers = mock_request.call_args.kwargs["headers"]
+            self.assertEqual(headers["If-None-Match"], '"v1"')
+            self.assertEqual(headers["If-Modified-Since"], "Mon, 01 Jan 2024 00:00:00 GMT")
+        stats = self.validators.stats()["/api/products/"]
+        self.assertEqual(stats["revalidated"], 1)
+        self.assertGreater(stats["bytes_saved"], 0)
+
+    def test_responses_without_validators_are_not_stored(self):
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value = make_response({"products": []})
+            self.products_service.get_products()
+            self.products_service.get_products()
+            self.assertNotIn("If-None-Match", mock_request.call_args.kwargs["headers"])
+        self.assertEqual(len(self.validators), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
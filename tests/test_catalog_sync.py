@@ -0,0 +1,97 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from api.mirror import CatalogSync, content_hash
+from api.products import ProductsService
+from api.transport import HTTPTransport
+
+
+def product(product_id, updated, price="9.99"):
+    return {
+        "product_id": str(product_id),
+        "product": f"Product {product_id}",
+        "price": price,
+        "updated_timestamp": str(updated),
+    }
+
+
+class FakeCatalog:
+    # Answers products list requests, newest first when asked to
+
+    def __init__(self, products):
+        self.products = products
+        self.requests = []
+
+    def __call__(self, method, url, params=None, **kwargs):
+        self.requests.append(dict(params))
+        products = list(self.products)
+        if params.get("sort_by") == "updated_timestamp":
+            products.sort(key=lambda p: int(p["updated_timestamp"]), reverse=True)
+        start = (params["page"] - 1) * params["items_per_page"]
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {
+            "products": products[start : start + params["items_per_page"]],
+            "params": {"total_items": str(len(products))},
+        }
+        return response
+
+
+class TestCatalogSync(unittest.TestCase):
+
+    def setUp(self):
+        self.service = ProductsService("test@example.com", "key", transport=HTTPTransport())
+        self.store = FakeCatalog([product(i, 1000 + i) for i in range(1, 11)])
+        self.catalog = CatalogSync(self.service, stop_after=2, items_per_page=2)
+
+    def tearDown(self):
+        self.catalog.close()
+
+    def test_content_hash_tracks_values(self):
+        self.assertEqual(content_hash(product(1, 1)), content_hash(product(1, 1)))
+        self.assertNotEqual(content_hash(product(1, 1)), content_hash(product(1, 1, "5")))
+
+    def test_content_hash_ignores_key_order(self):
+        fields = product(1, 1)
+        reordered = dict(reversed(list(fields.items())))
+        self.assertNotEqual(list(fields), list(reordered))
+        self.assertEqual(content_hash(fields), content_hash(reordered))
+
+    def test_first_sync_is_a_full_reconcile(self):
+        with patch("requests.Session.request", side_effect=self.store):
+            delta = self.catalog.sync()
+        self.assertEqual(delta["inserted"], list(range(1, 11)))
+        self.assertEqual(self.catalog.count(), 10)
+        self.assertIsNotNone(self.catalog.last_reconciled())
+
+    def test_incremental_sync_stops_at_unchanged_products(self):
+        with patch("requests.Session.request", side_effect=self.store):
+            self.catalog.sync()
+            self.store.products[9] = product(10, 2000, price="1.00")
+            self.store.products.append(product(11, 2001))
+            self.store.requests.clear()
+            delta = self.catalog.sync()
+        self.assertEqual(delta, {"inserted": [11], "updated": [10], "deleted": []})
+        # Two changed products, then two unchanged ones: two pages of two
+        self.assertEqual(len(self.store.requests), 2)
+        self.assertEqual(self.store.requests[0]["sort_by"], "updated_timestamp")
+        self.assertEqual(self.catalog.get(10)["price"], "1.00")
+
+    def test_reconcile_detects_deletions(self):
+        with patch("requests.Session.request", side_effect=self.store):
+            self.catalog.sync()
+            del self.store.products[4]
+            self.assertEqual(self.catalog.sync()["deleted"], [])
+            delta = self.catalog.reconcile()
+        self.assertEqual(delta, {"inserted": [], "updated": [], "deleted": [5]})
+        self.assertIsNone(self.catalog.get(5))
+
+    def test_reconcile_when_due(self):
+        self.catalog.reconcile_interval = 0
+        with patch("requests.Session.request", side_effect=self.store):
+            self.catalog.sync()
+            del self.store.products[0]
+            self.assertEqual(self.catalog.sync()["deleted"], [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+from api.transport import AsyncHTTPTransport, HTTPTransport, SingleFlight
+from api.orders import AsyncOrdersService, OrdersService
+
+
+def slow_response(*args, **kwargs):
+    time.sleep(0.05)
+    response = MagicMock()
+    response.json.return_value = {"orders": [{"order_id": 1}]}
+    return response
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_concurrent_calls_share_one_call(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            time.sleep(0.05)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            results = list(pool.map(lambda _: single_flight.do("key", fn), range(5)))
+        self.assertEqual(results, ["result"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(single_flight.coalesced, 4)
+
+    def test_exception_is_shared(self):
+        single_flight = SingleFlight()
+        with self.assertRaises(ConnectionError):
+            single_flight.do("key", lambda: (_ for _ in ()).throw(ConnectionError()))
+        self.assertEqual(single_flight.do("key", lambda: 1), 1)
+
+    def test_identical_get_orders_are_coalesced(self):
+        orders_service = OrdersService(
+            "test@example.com", "key", transport=HTTPTransport(coalesce=True)
+        )
+        with patch("requests.Session.request", side_effect=slow_response) as mock_request:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(lambda _: orders_service.get_orders({"page": 1}), range(4)))
+            self.assertEqual(mock_request.call_count, 1)
+            self.assertTrue(all(r == results[0] for r in results))
+
+    def test_different_params_are_not_coalesced(self):
+        orders_service = OrdersService(
+            "test@example.com", "key", transport=HTTPTransport(coalesce=True)
+        )
+        with patch("requests.Session.request", side_effect=slow_response) as mock_request:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                list(pool.map(lambda p: orders_service.get_orders({"page": p}), [1, 2]))
+            self.assertEqual(mock_request.call_count, 2)
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+
+    async def test_identical_get_orders_are_coalesced(self):
+        transport = AsyncHTTPTransport(coalesce=True)
+        orders_service = AsyncOrdersService("test@example.com", "key", transport=transport)
+
+        async def respond(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            response = MagicMock()
+            response.json.return_value = {"orders": []}
+            return response
+
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = respond
+            results = await asyncio.gather(*(orders_service.get_orders() for _ in range(10)))
+            self.assertEqual(mock_request.await_count, 1)
+            self.assertEqual(len(results), 10)
+            self.assertEqual(transport.single_flight.coalesced, 9)
+        await transport.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+from api.codec import JSON_BACKEND, JSONDecodeError, decode_response, dumps, loads
+from api.auth import AuthService
+from api.orders import OrdersService
+from api.transport import HTTPTransport
+
+
+class TestJsonCodec(unittest.TestCase):
+
+    def test_round_trip_from_bytes(self):
+        payload = {"order_id": 1, "status": "P", "total": 10.5, "notes": "café"}
+        encoded = dumps(payload)
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(loads(encoded), payload)
+        self.assertEqual(json.loads(encoded), payload)
+
+    def test_sort_keys(self):
+        self.assertEqual(
+            dumps({"b": 1, "a": {"d": 2, "c": 3}}, sort_keys=True),
+            dumps({"a": {"c": 3, "d": 2}, "b": 1}, sort_keys=True),
+        )
+
+    def test_invalid_json_raises_stdlib_error(self):
+        with self.assertRaises(JSONDecodeError):
+            loads(b"{not json")
+        self.assertTrue(issubclass(JSONDecodeError, ValueError))
+
+    def test_backend(self):
+        self.assertIn(JSON_BACKEND, ("orjson", "ujson", "json"))
+
+    def test_decode_response_reads_raw_bytes(self):
+        response = MagicMock()
+        response.content = b'{"orders": []}'
+        self.assertEqual(decode_response(response), {"orders": []})
+        response.json.assert_not_called()
+
+    def test_decode_response_no_content(self):
+        response = MagicMock(status_code=204, content=b"")
+        self.assertIsNone(decode_response(response))
+
+
+class TestServicesUseCodec(unittest.TestCase):
+
+    def test_response_is_decoded_from_content(self):
+        orders_service = OrdersService("test@example.com", "key", transport=HTTPTransport())
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value.content = b'{"order_id": 7}'
+            self.assertEqual(orders_service.get_order(7), {"order_id": 7})
+
+    def test_invalid_body_is_reported(self):
+        orders_service = OrdersService("test@example.com", "key", transport=HTTPTransport())
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value.content = b"<html>"
+            self.assertIn("Error", orders_service.get_order(7))
+
+    def test_json_payload_is_encoded_by_codec(self):
+        orders_service = OrdersService("test@example.com", "key", transport=HTTPTransport())
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value.content = b'{"order_id": 8}'
+            orders_service.create_order({"user_id": 1})
+        kwargs = mock_request.call_args.kwargs
+        self.assertIsNone(kwargs["json"])
+        self.assertEqual(loads(kwargs["data"]), {"user_id": 1})
+        self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
+
+    def test_auth_request_body(self):
+        auth_service = AuthService("admin@example.com", "key", transport=HTTPTransport())
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value.status_code = 200
+            mock_request.return_value.content = b'{"key": "k", "link": "l"}'
+            result = auth_service.send_auth_request("user@example.com")
+        self.assertEqual(result, {"Session Key": "k", "Authentication Link": "l"})
+        self.assertEqual(loads(mock_request.call_args.kwargs["data"]), {"email": "user@example.com"})
+
+
+if __name__ == "__main__":
+    unittest.main()
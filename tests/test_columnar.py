@@ -0,0 +1,104 @@
+import math
+import unittest
+from unittest.mock import MagicMock, patch
+from api.columnar import ORDER_COLUMNS, ColumnarBuilder
+from api.columnar import frames
+from api.orders import OrdersService
+from api.transport import HTTPTransport
+
+
+ORDERS = [
+    {
+        "order_id": "101",
+        "status": "P",
+        "company": "Simtech",
+        "timestamp": "1700000000",
+        "total": "25.50",
+        "notes": "Leave at the door",
+        "products": {"9": {"product_id": "12"}},
+    },
+    {"order_id": "102", "status": "C", "company": "Simtech", "total": "n/a"},
+    {"order_id": "103", "status": "P", "timestamp": "", "total": "3"},
+]
+
+
+def paged_orders(method, url, params=None, **kwargs):
+    start = (params["page"] - 1) * params["items_per_page"]
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "orders": ORDERS[start : start + params["items_per_page"]],
+        "params": {"total_items": str(len(ORDERS))},
+    }
+    return response
+
+
+class TestColumnarBuilder(unittest.TestCase):
+
+    def test_columns_are_typed_buffers(self):
+        builder = ColumnarBuilder(ORDER_COLUMNS).extend(iter(ORDERS))
+        columns = builder._columns
+        self.assertEqual(len(builder), 3)
+        self.assertEqual(columns["order_id"].values.typecode, "q")
+        self.assertEqual(list(columns["order_id"].values), [101, 102, 103])
+        self.assertEqual(columns["total"].values[0], 25.5)
+        self.assertTrue(math.isnan(columns["total"].values[1]))
+        self.assertEqual(list(columns["timestamp"].mask), [0, 1, 1])
+
+    def test_low_cardinality_strings_are_dictionary_encoded(self):
+        builder = ColumnarBuilder(ORDER_COLUMNS).extend(ORDERS)
+        status = builder._columns["status"]
+        self.assertEqual(list(status.values), [0, 1, 0])
+        self.assertEqual(list(status.categories), ["P", "C"])
+        self.assertEqual(list(builder._columns["company"].values), [0, 0, -1])
+
+    def test_extra_fields_are_backfilled(self):
+        builder = ColumnarBuilder({"order_id": "int"}).extend(
+            [{"order_id": "1"}, {"order_id": "2", "notes": "x", "products": []}]
+        )
+        self.assertEqual(builder._columns["notes"].values, [None, "x"])
+        self.assertNotIn("products", builder._columns)
+        strict = ColumnarBuilder({"order_id": "int"}, include_extra=False).extend(ORDERS)
+        self.assertEqual(list(strict._columns), ["order_id"])
+
+    @unittest.skipUnless(frames.pd is None, "pandas is installed")
+    def test_to_frame_requires_pandas(self):
+        with self.assertRaises(ImportError):
+            ColumnarBuilder(ORDER_COLUMNS).to_frame()
+
+
+@unittest.skipIf(frames.pd is None or frames.np is None, "pandas is not installed")
+class TestToFrame(unittest.TestCase):
+
+    def test_dtypes(self):
+        frame = ColumnarBuilder(ORDER_COLUMNS).extend(ORDERS).to_frame()
+        self.assertEqual(str(frame["order_id"].dtype), "int64")
+        self.assertEqual(str(frame["total"].dtype), "float64")
+        self.assertEqual(str(frame["status"].dtype), "category")
+        self.assertTrue(str(frame["timestamp"].dtype).startswith("datetime64"))
+        self.assertEqual(frame["timestamp"].isna().tolist(), [False, True, True])
+        self.assertEqual(frame["notes"].tolist(), ["Leave at the door", None, None])
+
+    def test_service_builds_frame_page_by_page(self):
+        orders_service = OrdersService("test@example.com", "key", transport=HTTPTransport())
+        with patch("requests.Session.request", side_effect=paged_orders) as mock_request:
+            frame = orders_service.to_frame(items_per_page=2)
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(frame["order_id"].tolist(), [101, 102, 103])
+
+
+@unittest.skipIf(frames.pa is None or frames.np is None, "pyarrow is not installed")
+class TestToArrow(unittest.TestCase):
+
+    def test_types(self):
+        import pyarrow as pa
+
+        table = ColumnarBuilder(ORDER_COLUMNS).extend(ORDERS).to_arrow()
+        self.assertEqual(table.schema.field("order_id").type, pa.int64())
+        self.assertEqual(table.schema.field("timestamp").type, pa.timestamp("s"))
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("status").type))
+        self.assertEqual(table.column("timestamp").null_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
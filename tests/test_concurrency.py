@@ -0,0 +1,131 @@
+import threading
+import time
+import unittest
+from api.transport import (
+    AdaptiveConcurrencyLimiter,
+    AsyncAdaptiveConcurrencyLimiter,
+    arun_bulk,
+    is_overloaded,
+    run_bulk,
+)
+from api.pagination import afetch_all_pages, fetch_all_pages
+
+
+class TestIsOverloaded(unittest.TestCase):
+
+    def test_classification(self):
+        self.assertTrue(is_overloaded({"Error": "429 Client Error: Too Many Requests"}))
+        self.assertTrue(is_overloaded({"Error": "503 Server Error: Service Unavailable"}))
+        self.assertTrue(is_overloaded({"Error": "Connection aborted."}))
+        self.assertTrue(is_overloaded(RuntimeError("boom")))
+        self.assertFalse(is_overloaded({"Error": "404 Client Error: Not Found"}))
+        self.assertFalse(is_overloaded({"order_id": 1}))
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+
+    def test_additive_increase(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=10)
+        for _ in range(2):
+            limiter.acquire()
+            limiter.release(0.01)
+        # One full window of healthy calls adds about one slot
+        self.assertAlmostEqual(limiter.limit, 2.9, places=1)
+
+    def test_multiplicative_decrease(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=10)
+        limiter.acquire()
+        limiter.release(0.01, overloaded=True)
+        self.assertEqual(limiter.limit, 4)
+
+    def test_one_cut_per_round_trip(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=10)
+        limiter.release(0.01)
+        limiter._last_decrease = 0.0
+        for _ in range(3):
+            limiter.release(10.0, overloaded=True)
+        self.assertAlmostEqual(limiter.limit, 8.125 / 2)
+
+    def test_latency_spike_cuts(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=10, latency_threshold=0.5)
+        limiter.release(1.0)
+        self.assertEqual(limiter.limit, 4)
+
+    def test_bounds(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=1, min_limit=1, max_limit=2)
+        limiter.release(0.01, overloaded=True)
+        self.assertEqual(limiter.limit, 1)
+        for _ in range(20):
+            limiter.release(0.01)
+        self.assertEqual(limiter.limit, 2)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrencyLimiter(initial=10, max_limit=5)
+
+
+class TestRunBulk(unittest.TestCase):
+
+    def test_in_flight_stays_under_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=2)
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def call(item):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return item * 2
+
+        self.assertEqual(run_bulk(call, range(8), limiter), [0, 2, 4, 6, 8, 10, 12, 14])
+        self.assertLessEqual(peak[0], 2)
+
+    def test_errors_shrink_the_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=8)
+        run_bulk(lambda item: {"Error": "503 Server Error"}, range(4), limiter)
+        self.assertLess(limiter.limit, 8)
+
+    def test_fetch_all_pages_with_limiter(self):
+        def fetch_page(params):
+            page = params["page"]
+            return {"orders": [{"order_id": page}], "params": {"total_items": "5"}}
+
+        result = fetch_all_pages(
+            fetch_page, "orders", items_per_page=1,
+            concurrency=AdaptiveConcurrencyLimiter(initial=2),
+        )
+        self.assertEqual([o["order_id"] for o in result["orders"]], [1, 2, 3, 4, 5])
+
+
+class TestAsyncRunBulk(unittest.IsolatedAsyncioTestCase):
+
+    async def test_arun_bulk_keeps_order(self):
+        async def call(item):
+            return item + 1
+
+        limiter = AsyncAdaptiveConcurrencyLimiter(initial=2)
+        self.assertEqual(await arun_bulk(call, [1, 2, 3], limiter), [2, 3, 4])
+        self.assertEqual(limiter.in_flight, 0)
+
+    async def test_afetch_all_pages_requires_async_limiter(self):
+        async def fetch_page(params):
+            return {"orders": [{}], "params": {"total_items": "3"}}
+
+        with self.assertRaises(ValueError):
+            await afetch_all_pages(
+                fetch_page, "orders", items_per_page=1,
+                concurrency=AdaptiveConcurrencyLimiter(),
+            )
+        result = await afetch_all_pages(
+            fetch_page, "orders", items_per_page=1,
+            concurrency=AsyncAdaptiveConcurrencyLimiter(),
+        )
+        self.assertEqual(len(result["orders"]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import TimeoutError as FutureTimeout
+from unittest.mock import patch
+from api.dashboard import aload_concurrently, load_concurrently
+
+
+def after(seconds, result):
+    def load():
+        time.sleep(seconds)
+        return result
+
+    return load
+
+
+class TestLoadConcurrently(unittest.TestCase):
+
+    def test_sections_arrive_in_completion_order(self):
+        tasks = {
+            "orders": after(0.3, {"orders": []}),
+            "products": after(0.1, {"products": []}),
+            "stores": after(0.2, {"stores": []}),
+        }
+        start = time.monotonic()
+        names = [section.name for section in load_concurrently(tasks)]
+        self.assertEqual(names, ["products", "stores", "orders"])
+        # The slowest call, not the sum of all of them
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_failures_do_not_stop_other_sections(self):
+        def broken():
+            raise ConnectionError("reset")
+
+        tasks = {
+            "orders": broken,
+            "vendors": lambda: {"Error": "401 Unauthorized"},
+            "stores": lambda: {"stores": [1]},
+        }
+        sections = {section.name: section for section in load_concurrently(tasks)}
+        self.assertEqual(sections["orders"].error, "reset")
+        self.assertEqual(sections["vendors"].error, "401 Unauthorized")
+        self.assertIsNone(sections["vendors"].data)
+        self.assertTrue(sections["stores"].ok)
+        self.assertEqual(sections["stores"].data, {"stores": [1]})
+
+    def test_timeout(self):
+        tasks = {"fast": after(0, 1), "slow": after(1, 2)}
+        start = time.monotonic()
+        sections = {section.name: section for section in load_concurrently(tasks, timeout=0.1)}
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertTrue(sections["fast"].ok)
+        self.assertIn("Timed out", sections["slow"].error)
+
+    def test_timeout_of_the_futures_module(self):
+        # concurrent.futures.TimeoutError is not the builtin before Python 3.11
+        tasks = {"orders": after(0.5, 1), "users": after(0.5, 2)}
+        with patch("api.dashboard.loader.as_completed", side_effect=FutureTimeout):
+            sections = list(load_concurrently(tasks, timeout=0.1))
+        self.assertEqual({section.name for section in sections}, {"orders", "users"})
+        self.assertTrue(all("Timed out" in section.error for section in sections))
+
+
+class TestAsyncLoadConcurrently(unittest.IsolatedAsyncioTestCase):
+
+    async def test_sections_arrive_in_completion_order(self):
+        async def after_async(seconds, result):
+            await asyncio.sleep(seconds)
+            return result
+
+        tasks = {
+            "orders": lambda: after_async(0.2, {"orders": []}),
+            "products": lambda: after_async(0.05, {"products": []}),
+            "stores": lambda: after_async(5, {"stores": []}),
+        }
+        sections = [section async for section in aload_concurrently(tasks, timeout=0.5)]
+        self.assertEqual([s.name for s in sections], ["products", "orders", "stores"])
+        self.assertIn("Timed out", sections[-1].error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+import requests
+
+# The client's modules are imported as top-level packages, as Streamlit does
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "src", "app", "client")
+)
+
+try:
+    import streamlit
+    from utils import data
+except ImportError:  # pragma: no cover - depends on the installed extras
+    data = None
+
+EMAIL = "vendor@example.com"
+API_KEY = "key"
+
+
+def respond(status_code, body=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = "Bad Request"
+    response.json.return_value = body
+    response.content = None
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            f"{status_code} Client Error"
+        )
+    return response
+
+
+@unittest.skipIf(data is None, "streamlit is not installed")
+class TestDataLayer(unittest.TestCase):
+
+    def setUp(self):
+        data.invalidate()
+
+    def test_fetch_memoizes_results(self):
+        body = {"shipment": [{"shipment_id": "1"}]}
+        with patch("requests.Session.request", return_value=respond(200, body)) as m:
+            for _ in range(3):
+                result = data.fetch("shipments", "send_auth_request", EMAIL, API_KEY)
+        self.assertEqual(result, body)
+        self.assertEqual(m.call_count, 1)
+
+    def test_fetch_raises_and_does_not_memoize_errors(self):
+        with patch("requests.Session.request", return_value=respond(400)) as m:
+            for _ in range(2):
+                with self.assertRaises(ConnectionError):
+                    data.fetch("orders", "get_orders", EMAIL, API_KEY, {"page": 1})
+        self.assertEqual(m.call_count, 2)
+
+    def test_count_falls_back_to_none(self):
+        with patch("requests.Session.request", return_value=respond(400)):
+            self.assertIsNone(data.count("orders", EMAIL, API_KEY))
+
+    def test_count(self):
+        body = {"users": [{"user_id": "1"}], "params": {"total_items": "7"}}
+        with patch("requests.Session.request", return_value=respond(200, body)) as m:
+            self.assertEqual(data.count("users", EMAIL, API_KEY, user_type="V"), 7)
+        self.assertEqual(m.call_args.kwargs["params"]["user_type"], "V")
+
+    def test_api_page_raises_on_errors(self):
+        with patch("requests.Session.request", return_value=respond(400)):
+            with self.assertRaises(ConnectionError):
+                data.api_page("products", EMAIL, API_KEY, 1, 25, "price", True, {})
+
+    def test_api_page_pushes_sorting_down(self):
+        body = {"users": [{"user_id": "1"}], "params": {"total_items": "60"}}
+        with patch("requests.Session.request", return_value=respond(200, body)) as m:
+            page = data.api_page(
+                "users", EMAIL, API_KEY, 2, 25, "name", False, {"user_type": "V"}
+            )
+        params = m.call_args.kwargs["params"]
+        self.assertEqual(params["page"], 2)
+        self.assertEqual(params["sort_by"], "name")
+        self.assertEqual(params["sort_order"], "asc")
+        self.assertEqual(params["user_type"], "V")
+        self.assertEqual((page.records, page.page_count), ([{"user_id": "1"}], 3))
+
+    def test_write_invalidates(self):
+        body = {"orders": [], "params": {"total_items": "0"}}
+        with patch("requests.Session.request", return_value=respond(200, body)) as m:
+            data.fetch("orders", "get_orders", EMAIL, API_KEY, {"page": 1})
+            data.write("orders", "create_order", EMAIL, API_KEY, {"status": "P"})
+            data.fetch("orders", "get_orders", EMAIL, API_KEY, {"page": 1})
+        self.assertEqual(m.call_count, 3)
+
+    def test_write_invalidates_other_collections(self):
+        body = {"users": [{"user_id": "1"}], "params": {"total_items": "7"}}
+        with patch("requests.Session.request", return_value=respond(200, body)) as m:
+            data.count("users", EMAIL, API_KEY)
+            data.write("orders", "create_order", EMAIL, API_KEY, {"status": "P"})
+            data.count("users", EMAIL, API_KEY)
+        self.assertEqual(m.call_count, 3)
+
+    def test_store_path_is_per_account(self):
+        first = data.store_path("orders_mirror.db", EMAIL, API_KEY)
+        second = data.store_path("orders_mirror.db", "other@example.com", API_KEY)
+        self.assertNotEqual(first, second)
+        self.assertTrue(first.startswith("orders_mirror-"))
+        self.assertTrue(first.endswith(".db"))
+        self.assertEqual(data.store_path(":memory:", EMAIL, API_KEY), ":memory:")
+
+
+if __name__ == "__main__":
+    unittest.main()
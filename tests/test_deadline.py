@@ -0,0 +1,271 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+import requests
+from api.transport import (
+    AsyncHTTPTransport,
+    DeadlineExceeded,
+    HedgePolicy,
+    HTTPTransport,
+    RateLimiterRegistry,
+    RetryPolicy,
+    call_deadline,
+    cap_timeout,
+    time_remaining,
+)
+from api.orders import AsyncOrdersService, OrdersService
+
+
+def make_response(status_code, payload=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {}
+    response.json.return_value = payload or {}
+    return response
+
+
+def warmed_policy(url, latency=0.01, samples=20):
+    policy = HedgePolicy(min_samples=samples)
+    for _ in range(samples):
+        policy.observe(url, latency)
+    return policy
+
+
+class TestCallDeadline(unittest.TestCase):
+
+    def test_nested_deadline_only_shortens(self):
+        self.assertIsNone(time_remaining())
+        with call_deadline(1.0):
+            with call_deadline(10.0):
+                self.assertLessEqual(time_remaining(), 1.0)
+        self.assertIsNone(time_remaining())
+
+    def test_cap_timeout(self):
+        self.assertEqual(cap_timeout((5.0, 30.0), 2.0), (2.0, 2.0))
+        self.assertEqual(cap_timeout(1.0, 2.0), 1.0)
+        self.assertEqual(cap_timeout((5.0, 30.0), None), (5.0, 30.0))
+
+    def test_attempt_timeout_is_capped(self):
+        transport = HTTPTransport()
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value = make_response(200)
+            with call_deadline(2.0):
+                transport.get("https://shop.example.com/api/orders/")
+        connect, read = mock_request.call_args.kwargs["timeout"]
+        self.assertLessEqual(read, 2.0)
+
+    def test_no_retry_past_the_deadline(self):
+        transport = HTTPTransport(retry=RetryPolicy(backoff_factor=10, jitter=False))
+        orders_service = OrdersService("test@example.com", "key", transport=transport)
+        with patch("requests.Session.request") as mock_request:
+            mock_request.side_effect = requests.exceptions.ConnectionError("reset")
+            start = time.monotonic()
+            with call_deadline(1.0):
+                result = orders_service.get_orders()
+            self.assertIn("Error", result)
+            self.assertEqual(mock_request.call_count, 1)
+            self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_expired_deadline_is_reported(self):
+        transport = HTTPTransport(deadline=0)
+        orders_service = OrdersService("test@example.com", "key", transport=transport)
+        with patch("requests.Session.request") as mock_request:
+            self.assertIn("Deadline exceeded", orders_service.get_order(1)["Error"])
+            mock_request.assert_not_called()
+        with self.assertRaises(DeadlineExceeded):
+            transport.get("https://shop.example.com/api/orders/")
+
+    def test_rate_limit_wait_is_capped_by_the_deadline(self):
+        registry = RateLimiterRegistry()
+        registry.configure_user("test@example.com", "key", rate=0.1, capacity=1)
+        transport = HTTPTransport(deadline=0.5, rate_limits=registry)
+        orders_service = OrdersService("test@example.com", "key", transport=transport)
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value = make_response(200)
+            orders_service.get_order(1)
+            start = time.monotonic()
+            result = orders_service.get_order(2)
+            self.assertIn("Deadline exceeded", result["Error"])
+            self.assertEqual(mock_request.call_count, 1)
+            self.assertLess(time.monotonic() - start, 0.5)
+
+
+class TestHedgePolicy(unittest.TestCase):
+
+    def test_no_delay_until_warmed_up(self):
+        url = "https://shop.example.com/api/orders/1"
+        policy = HedgePolicy(min_samples=5)
+        self.assertIsNone(policy.hedge_delay(url))
+        for latency in (0.1, 0.2, 0.3, 0.4, 1.0):
+            policy.observe(url, latency)
+        self.assertEqual(policy.hedge_delay(url), 1.0)
+        self.assertIsNone(policy.hedge_delay("https://shop.example.com/api/products/1"))
+
+    def test_endpoint_allowlist(self):
+        policy = HedgePolicy(min_samples=1, endpoints=["/api/features/"])
+        policy.observe("https://shop.example.com/api/orders/1", 0.1)
+        self.assertIsNone(policy.hedge_delay("https://shop.example.com/api/orders/1"))
+
+    def test_hedge_slots(self):
+        policy = HedgePolicy(max_hedges=1)
+        self.assertTrue(policy.start_hedge())
+        self.assertFalse(policy.start_hedge())
+        policy.finish_hedge()
+        self.assertTrue(policy.start_hedge())
+        with self.assertRaises(ValueError):
+            HedgePolicy(max_hedges=0)
+
+
+class TestHedgedRequests(unittest.TestCase):
+
+    def slow_then_fast(self, transport, url):
+        release = threading.Event()
+        calls = []
+
+        def request(method, url, **kwargs):
+            calls.append(url)
+            if len(calls) == 1:
+                release.wait(0.3)
+                return make_response(200, {"order_id": "slow"})
+            return make_response(200, {"order_id": "fast"})
+
+        with patch("requests.Session.request", side_effect=request):
+            response = transport.get(url)
+        release.set()
+        return response, calls
+
+    def test_slow_request_is_hedged(self):
+        url = "https://shop.example.com/api/orders/1"
+        transport = HTTPTransport(hedge=warmed_policy(url))
+        slow = make_response(200, {"order_id": "slow"})
+        fast = make_response(200, {"order_id": "fast"})
+        release = threading.Event()
+        calls = []
+
+        def request(method, url, **kwargs):
+            calls.append(url)
+            if len(calls) == 1:
+                release.wait(2)
+                return slow
+            return fast
+
+        with patch("requests.Session.request", side_effect=request):
+            self.assertEqual(transport.get(url).json(), {"order_id": "fast"})
+        release.set()
+        metrics = transport.metrics.snapshot()["GET"]
+        self.assertEqual(metrics["hedged"], 1)
+        self.assertEqual(metrics["hedge_wins"], 1)
+        transport.close()
+
+    def test_hedges_are_capped(self):
+        url = "https://shop.example.com/api/orders/1"
+        policy = warmed_policy(url)
+        policy.max_hedges = 1
+        self.assertTrue(policy.start_hedge())
+        transport = HTTPTransport(hedge=policy)
+        response, calls = self.slow_then_fast(transport, url)
+        self.assertEqual(response.json(), {"order_id": "slow"})
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(transport.metrics.snapshot()["GET"]["hedges_skipped"], 1)
+        transport.close()
+
+    def test_no_hedge_when_the_pool_is_busy(self):
+        url = "https://shop.example.com/api/orders/1"
+        transport = HTTPTransport(pool_maxsize=1, hedge=warmed_policy(url))
+        response, calls = self.slow_then_fast(transport, url)
+        self.assertEqual(response.json(), {"order_id": "slow"})
+        self.assertEqual(len(calls), 1)
+        transport.close()
+
+    def test_hedge_slot_is_given_back(self):
+        url = "https://shop.example.com/api/orders/1"
+        policy = warmed_policy(url)
+        transport = HTTPTransport(hedge=policy)
+        response, calls = self.slow_then_fast(transport, url)
+        self.assertEqual(response.json(), {"order_id": "fast"})
+        transport._hedge_pool.shutdown(wait=True)
+        self.assertEqual(policy._hedges, 0)
+        transport.close()
+
+    def test_fast_request_is_not_hedged(self):
+        url = "https://shop.example.com/api/orders/1"
+        transport = HTTPTransport(hedge=warmed_policy(url, latency=1.0))
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value = make_response(200)
+            transport.get(url)
+            self.assertEqual(mock_request.call_count, 1)
+        transport.close()
+
+
+class TestAsyncDeadlineAndHedging(unittest.IsolatedAsyncioTestCase):
+
+    async def test_expired_deadline_is_reported(self):
+        transport = AsyncHTTPTransport(deadline=0)
+        orders_service = AsyncOrdersService("test@example.com", "key", transport=transport)
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+            self.assertIn("Error", await orders_service.get_order(1))
+            mock_request.assert_not_called()
+        await transport.aclose()
+
+    async def test_rate_limit_wait_is_capped_by_the_deadline(self):
+        registry = RateLimiterRegistry()
+        registry.configure_user("test@example.com", "key", rate=0.1, capacity=1)
+        transport = AsyncHTTPTransport(deadline=0.5, rate_limits=registry)
+        orders_service = AsyncOrdersService("test@example.com", "key", transport=transport)
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = make_response(200)
+            await orders_service.get_order(1)
+            start = time.monotonic()
+            self.assertIn("Error", await orders_service.get_order(2))
+            self.assertEqual(mock_request.call_count, 1)
+            self.assertLess(time.monotonic() - start, 0.5)
+        await transport.aclose()
+
+    async def test_slow_request_is_hedged_and_loser_cancelled(self):
+        url = "https://shop.example.com/api/orders/1"
+        transport = AsyncHTTPTransport(hedge=warmed_policy(url))
+        cancelled = asyncio.Event()
+        calls = []
+
+        async def request(method, url, **kwargs):
+            calls.append(url)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return make_response(200, {"order_id": len(calls)})
+
+        with patch("httpx.AsyncClient.request", side_effect=request):
+            response = await transport.get(url)
+        self.assertEqual(response.json(), {"order_id": 2})
+        await asyncio.wait_for(cancelled.wait(), 1)
+        self.assertEqual(transport.metrics.snapshot()["GET"]["hedge_wins"], 1)
+        await transport.aclose()
+
+    async def test_hedges_are_capped(self):
+        url = "https://shop.example.com/api/orders/1"
+        policy = warmed_policy(url)
+        policy.max_hedges = 1
+        self.assertTrue(policy.start_hedge())
+        transport = AsyncHTTPTransport(hedge=policy)
+        calls = []
+
+        async def request(method, url, **kwargs):
+            calls.append(url)
+            await asyncio.sleep(0.1 if len(calls) == 1 else 0)
+            return make_response(200, {"order_id": len(calls)})
+
+        with patch("httpx.AsyncClient.request", side_effect=request):
+            response = await transport.get(url)
+        self.assertEqual(response.json(), {"order_id": 1})
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(transport.metrics.snapshot()["GET"]["hedges_skipped"], 1)
+        await transport.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
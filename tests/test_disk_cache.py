@@ -0,0 +1,119 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from api.cache import DiskResponseCache, cache_key, disk_cache_from_env
+from api.transport import HTTPTransport
+from api.products import ProductsService
+
+
+def make_response(payload, status_code=200, url="https://shop.example.com/api/features/"):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"Content-Type": "application/json"}
+    response.content = json.dumps(payload).encode()
+    response.url = url
+    response.json.return_value = payload
+    return response
+
+
+class TestDiskResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache.db")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_entries_survive_a_restart(self):
+        key = cache_key("https://shop/api/features/", None, {"Authorization": "Basic secret"})
+        cache = DiskResponseCache(self.path, ttls={"/api/features/": 60})
+        cache.set(key, make_response({"features": [1, 2, 3]}))
+        cache.close()
+
+        restarted = DiskResponseCache(self.path, ttls={"/api/features/": 60})
+        cached = restarted.get(key)
+        self.assertEqual(cached.json(), {"features": [1, 2, 3]})
+        self.assertEqual(cached.headers["content-type"], "application/json")
+        self.assertEqual(restarted.stats()["/api/features/"]["hits"], 1)
+        restarted.close()
+        with open(self.path, "rb") as f:
+            self.assertNotIn(b"secret", f.read())
+
+    def test_payloads_are_compressed(self):
+        cache = DiskResponseCache(self.path, ttls={"/api/features/": 60})
+        payload = {"features": [{"description": "Colour"}] * 500}
+        cache.set(cache_key("https://shop/api/features/", None, None), make_response(payload))
+        self.assertLess(cache.size(), len(json.dumps(payload)) / 10)
+        cache.close()
+
+    def test_ttl_expiry_and_invalidation(self):
+        cache = DiskResponseCache(self.path, ttls={"/api/features/": 0.01, "/api/products/": 60})
+        features = cache_key("https://shop/api/features/", None, None)
+        products = cache_key("https://shop/api/products/", None, None)
+        cache.set(features, make_response({}))
+        cache.set(products, make_response({}))
+        time.sleep(0.02)
+        self.assertIsNone(cache.get(features))
+        cache.invalidate("https://shop/api/products/12")
+        self.assertIsNone(cache.get(products))
+        self.assertEqual(cache.stats()["/api/products/"]["invalidations"], 1)
+        cache.close()
+
+    def test_related_collections_are_invalidated(self):
+        cache = DiskResponseCache(self.path)
+        groups = cache_key("https://shop/api/product_variations_groups/", None, None)
+        cache.set(groups, make_response({}))
+        cache.invalidate("https://shop/api/products/12/detach_product_variation")
+        self.assertIsNone(cache.get(groups))
+        cache.close()
+
+    def test_lru_eviction(self):
+        cache = DiskResponseCache(self.path, max_entries=2, ttls={"/api/features/": 60})
+        keys = [cache_key(f"https://shop/api/features/{i}", None, None) for i in range(3)]
+        cache.set(keys[0], make_response({}))
+        cache.set(keys[1], make_response({}))
+        cache.get(keys[0])
+        cache.set(keys[2], make_response({}))
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertEqual(cache.stats()["/api/features/"]["evictions"], 1)
+        cache.close()
+
+    def test_byte_cap(self):
+        cache = DiskResponseCache(
+            self.path, max_bytes=200, compress_level=0, ttls={"/api/features/": 60}
+        )
+        for i in range(3):
+            key = cache_key(f"https://shop/api/features/{i}", None, None)
+            cache.set(key, make_response({"padding": "x" * 80}))
+        self.assertLessEqual(cache.size(), 200)
+        self.assertEqual(len(cache), 1)
+        cache.close()
+
+    def test_transport_serves_gets_from_disk(self):
+        cache = DiskResponseCache(self.path, ttls={"/api/features/": 60})
+        transport = HTTPTransport(cache=cache)
+        products_service = ProductsService("test@example.com", "key", transport=transport)
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value = make_response({"features": []})
+            products_service.get_features()
+            self.assertEqual(products_service.get_features(), {"features": []})
+            self.assertEqual(mock_request.call_count, 1)
+        cache.close()
+
+    def test_cache_from_env(self):
+        with patch.dict(os.environ, {"CSCART_CACHE_PATH": self.path, "CSCART_CACHE_TTL": "30"}):
+            cache = disk_cache_from_env()
+        self.assertEqual(cache.default_ttl, 30)
+        cache.close()
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(disk_cache_from_env())
+
+
+if __name__ == "__main__":
+    unittest.main()
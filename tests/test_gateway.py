@@ -0,0 +1,95 @@
+import http.client
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+import requests
+from api.gateway import GatewayServer, GlobalRateLimit, build_transport
+
+
+def make_response(payload, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+    response.content = json.dumps(payload).encode()
+    response.url = "https://shop.example.com/api/orders/"
+    return response
+
+
+class TestGateway(unittest.TestCase):
+
+    def setUp(self):
+        self.server = GatewayServer(
+            ("127.0.0.1", 0), "https://shop.example.com/", build_transport(ttl=60)
+        )
+        self.server.serve_in_thread()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def call(self, method, path, body=None, authorization="Basic a"):
+        connection = http.client.HTTPConnection(*self.server.server_address)
+        headers = {"Authorization": authorization}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        connection.request(method, path, body=body, headers=headers)
+        response = connection.getresponse()
+        result = response.status, dict(response.getheaders()), response.read()
+        connection.close()
+        return result
+
+    def test_gets_are_shared_across_sessions(self):
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value = make_response({"orders": [1]})
+            for _ in range(3):
+                status, headers, body = self.call("GET", "/api/orders/?page=1")
+                self.assertEqual(status, 200)
+                self.assertEqual(json.loads(body), {"orders": [1]})
+                self.assertNotIn("Content-Encoding", headers)
+            self.assertEqual(mock_request.call_count, 1)
+            method, url = mock_request.call_args.args
+            self.assertEqual(url, "https://shop.example.com/api/orders/")
+            self.assertEqual(mock_request.call_args.kwargs["params"], {"page": ["1"]})
+
+            # Another account gets its own entry
+            self.call("GET", "/api/orders/?page=1", authorization="Basic b")
+            self.assertEqual(mock_request.call_count, 2)
+
+    def test_writes_pass_through_and_invalidate(self):
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value = make_response({"orders": []})
+            self.call("GET", "/api/orders/")
+            mock_request.return_value = make_response({"order_id": 5}, status_code=201)
+            status, _, body = self.call("POST", "/api/orders/", body=b'{"status": "P"}')
+            self.assertEqual(status, 201)
+            self.assertEqual(mock_request.call_args.kwargs["data"], b'{"status": "P"}')
+            mock_request.return_value = make_response({"orders": [5]})
+            _, _, body = self.call("GET", "/api/orders/")
+            self.assertEqual(json.loads(body), {"orders": [5]})
+
+    def test_upstream_failure_is_a_bad_gateway(self):
+        with patch("requests.Session.request") as mock_request:
+            mock_request.side_effect = requests.exceptions.InvalidURL("bad")
+            status, _, body = self.call("GET", "/api/orders/1")
+        self.assertEqual(status, 502)
+        self.assertIn("Error", json.loads(body))
+
+    def test_stats(self):
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value = make_response({})
+            self.call("GET", "/api/orders/")
+            self.call("GET", "/api/orders/")
+        status, _, body = self.call("GET", "/_gateway/stats")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["cache"]["/api/orders/"]["hits"], 1)
+
+
+class TestGlobalRateLimit(unittest.TestCase):
+
+    def test_all_credentials_share_one_bucket(self):
+        limits = GlobalRateLimit(rate=5)
+        self.assertIs(limits.limiter_for("a"), limits.limiter_for("b"))
+
+
+if __name__ == "__main__":
+    unittest.main()
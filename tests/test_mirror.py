@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from api.mirror import OrdersMirror
+from api.orders import OrdersService
+from api.transport import HTTPTransport
+
+
+def order(order_id, timestamp, status="P", total="10.00", updated_at=None):
+    return {
+        "order_id": str(order_id),
+        "status": status,
+        "timestamp": str(timestamp),
+        "updated_at": str(updated_at or timestamp),
+        "total": total,
+        "email": f"buyer{order_id}@example.com",
+    }
+
+
+class FakeStore:
+    # Answers orders list requests, honouring sorting by update time
+
+    def __init__(self, orders):
+        self.orders = orders
+        self.requests = []
+
+    def __call__(self, method, url, params=None, **kwargs):
+        self.requests.append(dict(params))
+        orders = list(self.orders)
+        if params.get("sort_by") == "updated":
+            orders.sort(key=lambda o: int(o["updated_at"]), reverse=True)
+        start = (params["page"] - 1) * params["items_per_page"]
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {
+            "orders": orders[start : start + params["items_per_page"]],
+            "params": {"total_items": str(len(orders))},
+        }
+        return response
+
+
+class TestOrdersMirror(unittest.TestCase):
+
+    def setUp(self):
+        self.service = OrdersService("test@example.com", "key", transport=HTTPTransport())
+        self.store = FakeStore([order(1, 1000), order(2, 2000), order(3, 3000)])
+        self.mirror = OrdersMirror(self.service, batch_size=2, overlap=0, items_per_page=2)
+
+    def tearDown(self):
+        self.mirror.close()
+
+    def test_first_sync_pulls_everything(self):
+        with patch("requests.Session.request", side_effect=self.store):
+            result = self.mirror.sync()
+        self.assertEqual(result, {"upserted": 3, "cursor": 3000})
+        self.assertNotIn("sort_by", self.store.requests[0])
+        self.assertEqual(self.mirror.count(), 3)
+        self.assertEqual(self.mirror.cursor(), 3000)
+        self.assertEqual(self.mirror.get(2)["email"], "buyer2@example.com")
+
+    def test_incremental_sync_only_pulls_changes(self):
+        with patch("requests.Session.request", side_effect=self.store):
+            self.mirror.sync()
+            self.store.orders.append(order(4, 4000))
+            result = self.mirror.sync()
+        self.assertEqual(self.store.requests[-1]["sort_by"], "updated")
+        self.assertEqual(self.store.requests[-1]["sort_order"], "desc")
+        # Stops at the first order updated before the cursor
+        self.assertEqual(result, {"upserted": 2, "cursor": 4000})
+        self.assertEqual(self.mirror.count(), 4)
+
+    def test_incremental_sync_pulls_status_changes(self):
+        with patch("requests.Session.request", side_effect=self.store):
+            self.mirror.sync()
+            # An old order is completed long after it was placed
+            self.store.orders[0] = order(1, 1000, status="C", updated_at=5000)
+            result = self.mirror.sync()
+        self.assertEqual(result, {"upserted": 2, "cursor": 5000})
+        self.assertEqual(self.mirror.get(1)["status"], "C")
+
+    def test_failed_sync_keeps_cursor(self):
+        with patch("requests.Session.request", side_effect=self.store):
+            self.mirror.sync()
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value.status_code = 400
+            mock_request.return_value.text = "Bad Request"
+            with self.assertRaises(ConnectionError):
+                self.mirror.sync()
+        self.assertEqual(self.mirror.cursor(), 3000)
+
+    def test_queries(self):
+        with patch("requests.Session.request", side_effect=self.store):
+            self.mirror.sync()
+        newest = self.mirror.orders(limit=2)
+        self.assertEqual([o["order_id"] for o in newest], ["3", "2"])
+        self.assertEqual(self.mirror.count(status="P"), 3)
+        with self.assertRaises(ValueError):
+            self.mirror.orders(sort_by="data; DROP TABLE orders")
+
+    def test_table_page(self):
+        with patch("requests.Session.request", side_effect=self.store):
+            self.mirror.sync()
+        page = self.mirror.table_page(page=2, items_per_page=2, descending=False)
+        self.assertEqual([o["order_id"] for o in page.records], ["3"])
+        self.assertEqual((page.total, page.page_count, page.has_next), (3, 2, False))
+        with self.assertRaises(ValueError):
+            self.mirror.table_page(page=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
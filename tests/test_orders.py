@@ -13,7 +13,7 @@ class TestOrdersService(unittest.TestCase):
 
     def test_get_orders(self):
         response_data = [{"order_id": 1, "status": "pending"}, {"order_id": 2, "status": "completed"}]
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.request") as mock_get:
             mock_get.return_value.json.return_value = response_data
             orders = self.orders_service.get_orders()
             self.assertIsInstance(orders, list)
@@ -25,7 +25,7 @@ class TestOrdersService(unittest.TestCase):
     def test_get_order(self):
         order_id = 1
         response_data = {"order_id": order_id, "status": "pending", "total_price": 10.99}
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.request") as mock_get:
             url = self.orders_service.url + str(order_id)
             mock_get.return_value.json.return_value = response_data
             order = self.orders_service.get_order(order_id=order_id)
@@ -38,7 +38,7 @@ class TestOrdersService(unittest.TestCase):
     def test_create_order(self):
         new_order = {"item": "product", "quantity": 2, "price": 15.99}
         response_data = {"order_id": 3, "status": "created"}
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.request") as mock_post:
             mock_post.return_value.json.return_value = response_data
             order = self.orders_service.create_order(new_order)
             self.assertIsInstance(order, dict)
@@ -51,7 +51,7 @@ class TestOrdersService(unittest.TestCase):
     def test_update_order(self):
         order_id = 1
         new_order = {"status": "processing"}
-        with patch("requests.put") as mock_put:
+        with patch("requests.Session.request") as mock_put:
             url = self.orders_service.url + str(order_id)
             mock_put.return_value.json.return_value = {"status": "processing"}
             self.orders_service.update_order(order_id=order_id, order_data=new_order)
@@ -62,12 +62,14 @@ class TestOrdersService(unittest.TestCase):
     # TODO: Fix Return Type
     def test_delete_order(self):
         order_id = 1
-        with patch("requests.delete") as mock_delete:
+        with patch("requests.Session.request") as mock_delete:
             url = self.orders_service.url + str(order_id)
             mock_delete.return_value.status_code = 204
+            mock_delete.return_value.content = b""
+            mock_delete.return_value.headers = {}
             result = self.orders_service.delete_order(order_id=order_id)
-            print(result)
             self.assertEqual(result, None)
+            self.assertEqual(mock_delete.call_args.args[:2], ("DELETE", url))
 
 
 if __name__ == "__main__":
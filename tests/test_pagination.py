@@ -0,0 +1,281 @@
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+from api.pagination import (
+    iter_pages,
+    aiter_pages,
+    fetch_all_pages,
+    afetch_all_pages,
+    count_items,
+    forget_counts,
+    fetch_table_page,
+    afetch_table_page,
+    table_params,
+)
+from api.orders import OrdersService, AsyncOrdersService
+from api.users import UserService
+from api.transport import AsyncHTTPTransport, HTTPTransport
+
+
+def fake_pages(total, items_key="orders"):
+    requested = []
+
+    def fetch_page(params):
+        requested.append(dict(params))
+        start = (params["page"] - 1) * params["items_per_page"]
+        stop = min(start + params["items_per_page"], total)
+        return {
+            items_key: [{"order_id": i} for i in range(start, stop)],
+            "params": {"page": params["page"], "total_items": str(total)},
+        }
+
+    return fetch_page, requested
+
+
+class TestIterPages(unittest.TestCase):
+
+    def test_walks_every_page(self):
+        fetch_page, requested = fake_pages(25)
+        orders = list(iter_pages(fetch_page, "orders", items_per_page=10))
+        self.assertEqual([o["order_id"] for o in orders], list(range(25)))
+        self.assertEqual([p["page"] for p in requested], [1, 2, 3])
+
+    def test_is_lazy(self):
+        fetch_page, requested = fake_pages(25)
+        orders = iter_pages(fetch_page, "orders", items_per_page=10)
+        next(orders)
+        self.assertEqual(len(requested), 1)
+
+    def test_keeps_filters(self):
+        fetch_page, requested = fake_pages(5)
+        list(iter_pages(fetch_page, "orders", {"status": "P"}, items_per_page=10))
+        self.assertEqual(requested[0]["status"], "P")
+
+    def test_without_total_stops_on_short_page(self):
+        pages = [{"orders": [{"order_id": 1}, {"order_id": 2}]}, {"orders": [{"order_id": 3}]}]
+        fetch_page = MagicMock(side_effect=pages)
+        orders = list(iter_pages(fetch_page, "orders", items_per_page=2))
+        self.assertEqual(len(orders), 3)
+        self.assertEqual(fetch_page.call_count, 2)
+
+    def test_error_raises(self):
+        fetch_page = MagicMock(return_value={"Error": "502 Server Error"})
+        with self.assertRaises(ConnectionError):
+            list(iter_pages(fetch_page, "orders"))
+
+    def test_iter_orders(self):
+        orders_service = OrdersService("test@example.com", "key")
+        fetch_page, _ = fake_pages(3)
+        with patch("requests.Session.request") as mock_get:
+            mock_get.return_value.json.side_effect = lambda: fetch_page(
+                mock_get.call_args.kwargs["params"]
+            )
+            orders = list(orders_service.iter_orders(items_per_page=2))
+            self.assertEqual(len(orders), 3)
+            self.assertEqual(mock_get.call_count, 2)
+
+
+class TestFetchAllPages(unittest.TestCase):
+
+    def test_reassembles_in_order(self):
+        fetch_page, requested = fake_pages(95)
+
+        def slow_first_pages(params):
+            # Earlier pages answer last so out-of-order completion is exercised
+            time.sleep(0.01 * (10 - params["page"]))
+            return fetch_page(params)
+
+        result = fetch_all_pages(slow_first_pages, "orders", items_per_page=10, concurrency=5)
+        self.assertEqual([o["order_id"] for o in result["orders"]], list(range(95)))
+        self.assertEqual(len(requested), 10)
+
+    def test_respects_concurrency(self):
+        fetch_page, _ = fake_pages(100)
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def tracked(params):
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+            return fetch_page(params)
+
+        fetch_all_pages(tracked, "orders", items_per_page=5, concurrency=3)
+        self.assertLessEqual(max(peak), 3)
+
+    def test_page_error_raises(self):
+        fetch_page, _ = fake_pages(30)
+
+        def failing(params):
+            if params["page"] == 2:
+                return {"Error": "502 Server Error"}
+            return fetch_page(params)
+
+        with self.assertRaises(ConnectionError):
+            fetch_all_pages(failing, "orders", items_per_page=10)
+
+    def test_fetch_all_orders(self):
+        orders_service = OrdersService("test@example.com", "key")
+        fetch_page, _ = fake_pages(7)
+        with patch.object(orders_service, "get_orders", side_effect=fetch_page):
+            result = orders_service.fetch_all_orders(items_per_page=2, concurrency=2)
+            self.assertEqual(len(result["orders"]), 7)
+
+
+class TestAsyncIterPages(unittest.IsolatedAsyncioTestCase):
+
+    async def test_walks_every_page(self):
+        fetch_page, _ = fake_pages(7)
+        orders = [o async for o in aiter_pages(AsyncMock(side_effect=fetch_page), "orders", items_per_page=3)]
+        self.assertEqual(len(orders), 7)
+
+    async def test_afetch_all_pages(self):
+        fetch_page, _ = fake_pages(23)
+        result = await afetch_all_pages(
+            AsyncMock(side_effect=fetch_page), "orders", items_per_page=5, concurrency=2
+        )
+        self.assertEqual([o["order_id"] for o in result["orders"]], list(range(23)))
+
+    async def test_async_iter_orders(self):
+        transport = AsyncHTTPTransport()
+        orders_service = AsyncOrdersService("test@example.com", "key", transport=transport)
+        fetch_page, _ = fake_pages(4)
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+            def respond(*args, **kwargs):
+                response = MagicMock()
+                response.json.return_value = fetch_page(kwargs["params"])
+                return response
+
+            mock_request.side_effect = respond
+            orders = [o async for o in orders_service.iter_orders(items_per_page=3)]
+            self.assertEqual(len(orders), 4)
+        await transport.aclose()
+
+
+class TestCountItems(unittest.TestCase):
+
+    def tearDown(self):
+        forget_counts()
+
+    def test_requests_a_single_record(self):
+        fetch_page, requested = fake_pages(250)
+        self.assertEqual(count_items(fetch_page, "orders", {"status": "P"}), 250)
+        self.assertEqual(requested, [{"status": "P", "page": 1, "items_per_page": 1}])
+
+    def test_counts_are_remembered_for_max_age(self):
+        fetch_page, requested = fake_pages(3)
+        for _ in range(3):
+            self.assertEqual(count_items(fetch_page, "orders", max_age=60, cache_key="a"), 3)
+        self.assertEqual(len(requested), 1)
+        count_items(fetch_page, "orders", {"status": "C"}, max_age=60, cache_key="a")
+        self.assertEqual(len(requested), 2)
+        forget_counts("a")
+        count_items(fetch_page, "orders", max_age=60, cache_key="a")
+        self.assertEqual(len(requested), 3)
+
+    def test_missing_total(self):
+        self.assertEqual(count_items(lambda params: {"orders": []}, "orders"), 0)
+        self.assertIsNone(count_items(lambda params: {"orders": [{}]}, "orders"))
+        with self.assertRaises(ConnectionError):
+            count_items(lambda params: {"Error": "401 Unauthorized"}, "orders")
+
+    def test_count_users(self):
+        user_service = UserService("admin@example.com", "key", transport=HTTPTransport())
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value.status_code = 200
+            mock_request.return_value.json.return_value = {
+                "users": [{"user_id": "1"}],
+                "params": {"total_items": "123"},
+            }
+            self.assertEqual(user_service.count_users("V"), 123)
+        params = mock_request.call_args.kwargs["params"]
+        self.assertEqual(params, {"page": 1, "items_per_page": 1, "user_type": "V"})
+
+
+class TestTablePage(unittest.TestCase):
+
+    def test_fetches_only_the_visible_page(self):
+        fetch_page, requested = fake_pages(10_000)
+        page = fetch_table_page(
+            fetch_page, "orders", page=3, items_per_page=25, sort_by="total"
+        )
+        self.assertEqual(len(requested), 1)
+        self.assertEqual(
+            requested[0],
+            {"page": 3, "items_per_page": 25, "sort_by": "total", "sort_order": "asc"},
+        )
+        self.assertEqual(page.records[0], {"order_id": 50})
+        self.assertEqual((page.total, page.page_count, page.has_next), (10_000, 400, True))
+
+    def test_filters_drop_empty_values(self):
+        params = table_params(filters={"q": "", "status": "A", "email": None})
+        self.assertEqual(params, {"status": "A", "page": 1, "items_per_page": 100})
+        params = table_params(sort_by="price", descending=True)
+        self.assertEqual(params["sort_order"], "desc")
+        with self.assertRaises(ValueError):
+            table_params(page=0)
+
+    def test_missing_total(self):
+        page = fetch_table_page(lambda params: {"orders": [{}, {}]}, "orders", 1, 2)
+        self.assertIsNone(page.page_count)
+        self.assertTrue(page.has_next)
+        with self.assertRaises(ConnectionError):
+            fetch_table_page(lambda params: {"Error": "401 Unauthorized"}, "orders")
+
+    def test_get_users_passes_sorting(self):
+        user_service = UserService("admin@example.com", "key", transport=HTTPTransport())
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value.status_code = 200
+            mock_request.return_value.json.return_value = {
+                "users": [{"user_id": "1"}],
+                "params": {"total_items": "1"},
+            }
+            page = fetch_table_page(
+                lambda params: user_service.get_users(
+                    params["page"], params["items_per_page"], "V", params
+                ),
+                "users",
+                sort_by="name",
+            )
+        self.assertEqual(page.records, [{"user_id": "1"}])
+        params = mock_request.call_args.kwargs["params"]
+        self.assertEqual(params["sort_by"], "name")
+        self.assertEqual(params["user_type"], "V")
+
+
+class TestAsyncTablePage(unittest.IsolatedAsyncioTestCase):
+
+    async def test_fetches_one_page(self):
+        sync_fetch, requested = fake_pages(30)
+
+        async def fetch_page(params):
+            return sync_fetch(params)
+
+        page = await afetch_table_page(fetch_page, "orders", 2, 20)
+        self.assertEqual(len(page.records), 10)
+        self.assertFalse(page.has_next)
+        self.assertEqual(len(requested), 1)
+
+
+class TestAsyncCountItems(unittest.IsolatedAsyncioTestCase):
+
+    async def test_count_orders(self):
+        transport = AsyncHTTPTransport()
+        orders_service = AsyncOrdersService("test@example.com", "key", transport=transport)
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = MagicMock(status_code=200)
+            mock_request.return_value.json.return_value = {
+                "orders": [{"order_id": "1"}],
+                "params": {"total_items": "42"},
+            }
+            self.assertEqual(await orders_service.count_orders(), 42)
+        await transport.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+from api import encode_credentials
+from api.transport import (
+    AsyncHTTPTransport,
+    HTTPTransport,
+    RateLimiterRegistry,
+    TokenBucket,
+)
+from api.orders import AsyncOrdersService, OrdersService
+from api.products import ProductsService
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_then_paced(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+
+    def test_acquire_blocks(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_reserve_past_max_delay_takes_no_token(self):
+        bucket = TokenBucket(rate=1, capacity=1)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertIsNone(bucket.reserve(max_delay=0.1))
+        self.assertIsNone(bucket.acquire(timeout=0.1))
+        self.assertAlmostEqual(bucket.reserve(max_delay=2), 1, places=1)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRateLimiterRegistry(unittest.TestCase):
+
+    def test_same_credentials_share_a_bucket(self):
+        registry = RateLimiterRegistry()
+        registry.configure_user("vendor@example.com", "key", rate=5)
+        credentials = encode_credentials("vendor@example.com", "key")
+        self.assertIs(registry.limiter_for(credentials), registry.limiter_for(credentials))
+
+    def test_unconfigured_credentials_are_not_limited(self):
+        registry = RateLimiterRegistry()
+        self.assertIsNone(registry.limiter_for("abc"))
+        self.assertIsNotNone(RateLimiterRegistry(default_rate=1).limiter_for("abc"))
+
+    def test_services_with_the_same_key_share_the_limit(self):
+        registry = RateLimiterRegistry()
+        registry.configure_user("vendor@example.com", "key", rate=50, capacity=1)
+        transport = HTTPTransport(rate_limits=registry)
+        orders = OrdersService("vendor@example.com", "key", transport=transport)
+        products = ProductsService("vendor@example.com", "key", transport=HTTPTransport(rate_limits=registry))
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value.json.return_value = {}
+            orders.get_orders()
+            products.get_products()
+            orders.get_orders()
+        bucket = registry.limiter_for(encode_credentials("vendor@example.com", "key"))
+        # Three requests drew from one bucket of capacity 1
+        self.assertLess(bucket._tokens, 0)
+        self.assertEqual(transport.metrics.snapshot()["GET"]["throttled"], 1)
+
+
+class TestAsyncRateLimit(unittest.IsolatedAsyncioTestCase):
+
+    async def test_async_callers_wait(self):
+        registry = RateLimiterRegistry()
+        registry.configure_user("vendor@example.com", "key", rate=100, capacity=1)
+        transport = AsyncHTTPTransport(rate_limits=registry)
+        orders = AsyncOrdersService("vendor@example.com", "key", transport=transport)
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = MagicMock()
+            start = time.monotonic()
+            await asyncio.gather(*(orders.get_order(i) for i in range(6)))
+            self.assertGreaterEqual(time.monotonic() - start, 0.04)
+        await transport.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import sys
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+from api.records import Order, OrderItem, Product, Shipment, User
+from api.orders import OrdersService
+from api.products import ProductsService
+from api.shipments import AsyncShipmentService, ShipmentService
+from api.transport import AsyncHTTPTransport, HTTPTransport
+
+
+ORDER = {
+    "order_id": "101",
+    "user_id": "7",
+    "company_id": "1",
+    "company": "Simtech",
+    "status": "P",
+    "timestamp": "1700000000",
+    "total": "25.50",
+    "email": "buyer@example.com",
+    "products": {
+        "9": {"item_id": "9", "product_id": "12", "product": "Mug", "price": "12.75", "amount": "2"}
+    },
+    "notes": "Leave at the door",
+}
+
+
+class TestRecords(unittest.TestCase):
+
+    def test_fields_are_typed(self):
+        order = Order.from_dict(ORDER)
+        self.assertEqual(order.order_id, 101)
+        self.assertEqual(order.total, 25.5)
+        self.assertEqual(order.timestamp, 1700000000)
+        self.assertIsNone(order.subtotal)
+        self.assertEqual(order.products, (OrderItem.from_dict(ORDER["products"]["9"]),))
+        self.assertEqual(order.products[0].price, 12.75)
+
+    def test_unknown_fields_are_kept(self):
+        order = Order.from_dict(ORDER)
+        self.assertEqual(order.extra, {"notes": "Leave at the door"})
+        self.assertEqual(order.to_dict()["notes"], "Leave at the door")
+        self.assertIsNone(Shipment.from_dict({"shipment_id": "1"}).extra)
+
+    def test_records_have_no_instance_dict(self):
+        product = Product.from_dict({"product_id": "1", "price": "9.99"})
+        self.assertFalse(hasattr(product, "__dict__"))
+        with self.assertRaises(AttributeError):
+            product.unknown = 1
+
+    def test_repeated_strings_are_interned(self):
+        first = User.from_dict({"user_id": "1", "status": "".join(["A"]), "company": "".join(["Sim", "tech"])})
+        second = User.from_dict({"user_id": "2", "status": "".join(["A"]), "company": "".join(["Sim", "tech"])})
+        self.assertIs(first.company, second.company)
+        self.assertIs(first.company, sys.intern("Simtech"))
+
+    def test_empty_and_invalid_values(self):
+        product = Product.from_dict({"product_id": "", "price": "n/a", "amount": "3.0"})
+        self.assertIsNone(product.product_id)
+        self.assertIsNone(product.price)
+        self.assertEqual(product.amount, 3)
+
+
+class TestServiceRecords(unittest.TestCase):
+
+    def test_iter_orders_returns_records(self):
+        orders_service = OrdersService("test@example.com", "key", transport=HTTPTransport())
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value.json.return_value = {
+                "orders": [ORDER],
+                "params": {"total_items": "1"},
+            }
+            orders = list(orders_service.iter_orders(records=True))
+        self.assertEqual([order.order_id for order in orders], [101])
+
+    def test_fetch_all_products_returns_records(self):
+        products_service = ProductsService("test@example.com", "key", transport=HTTPTransport())
+
+        def page(method, url, params=None, **kwargs):
+            response = MagicMock()
+            response.json.return_value = {
+                "products": [{"product_id": str(params["page"]), "price": "1.5"}],
+                "params": {"total_items": "3"},
+            }
+            return response
+
+        with patch("requests.Session.request", side_effect=page):
+            result = products_service.fetch_all_products(items_per_page=1, records=True)
+        self.assertEqual([p.product_id for p in result["products"]], [1, 2, 3])
+        self.assertIsInstance(result["products"][0], Product)
+
+    def test_iter_shipments_returns_records(self):
+        shipment_service = ShipmentService("test@example.com", "key", transport=HTTPTransport())
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value.json.return_value = {
+                "shipments": [{"shipment_id": "5", "order_id": "101", "carrier": "ups"}],
+                "params": {"total_items": "1"},
+            }
+            shipments = list(shipment_service.iter_shipments({"order_id": 101}, records=True))
+        self.assertIsInstance(shipments[0], Shipment)
+        self.assertEqual((shipments[0].shipment_id, shipments[0].order_id), (5, 101))
+        self.assertEqual(mock_request.call_args.kwargs["params"]["order_id"], 101)
+
+
+class TestAsyncServiceRecords(unittest.IsolatedAsyncioTestCase):
+
+    async def test_iter_shipments_returns_records(self):
+        transport = AsyncHTTPTransport()
+        shipment_service = AsyncShipmentService("test@example.com", "key", transport=transport)
+        response = MagicMock()
+        response.json.return_value = {
+            "shipments": [{"shipment_id": "5"}, {"shipment_id": "6"}],
+            "params": {"total_items": "2"},
+        }
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = response
+            shipments = [s async for s in shipment_service.iter_shipments(records=True)]
+        self.assertEqual([s.shipment_id for s in shipments], [5, 6])
+        await transport.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import time
+import unittest
+from api.dashboard import RefreshWorker, SnapshotStore
+from api.transport import TokenBucket
+
+
+class TestSnapshotStore(unittest.TestCase):
+
+    def test_failed_refresh_keeps_last_data(self):
+        store = SnapshotStore()
+        store.record("orders", {"orders": [1]}, None, 0.1)
+        refreshed_at = store.get("orders").refreshed_at
+        store.record("orders", None, "timeout", 5.0)
+
+        snapshot = store.get("orders")
+        self.assertEqual(snapshot.data, {"orders": [1]})
+        self.assertEqual(snapshot.refreshed_at, refreshed_at)
+        self.assertEqual(snapshot.error, "timeout")
+        self.assertFalse(snapshot.ok)
+
+    def test_first_failure_has_no_data(self):
+        store = SnapshotStore()
+        store.record("orders", None, "401", 0.1)
+        snapshot = store.get("orders")
+        self.assertIsNone(snapshot.data)
+        self.assertIsNone(snapshot.age())
+
+    def test_age(self):
+        store = SnapshotStore()
+        store.record("orders", [], None, 0.1)
+        snapshot = store.get("orders")
+        self.assertAlmostEqual(snapshot.age(snapshot.refreshed_at + 30), 30)
+
+    def test_wait_times_out(self):
+        self.assertIsNone(SnapshotStore().wait("orders", timeout=0.05))
+
+
+class TestRefreshWorker(unittest.TestCase):
+
+    def test_run_pending_refreshes_due_datasets(self):
+        worker = RefreshWorker()
+        worker.add("orders", lambda: {"orders": [1]}, interval=60)
+        worker.add("products", lambda: {"products": []}, interval=30)
+
+        delay = worker.run_pending()
+        self.assertEqual(worker.store.get("orders").data, {"orders": [1]})
+        self.assertEqual(worker.store.get("products").data, {"products": []})
+        self.assertAlmostEqual(delay, 30, delta=1)
+
+        # Nothing is due again yet
+        calls = []
+        worker.add("shipments", lambda: calls.append(1), interval=60)
+        worker.run_pending()
+        worker.run_pending()
+        self.assertEqual(calls, [1])
+
+    def test_failures_back_off_and_success_resets(self):
+        results = [{"Error": "503"}, {"Error": "503"}, {"orders": []}]
+        worker = RefreshWorker(max_backoff=1000)
+        worker.add("orders", lambda: results.pop(0), interval=10)
+        job = worker._jobs["orders"]
+
+        self.assertAlmostEqual(worker.run_pending(), 20, delta=1)
+        self.assertEqual(worker.store.get("orders").error, "503")
+        job.due = 0
+        self.assertAlmostEqual(worker.run_pending(), 40, delta=1)
+        job.due = 0
+        self.assertAlmostEqual(worker.run_pending(), 10, delta=1)
+        self.assertTrue(worker.store.get("orders").ok)
+
+    def test_slow_refreshes_back_off(self):
+        def slow():
+            time.sleep(0.05)
+            return []
+
+        worker = RefreshWorker(slow_threshold=0.01, max_backoff=15)
+        worker.add("orders", slow, interval=10)
+        # Capped at max_backoff
+        self.assertAlmostEqual(worker.run_pending(), 15, delta=1)
+        self.assertTrue(worker.store.get("orders").ok)
+
+    def test_exceptions_are_recorded(self):
+        def broken():
+            raise ConnectionError("reset")
+
+        worker = RefreshWorker()
+        worker.add("orders", broken, interval=10)
+        worker.run_pending()
+        self.assertEqual(worker.store.get("orders").error, "reset")
+
+    def test_rate_paces_refreshes(self):
+        worker = RefreshWorker(rate=TokenBucket(20, capacity=1))
+        for name in ("orders", "products", "shipments"):
+            worker.add(name, list, interval=60)
+        start = time.monotonic()
+        worker.run_pending()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_thread_refreshes_and_refresh_now(self):
+        calls = []
+        worker = RefreshWorker()
+        worker.add("orders", lambda: calls.append(1) or len(calls), interval=60)
+        worker.start()
+        try:
+            self.assertEqual(worker.store.wait("orders", timeout=2).data, 1)
+            worker.refresh_now("orders")
+            deadline = time.monotonic() + 2
+            while worker.store.get("orders").data != 2:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+        finally:
+            worker.stop(timeout=2)
+        self.assertFalse(worker.running)
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            RefreshWorker().add("orders", list, interval=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
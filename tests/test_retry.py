@@ -0,0 +1,104 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+import requests
+from api.transport import AsyncHTTPTransport, HTTPTransport, RetryPolicy
+from api.orders import AsyncOrdersService, OrdersService
+
+
+def make_response(status_code, payload=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = payload or {}
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_idempotent_methods_are_retried_by_default(self):
+        policy = RetryPolicy()
+        self.assertEqual(policy.retries_for("GET"), 3)
+        self.assertEqual(policy.retries_for("PUT"), 3)
+        self.assertEqual(policy.retries_for("DELETE"), 3)
+        self.assertEqual(policy.retries_for("POST"), 0)
+
+    def test_per_method_override(self):
+        policy = RetryPolicy(method_retries={"post": 2, "GET": 5})
+        self.assertEqual(policy.retries_for("POST"), 2)
+        self.assertEqual(policy.retries_for("GET"), 5)
+
+    def test_exponential_backoff_without_jitter(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+        self.assertEqual([policy.backoff(n) for n in range(4)], [1, 2, 4, 5])
+
+    def test_jitter_stays_below_backoff(self):
+        policy = RetryPolicy(backoff_factor=1)
+        for _ in range(20):
+            self.assertLessEqual(policy.backoff(2), 4)
+
+    def test_retry_after_seconds(self):
+        policy = RetryPolicy()
+        response = make_response(429, headers={"Retry-After": "7"})
+        self.assertEqual(policy.backoff(0, response), 7)
+
+    def test_retry_after_http_date_in_the_past(self):
+        policy = RetryPolicy()
+        response = make_response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        self.assertEqual(policy.backoff(0, response), 0)
+
+
+class TestTransportRetries(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = HTTPTransport(retry=RetryPolicy(backoff_factor=0))
+        self.orders_service = OrdersService("test@example.com", "key", transport=self.transport)
+
+    def test_transient_502_is_retried(self):
+        with patch("requests.Session.request") as mock_request:
+            mock_request.side_effect = [make_response(502), make_response(200, {"orders": []})]
+            self.assertEqual(self.orders_service.get_orders(), {"orders": []})
+            self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(self.transport.metrics.snapshot()["GET"]["retries"], 1)
+
+    def test_connection_error_is_retried(self):
+        with patch("requests.Session.request") as mock_request:
+            mock_request.side_effect = [
+                requests.exceptions.ConnectionError("reset"),
+                make_response(200, {"order_id": 1}),
+            ]
+            self.assertEqual(self.orders_service.get_order(1), {"order_id": 1})
+
+    def test_post_is_not_retried(self):
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value = make_response(502)
+            mock_request.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError("502")
+            result = self.orders_service.create_order({"product": 1})
+            self.assertIn("Error", result)
+            self.assertEqual(mock_request.call_count, 1)
+
+    def test_gives_up_after_max_retries(self):
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value = make_response(503)
+            self.transport.get("https://shop.example.com/api/orders/")
+            self.assertEqual(mock_request.call_count, 4)
+        metrics = self.transport.metrics.snapshot()["GET"]
+        self.assertEqual(metrics, {"requests": 4, "retries": 3, "failures": 1})
+
+
+class TestAsyncTransportRetries(unittest.IsolatedAsyncioTestCase):
+
+    async def test_429_is_retried(self):
+        transport = AsyncHTTPTransport(retry=RetryPolicy(backoff_factor=0))
+        orders_service = AsyncOrdersService("test@example.com", "key", transport=transport)
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = [
+                make_response(429, headers={"Retry-After": "0"}),
+                make_response(200, {"orders": []}),
+            ]
+            self.assertEqual(await orders_service.get_orders(), {"orders": []})
+        self.assertEqual(transport.metrics.snapshot()["GET"]["retries"], 1)
+        await transport.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
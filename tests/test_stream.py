@@ -0,0 +1,111 @@
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+from api.codec import ArrayItemParser, iter_array_items
+from api.orders import AsyncOrdersService, OrdersService
+from api.products import ProductsService
+from api.transport import AsyncHTTPTransport, HTTPTransport
+
+
+def chunked(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+BODY = json.dumps(
+    {
+        "products": [
+            {"product_id": 1, "product": 'Quote " and \\ slash', "tags": ["a", "]"]},
+            {"product_id": 2, "product": "Brace } and comma ,", "price": 9.5},
+            3,
+            "plain",
+            None,
+        ],
+        "params": {"total_items": "5"},
+    }
+).encode()
+
+
+class TestArrayItemParser(unittest.TestCase):
+
+    def test_every_chunk_size_gives_the_same_records(self):
+        expected = json.loads(BODY)["products"]
+        for size in (1, 2, 3, 7, 64, len(BODY)):
+            self.assertEqual(list(iter_array_items(chunked(BODY, size), "products")), expected)
+
+    def test_records_keyed_by_id(self):
+        body = b'{"params": {"a": 1}, "products": {"12": {"product_id": 12}, "13": 5}}'
+        items = list(iter_array_items(chunked(body, 4), "products"))
+        self.assertEqual(items, [{"product_id": 12}, 5])
+
+    def test_key_nested_deeper_is_ignored(self):
+        body = b'{"params": {"products": [1]}, "products": [2], "x": "products"}'
+        self.assertEqual(list(iter_array_items([body], "products")), [2])
+
+    def test_empty_null_and_missing(self):
+        self.assertEqual(list(iter_array_items([b'{"orders": []}'], "orders")), [])
+        self.assertEqual(list(iter_array_items([b'{"orders": null}'], "orders")), [])
+        self.assertEqual(list(iter_array_items([b'{"users": [1]}'], "orders")), [])
+
+    def test_stops_reading_after_the_records(self):
+        chunks = iter([b'{"orders": [1, 2]', b', "params": {}}'])
+        self.assertEqual(list(iter_array_items(chunks, "orders")), [1, 2])
+        self.assertEqual(list(chunks), [b', "params": {}}'])
+
+    def test_truncated_body_raises(self):
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_array_items([b'{"orders": [{"order_id": 1}, {"ord'], "orders"))
+
+    def test_records_are_returned_as_they_complete(self):
+        parser = ArrayItemParser("orders")
+        self.assertEqual(parser.feed(b'{"orders": [{"order_id": 1}, {"order'), [{"order_id": 1}])
+        self.assertEqual(parser.feed(b'_id": 2}]}'), [{"order_id": 2}])
+        self.assertTrue(parser.done)
+
+
+class TestStreamingServices(unittest.TestCase):
+
+    def test_stream_products(self):
+        products_service = ProductsService("test@example.com", "key", transport=HTTPTransport())
+        with patch("requests.Session.request") as mock_request:
+            response = mock_request.return_value
+            response.status_code = 200
+            response.iter_content.return_value = iter(chunked(BODY, 16))
+            products = list(products_service.stream_products({"items_per_page": 5}))
+            self.assertTrue(mock_request.call_args.kwargs["stream"])
+            response.close.assert_called_once()
+        self.assertEqual(len(products), 5)
+        self.assertEqual(products[1]["price"], 9.5)
+
+    def test_error_status_raises(self):
+        orders_service = OrdersService("test@example.com", "key", transport=HTTPTransport())
+        with patch("requests.Session.request") as mock_request:
+            mock_request.return_value.status_code = 404
+            with self.assertRaises(ConnectionError):
+                list(orders_service.stream_orders())
+
+
+class TestAsyncStreaming(unittest.IsolatedAsyncioTestCase):
+
+    async def test_stream_orders(self):
+        transport = AsyncHTTPTransport()
+        orders_service = AsyncOrdersService("test@example.com", "key", transport=transport)
+
+        async def aiter_bytes(chunk_size):
+            for chunk in chunked(b'{"orders": [{"order_id": 1}, {"order_id": 2}]}', 5):
+                yield chunk
+
+        response = MagicMock()
+        response.status_code = 200
+        response.aiter_bytes = aiter_bytes
+        response.aclose = AsyncMock()
+        with patch("httpx.AsyncClient.send", new_callable=AsyncMock) as mock_send:
+            mock_send.return_value = response
+            orders = [order async for order in orders_service.stream_orders()]
+            self.assertTrue(mock_send.call_args.kwargs["stream"])
+        self.assertEqual(orders, [{"order_id": 1}, {"order_id": 2}])
+        response.aclose.assert_awaited_once()
+        await transport.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
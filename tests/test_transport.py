@@ -0,0 +1,42 @@
+import unittest
+from unittest.mock import patch
+from api.transport import HTTPTransport, get_default_transport
+from api.orders import OrdersService
+from api.products import ProductsService
+
+
+class TestHTTPTransport(unittest.TestCase):
+
+    def test_pool_size_is_applied_to_adapters(self):
+        transport = HTTPTransport(pool_connections=2, pool_maxsize=25)
+        adapter = transport.session.get_adapter("https://shop.example.com")
+        self.assertEqual(adapter._pool_maxsize, 25)
+        self.assertEqual(adapter._pool_connections, 2)
+
+    def test_invalid_pool_size(self):
+        with self.assertRaises(ValueError):
+            HTTPTransport(pool_maxsize=0)
+
+    def test_default_timeout_is_sent(self):
+        transport = HTTPTransport(timeout=(1.0, 2.0))
+        with patch("requests.Session.request") as mock_request:
+            transport.get("https://shop.example.com/api/orders/")
+            self.assertEqual(mock_request.call_args.kwargs["timeout"], (1.0, 2.0))
+
+    def test_services_share_default_transport(self):
+        orders = OrdersService("test@example.com", "key")
+        products = ProductsService("test@example.com", "key")
+        self.assertIs(orders.transport, get_default_transport())
+        self.assertIs(orders.transport, products.transport)
+
+    def test_service_uses_injected_transport(self):
+        transport = HTTPTransport()
+        orders = OrdersService("test@example.com", "key", transport=transport)
+        with patch.object(transport.session, "request") as mock_request:
+            mock_request.return_value.json.return_value = {"orders": []}
+            self.assertEqual(orders.get_orders(), {"orders": []})
+            self.assertEqual(mock_request.call_args.args[0], "GET")
+
+
+if __name__ == "__main__":
+    unittest.main()